@@ -0,0 +1,47 @@
+"""Run the parse path and client method benchmarks and check them against a baseline.
+
+    python -m benchmarks --save baseline.json          # record a baseline
+    python -m benchmarks --compare baseline.json       # exit with status 1 on a regression
+
+The response sizes, latency and 429 rate of the mock server are set with the same options as
+``python -m benchmarks.client_methods``.
+"""
+import argparse
+import sys
+
+from benchmarks import client_methods, parse_paths
+from benchmarks.common import compare, save
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    client_methods.add_arguments(parser)
+    parser.add_argument("--suite", choices=("all", "parse", "client"), default="all")
+    parser.add_argument("--save", metavar="PATH", help="write the results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="baseline JSON written by --save")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown of the minimum call time, as a fraction of the baseline")
+    arguments = parser.parse_args()
+
+    measurements = []
+    if arguments.suite in ("all", "parse"):
+        measurements += parse_paths.run(arguments.page_size, arguments.ohlcv_rows, arguments.repeat)
+    if arguments.suite in ("all", "client"):
+        api = client_methods.api_from_arguments(arguments)
+        measurements += client_methods.run(api, arguments.in_process, arguments.repeat, arguments.calls,
+                                           arguments.concurrency)
+    for measurement in measurements:
+        print(measurement.report())
+
+    if arguments.save:
+        save(measurements, arguments.save)
+    if arguments.compare:
+        regressions = compare(measurements, arguments.compare, arguments.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
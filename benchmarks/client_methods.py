@@ -0,0 +1,112 @@
+"""Time every client method end to end against the local mock GeckoTerminal server.
+
+The sync client is timed call by call, which gives the per-call latency; the async client runs
+``calls`` requests with ``concurrency`` in flight, which gives the throughput. By default requests go
+over HTTP to ``MockGeckoTerminalServer``; ``--in-process`` serves the same responses through
+``httpx.MockTransport`` to leave the socket overhead out.
+
+Run from the repository root with ``python -m benchmarks.client_methods --help`` for the options.
+"""
+import argparse
+import asyncio
+import contextlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from benchmarks.common import Measurement, measure, measure_concurrent
+from benchmarks.mock_server import MockGeckoTerminalServer, SyntheticApi, pool_addresses
+from geckoterminal_py import GeckoTerminalAsyncClient, GeckoTerminalSyncClient
+from geckoterminal_py.rate_limiter import RetryPolicy
+
+# (method, args, kwargs) of the timed call of every client method.
+CLIENT_CALLS: List[Tuple[str, tuple, Dict[str, Any]]] = [
+    ("get_networks", (), {}),
+    ("get_dexes_by_network", ("eth",), {}),
+    ("get_trending_pools", (), {}),
+    ("get_trending_pools_by_network", ("eth",), {}),
+    ("get_top_pools_by_network", ("eth",), {}),
+    ("get_top_pools_by_network_dex", ("eth", "uniswap_v2"), {}),
+    ("get_top_pools_by_network_token", ("eth", "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2"), {}),
+    ("get_new_pools_by_network", ("eth",), {}),
+    ("get_new_pools_all_networks", (), {}),
+    ("get_pool_by_network_address", ("eth", "0x60594a405d53811d3bc4766596efd80fd545a270"), {}),
+    ("get_multiple_pools_by_network", ("eth", pool_addresses(30)), {}),
+    ("get_specific_token_on_network", ("eth", "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2"), {}),
+    ("get_simple_token_price", ("eth", pool_addresses(30)), {"include_market_cap": True}),
+    ("get_ohlcv", ("eth", "0x60594a405d53811d3bc4766596efd80fd545a270", "1m"), {}),
+    ("get_trades", ("eth", "0x60594a405d53811d3bc4766596efd80fd545a270"), {}),
+]
+
+
+def _client_kwargs(api: SyntheticApi, server: Optional[MockGeckoTerminalServer], asynchronous: bool) -> Dict[str, Any]:
+    # Throttled requests are retried right away: the mock server answers them with ``Retry-After: 0``.
+    kwargs: Dict[str, Any] = {"retry_policy": RetryPolicy(max_retries=10, backoff_base=0)}
+    if server is None:
+        kwargs["transport"] = api.async_transport() if asynchronous else api.transport()
+    if asynchronous:
+        # Identical concurrent calls would otherwise share one request and inflate the throughput.
+        kwargs["coalesce_requests"] = False
+    return kwargs
+
+
+def run_sync(api: SyntheticApi, server: Optional[MockGeckoTerminalServer] = None,
+             repeat: int = 20) -> List[Measurement]:
+    measurements = []
+    with GeckoTerminalSyncClient(**_client_kwargs(api, server, asynchronous=False)) as client:
+        if server is not None:
+            client.base_url = server.base_url
+        for method, args, kwargs in CLIENT_CALLS:
+            function = getattr(client, method)
+            measurements.append(measure(f"sync: {method}", lambda: function(*args, **kwargs), repeat))
+    return measurements
+
+
+async def run_async(api: SyntheticApi, server: Optional[MockGeckoTerminalServer] = None, calls: int = 100,
+                    concurrency: int = 10) -> List[Measurement]:
+    measurements = []
+    async with GeckoTerminalAsyncClient(**_client_kwargs(api, server, asynchronous=True)) as client:
+        if server is not None:
+            client.base_url = server.base_url
+        for method, args, kwargs in CLIENT_CALLS:
+            function = getattr(client, method)
+            measurements.append(await measure_concurrent(
+                f"async x{concurrency}: {method}", lambda: function(*args, **kwargs), calls, concurrency))
+    return measurements
+
+
+def run(api: SyntheticApi, in_process: bool = False, repeat: int = 20, calls: int = 100,
+        concurrency: int = 10) -> List[Measurement]:
+    with contextlib.ExitStack() as stack:
+        server = None if in_process else stack.enter_context(MockGeckoTerminalServer(api))
+        measurements = run_sync(api, server, repeat)
+        measurements += asyncio.run(run_async(api, server, calls, concurrency))
+    return measurements
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--page-size", type=int, default=100, help="records per list response")
+    parser.add_argument("--ohlcv-rows", type=int, default=1000, help="candles per OHLCV response")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="share of requests answered with a 429")
+    parser.add_argument("--repeat", type=int, default=20, help="sequential calls per sync method")
+    parser.add_argument("--calls", type=int, default=100, help="calls per async method")
+    parser.add_argument("--concurrency", type=int, default=10, help="async calls in flight")
+    parser.add_argument("--in-process", action="store_true", help="serve through httpx.MockTransport")
+
+
+def api_from_arguments(arguments: argparse.Namespace) -> SyntheticApi:
+    return SyntheticApi(page_size=arguments.page_size, ohlcv_rows=arguments.ohlcv_rows, latency=arguments.latency,
+                        throttle_rate=arguments.throttle_rate)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    arguments = parser.parse_args()
+    api = api_from_arguments(arguments)
+    for measurement in run(api, arguments.in_process, arguments.repeat, arguments.calls, arguments.concurrency):
+        print(measurement.report())
+    print(f"  {api.requests} requests served, {api.throttled} throttled")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Timing helpers shared by the benchmark scripts.
+
+Every benchmark is reduced to a ``Measurement``: the per-call durations of one named case, from which
+the reported latency percentiles and throughput are derived. ``compare`` checks a run against a saved
+baseline so a regression fails the suite instead of scrolling past.
+"""
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List
+
+import numpy as np
+
+
+@dataclass
+class Measurement:
+    """Durations in seconds of the calls of one benchmark case.
+
+    ``elapsed`` is the wall time of the whole case; it is shorter than the sum of the samples when the
+    calls ran concurrently, which is what ``throughput`` reports.
+    """
+
+    name: str
+    samples: List[float] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        return len(self.samples) / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        samples = np.asarray(self.samples)
+        return {
+            "calls": len(samples),
+            "min": float(samples.min()),
+            "mean": float(samples.mean()),
+            "p50": float(np.percentile(samples, 50)),
+            "p99": float(np.percentile(samples, 99)),
+            "throughput": self.throughput,
+        }
+
+    def report(self) -> str:
+        stats = self.to_dict()
+        return (f"  {self.name:<48} min {stats['min'] * 1000:9.3f} ms  p50 {stats['p50'] * 1000:9.3f} ms  "
+                f"p99 {stats['p99'] * 1000:9.3f} ms  {stats['throughput']:10.1f} calls/s")
+
+
+def measure(name: str, function: Callable[[], Any], repeat: int = 20, warmup: int = 1) -> Measurement:
+    """Time ``repeat`` sequential calls of ``function``."""
+    for _ in range(warmup):
+        function()
+    measurement = Measurement(name)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        call_start = time.perf_counter()
+        function()
+        measurement.samples.append(time.perf_counter() - call_start)
+    measurement.elapsed = time.perf_counter() - start
+    return measurement
+
+
+async def measure_concurrent(name: str, function: Callable[[], Awaitable[Any]], calls: int = 100,
+                             concurrency: int = 10, warmup: int = 1) -> Measurement:
+    """Time ``calls`` awaits of ``function`` with at most ``concurrency`` of them in flight."""
+    for _ in range(warmup):
+        await function()
+    measurement = Measurement(name)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed_call():
+        async with semaphore:
+            call_start = time.perf_counter()
+            await function()
+            measurement.samples.append(time.perf_counter() - call_start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed_call() for _ in range(calls)))
+    measurement.elapsed = time.perf_counter() - start
+    return measurement
+
+
+def save(measurements: List[Measurement], path: str):
+    with open(path, "w") as file:
+        json.dump({measurement.name: measurement.to_dict() for measurement in measurements}, file, indent=2)
+
+
+def compare(measurements: List[Measurement], baseline_path: str, tolerance: float = 0.25,
+            statistic: str = "min") -> List[str]:
+    """Cases whose ``statistic`` got more than ``tolerance`` (a fraction) slower than in the baseline file.
+
+    The minimum is compared by default since it is the least sensitive to noise from the machine.
+    Cases missing from the baseline are skipped.
+    """
+    with open(baseline_path) as file:
+        baseline = json.load(file)
+    regressions = []
+    for measurement in measurements:
+        if measurement.name not in baseline:
+            continue
+        before = baseline[measurement.name][statistic]
+        after = measurement.to_dict()[statistic]
+        if before and after > before * (1 + tolerance):
+            regressions.append(f"{measurement.name}: {statistic} {before * 1000:.3f} ms -> {after * 1000:.3f} ms "
+                               f"(+{(after / before - 1) * 100:.0f}%)")
+    return regressions
@@ -0,0 +1,42 @@
+"""Compare the JSON backends and the OHLCV array conversion on synthetic responses.
+
+Run from the repository root with ``python -m benchmarks.json_decoding [rows]``.
+"""
+import json
+import sys
+import timeit
+
+import numpy as np
+
+from geckoterminal_py.decoding import get_json_decoder, ohlcv_array
+
+
+def main(rows: int = 1000, repeat: int = 20):
+    ohlcv_list = [[1700000000 + i * 60, 1.2345678 + i, 2.5, 0.5, 1.75, 12345.678] for i in range(rows)]
+    body = json.dumps({"data": {"attributes": {"ohlcv_list": ohlcv_list}}}).encode()
+    print(f"ohlcv response with {rows} candles ({len(body) / 1024:.0f} KiB)")
+    baseline = None
+    for backend in ("json", "orjson", "msgspec"):
+        try:
+            loads = get_json_decoder(backend)
+        except ImportError:
+            print(f"  {backend:<8} not installed")
+            continue
+
+        def list_path():
+            return np.asarray(loads(body)["data"]["attributes"]["ohlcv_list"], dtype=np.float64)
+
+        def array_path():
+            return ohlcv_array(loads(body)["data"]["attributes"]["ohlcv_list"])
+
+        np.testing.assert_array_equal(list_path(), array_path())
+        list_time = min(timeit.repeat(list_path, number=1, repeat=repeat))
+        array_time = min(timeit.repeat(array_path, number=1, repeat=repeat))
+        baseline = baseline or list_time
+        print(f"  {backend:<8} decode + np.asarray:   {list_time * 1000:8.3f} ms")
+        print(f"  {backend:<8} decode + ohlcv_array:  {array_time * 1000:8.3f} ms "
+              f"({baseline / array_time:.1f}x vs json + np.asarray)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
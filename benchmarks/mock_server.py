@@ -0,0 +1,248 @@
+"""Local stand-in for the GeckoTerminal API serving synthetic responses.
+
+``SyntheticApi`` builds response bodies of a configurable size for every endpoint in ``constants.py``.
+``MockGeckoTerminalServer`` serves them over HTTP on localhost with optional added latency and a share of
+429 answers, and ``SyntheticApi.transport`` / ``async_transport`` serve the same bodies in-process through
+``httpx.MockTransport`` when socket overhead should stay out of a measurement.
+
+Point a client at the server with ``client.base_url = server.base_url``.
+"""
+import asyncio
+import json
+import random
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+
+import geckoterminal_py.constants as CONSTANTS
+from geckoterminal_py.cache import compile_path_templates, match_path_template
+
+API_PREFIX = "/api/v2/"
+_PATTERNS = compile_path_templates(
+    value for name, value in vars(CONSTANTS).items() if name.endswith("_PATH") and isinstance(value, str))
+
+
+@dataclass(eq=False)
+class SyntheticApi:
+    """Synthetic response bodies: ``page_size`` records per list page and ``ohlcv_rows`` candles at most.
+
+    ``latency`` seconds are added to every response and a ``throttle_rate`` share of requests is answered
+    with a 429 and ``Retry-After: 0``. ``seed`` makes the throttled requests reproducible.
+    """
+
+    page_size: int = 100
+    ohlcv_rows: int = 1000
+    latency: float = 0.0
+    throttle_rate: float = 0.0
+    seed: int = 0
+
+    def __post_init__(self):
+        self._random = random.Random(self.seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.throttled = 0
+
+    def respond(self, path: str, params: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """Status, headers and body for a request path relative to the API root."""
+        with self._lock:
+            self.requests += 1
+            throttled = self.throttle_rate and self._random.random() < self.throttle_rate
+            self.throttled += bool(throttled)
+        if throttled:
+            return 429, {"Retry-After": "0"}, b'{"status": {"error_code": 429}}'
+        template = match_path_template(_PATTERNS, path)
+        if template is None:
+            return 404, {}, b'{"errors": [{"status": "404"}]}'
+        parts = path.split("/")
+        page = int(params.get("page", 1))
+        if template == CONSTANTS.GET_NETWORKS_PATH:
+            body = self._networks(page)
+        elif template == CONSTANTS.GET_DEXES_BY_NETWORK_PATH:
+            body = self._dexes(parts[1], page)
+        elif template == CONSTANTS.GET_OHLCV_DATA_PATH:
+            body = self._ohlcv(parts[5], params.get("aggregate", "1"), parts[3], params.get("before_timestamp"),
+                               int(params.get("limit", self.ohlcv_rows)))
+        elif template == CONSTANTS.GET_SIMPLE_TOKEN_PRICE_PATH:
+            body = self._simple_token_price(parts[-1])
+        elif template == CONSTANTS.GET_TRADES_BY_NETWORK_POOL_PATH:
+            body = self._trades(parts[1], parts[3])
+        elif template == CONSTANTS.GET_SPECIFIC_TOKEN_ON_NETWORK_PATH:
+            body = json.dumps({"data": {"id": f"{parts[1]}_{parts[3]}", "type": "token",
+                                        "attributes": {"address": parts[3], "price_usd": "1.0"}}}).encode()
+        elif template == CONSTANTS.GET_POOL_BY_NETWORK_AND_ADDRESS_PATH:
+            body = json.dumps({"data": synthetic_pool(parts[1], parts[3])}).encode()
+        elif template == CONSTANTS.GET_MULTIPLE_POOLS_BY_NETWORK_PATH:
+            body = self._multiple_pools(parts[1], parts[-1])
+        else:
+            network_id = parts[1] if len(parts) > 2 and parts[1] not in ("trending_pools", "new_pools") else "eth"
+            body = self._pools(network_id, template, page)
+        return 200, {"Content-Type": "application/json"}, body
+
+    @lru_cache(maxsize=256)
+    def _networks(self, page: int) -> bytes:
+        return json.dumps({"data": [{"id": f"network_{page}_{i}", "type": "network",
+                                     "attributes": {"name": f"Network {i}", "coingecko_asset_platform_id": None}}
+                                    for i in range(self.page_size)]}).encode()
+
+    @lru_cache(maxsize=256)
+    def _dexes(self, network_id: str, page: int) -> bytes:
+        return json.dumps({"data": [{"id": f"{network_id}_dex_{page}_{i}", "type": "dex",
+                                     "attributes": {"name": f"Dex {i}"}}
+                                    for i in range(self.page_size)]}).encode()
+
+    @lru_cache(maxsize=256)
+    def _pools(self, network_id: str, template: str, page: int) -> bytes:
+        prefix = f"0x{zlib.crc32(template.encode()):08x}{page:016x}"
+        return json.dumps({"data": [synthetic_pool(network_id, f"{prefix}{i:016x}")
+                                    for i in range(self.page_size)]}).encode()
+
+    def _multiple_pools(self, network_id: str, addresses: str) -> bytes:
+        return json.dumps({"data": [synthetic_pool(network_id, address)
+                                    for address in addresses.split(",")]}).encode()
+
+    @lru_cache(maxsize=1024)
+    def _ohlcv(self, timeframe: str, aggregate: str, pool_address: str, before_timestamp: Optional[str],
+               limit: int) -> bytes:
+        seconds = {"minute": 60, "hour": 3600, "day": 86400}[timeframe] * int(aggregate)
+        before = int(before_timestamp) if before_timestamp else 1_704_067_200
+        last = (before - 1) // seconds * seconds
+        rows = min(limit, self.ohlcv_rows)
+        ohlcv_list = [[ts, 1.0 + i * 1e-3, 1.1 + i * 1e-3, 0.9 + i * 1e-3, 1.05 + i * 1e-3, 1000.0 + i]
+                      for i, ts in enumerate(range(last, last - rows * seconds, -seconds))]
+        return json.dumps({"data": {"id": pool_address, "type": "ohlcv_request_response",
+                                    "attributes": {"ohlcv_list": ohlcv_list}}}).encode()
+
+    def _simple_token_price(self, addresses: str) -> bytes:
+        addresses = addresses.split(",")
+        return json.dumps({"data": {"id": "1", "type": "simple_token_price", "attributes": {
+            "token_prices": {address: "1.5" for address in addresses},
+            "market_cap_usd": {address: "1000000" for address in addresses},
+            "h24_volume_usd": {address: "25000" for address in addresses},
+        }}}).encode()
+
+    @lru_cache(maxsize=256)
+    def _trades(self, network_id: str, pool_address: str) -> bytes:
+        return json.dumps({"data": [synthetic_trade(network_id, 19_000_000 - i, i)
+                                    for i in range(self.page_size)]}).encode()
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        status, headers, body = self.respond(request.url.path[len(API_PREFIX):], dict(request.url.params))
+        if self.latency:
+            time.sleep(self.latency)
+        return httpx.Response(status, headers=headers, content=body)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        status, headers, body = self.respond(request.url.path[len(API_PREFIX):], dict(request.url.params))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return httpx.Response(status, headers=headers, content=body)
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def async_transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle_async)
+
+
+def synthetic_pool(network_id: str, address: str) -> dict:
+    return {
+        "id": f"{network_id}_{address}", "type": "pool",
+        "attributes": {
+            "base_token_price_usd": "0.000404827144568909", "base_token_price_native_currency": "0.0000002037",
+            "quote_token_price_usd": "1988.72563960241", "quote_token_price_native_currency": "1.0",
+            "address": address, "name": "TKN / WETH", "reserve_in_usd": "94447.963914053004685186111386",
+            "pool_created_at": "2023-07-12T15:31:35Z", "fdv_usd": "607241", "market_cap_usd": None,
+            "price_change_percentage": {"h1": "8.35", "h24": "-26.78"},
+            "transactions": {"h1": {"buys": 60, "sells": 53}, "h24": {"buys": 3574, "sells": 2710}},
+            "volume_usd": {"h24": "5920012.566978924298216412099127465"},
+        },
+        "relationships": {
+            "dex": {"data": {"id": "uniswap_v2", "type": "dex"}},
+            "base_token": {"data": {"id": f"{network_id}_0x{address[-38:]}aa", "type": "token"}},
+            "quote_token": {"data": {"id": f"{network_id}_0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2",
+                                     "type": "token"}},
+        },
+    }
+
+
+def synthetic_trade(network_id: str, block_number: int, index: int) -> dict:
+    return {
+        "id": f"{network_id}_{block_number}_0x{index:064x}_0_{block_number}", "type": "trade",
+        "attributes": {
+            "block_number": block_number, "tx_hash": f"0x{index:064x}",
+            "tx_from_address": "0x7a250d5630b4cf539739df2c5dacb4c659f2488d",
+            "from_token_amount": "1.5", "to_token_amount": "2950.1",
+            "price_from_in_currency_token": "1.0", "price_to_in_currency_token": "0.000508",
+            "price_from_in_usd": "1966.7", "price_to_in_usd": "1.0",
+            "block_timestamp": "2024-01-01T00:00:00Z", "kind": "buy" if index % 2 else "sell",
+            "volume_in_usd": "2950.1",
+            "from_token_address": "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2",
+            "to_token_address": "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48",
+        },
+    }
+
+
+class MockGeckoTerminalServer:
+    """Threaded HTTP server on localhost answering with ``SyntheticApi`` responses.
+
+    Use it as a context manager; ``base_url`` is ready to assign to a client's ``base_url``.
+    """
+
+    def __init__(self, api: Optional[SyntheticApi] = None, host: str = "127.0.0.1", port: int = 0):
+        self.api = api or SyntheticApi()
+        api = self.api
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                status, headers, body = api.respond(url.path[len(API_PREFIX):], params)
+                if api.latency:
+                    time.sleep(api.latency)
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX.rstrip('/')}"
+
+    def start(self) -> "MockGeckoTerminalServer":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockGeckoTerminalServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def pool_addresses(count: int) -> List[str]:
+    return [f"0x{i:040x}" for i in range(count)]
+
@@ -0,0 +1,57 @@
+"""Time the parse paths behind the client methods on synthetic responses.
+
+Covers the pool record extraction (glom spec and compiled spec), ``process_pools_list``,
+``process_simple_token_price`` and the OHLCV frame build for every result format. The responses come
+from ``SyntheticApi``, so the input size is set by ``records`` and ``rows`` alone.
+
+Run from the repository root with ``python -m benchmarks.parse_paths [records] [rows]``.
+"""
+import sys
+from typing import List
+
+import pandas as pd
+from glom import glom
+
+import geckoterminal_py.constants as CONSTANTS
+from benchmarks.common import Measurement, measure
+from benchmarks.mock_server import SyntheticApi, pool_addresses
+from geckoterminal_py.base_client import GeckoTerminalClientBase
+from geckoterminal_py.decoding import loads
+from geckoterminal_py.parsing import extract_columns
+
+
+def run(records: int = 1000, rows: int = 1000, repeat: int = 20) -> List[Measurement]:
+    api = SyntheticApi(page_size=records, ohlcv_rows=rows)
+    client = GeckoTerminalClientBase()
+    pools_response = loads(api.respond(CONSTANTS.GET_TOP_POOLS_BY_NETWORK_PATH.format("eth"), {})[2])
+    price_response = loads(api.respond(CONSTANTS.GET_SIMPLE_TOKEN_PRICE_PATH.format(
+        "eth", ",".join(pool_addresses(records))), {})[2])
+    ohlcv_list = loads(api.respond(CONSTANTS.GET_OHLCV_DATA_PATH.format("eth", "0x1", "minute"),
+                                   {"aggregate": "1"})[2])["data"]["attributes"]["ohlcv_list"]
+    pools_list = extract_columns(pools_response, CONSTANTS.POOL_SPEC)
+
+    measurements = [
+        measure(f"parse: pool glom spec ({records})",
+                lambda: pd.DataFrame(glom(pools_response, CONSTANTS.POOL_SPEC)), max(3, repeat // 5)),
+        measure(f"parse: pool compiled spec ({records})",
+                lambda: extract_columns(pools_response, CONSTANTS.POOL_SPEC), repeat),
+        measure(f"parse: process_pools_list ({records})",
+                lambda: client.process_pools_list(pools_list), repeat),
+        measure(f"parse: process_simple_token_price ({records})",
+                lambda: client.process_simple_token_price(price_response), repeat),
+        measure(f"parse: process_ohlcv_list ({rows})",
+                lambda: client.process_ohlcv_list(ohlcv_list), repeat),
+    ]
+    for result_format in ("numpy", "arrow", "records"):
+        measurements.append(measure(f"parse: build_ohlcv_result {result_format} ({rows})",
+                                    lambda: client.build_ohlcv_result(ohlcv_list, result_format), repeat))
+    return measurements
+
+
+def main(records: int = 1000, rows: int = 1000):
+    for measurement in run(records, rows):
+        print(measurement.report())
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
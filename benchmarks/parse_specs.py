@@ -0,0 +1,36 @@
+"""Compare the glom specs with the compiled column extractors on a synthetic multi-pool page.
+
+Run from the repository root with ``python -m benchmarks.parse_specs [records]``.
+"""
+import sys
+import timeit
+
+import pandas as pd
+from glom import glom
+
+import geckoterminal_py.constants as CONSTANTS
+from geckoterminal_py.parsing import extract_columns
+from tests.utils import get_response_from_file
+
+
+def main(records: int = 1000, repeat: int = 5):
+    template = get_response_from_file("get_top_pools_by_network")["data"]
+    response = {"data": [template[i % len(template)] for i in range(records)]}
+
+    def glom_path():
+        return pd.DataFrame(glom(response, CONSTANTS.POOL_SPEC))
+
+    def compiled_path():
+        return pd.DataFrame(extract_columns(response, CONSTANTS.POOL_SPEC))
+
+    pd.testing.assert_frame_equal(glom_path(), compiled_path())
+    glom_time = min(timeit.repeat(glom_path, number=1, repeat=repeat))
+    compiled_time = min(timeit.repeat(compiled_path, number=1, repeat=repeat))
+    print(f"{records} pool records")
+    print(f"  glom spec + DataFrame:      {glom_time * 1000:8.2f} ms")
+    print(f"  compiled spec + DataFrame:  {compiled_time * 1000:8.2f} ms")
+    print(f"  speedup:                    {glom_time / compiled_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -1,2 +1,91 @@
-from geckoterminal_py.clients.sync_client import GeckoTerminalSyncClient
-from geckoterminal_py.clients.async_client import GeckoTerminalAsyncClient
+"""GeckoTerminal API clients.
+
+Every public name is loaded on first access (PEP 562), so ``import geckoterminal_py`` or
+``import geckoterminal_py.constants`` stays cheap for jobs that only need part of the package.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# Public name -> module defining it.
+_LAZY_ATTRIBUTES = {
+    "GeckoTerminalSyncClient": "geckoterminal_py.clients.sync_client",
+    "GeckoTerminalAsyncClient": "geckoterminal_py.clients.async_client",
+    "RateLimiter": "geckoterminal_py.rate_limiter",
+    "RetryPolicy": "geckoterminal_py.rate_limiter",
+    "DiskCacheBackend": "geckoterminal_py.cache",
+    "MemoryCacheBackend": "geckoterminal_py.cache",
+    "ResponseCache": "geckoterminal_py.cache",
+    "PoolWatcher": "geckoterminal_py.watcher",
+    "WatchedPool": "geckoterminal_py.watcher",
+    "ConnectionConfig": "geckoterminal_py.config",
+    "OHLCVStore": "geckoterminal_py.ohlcv_store",
+    "OHLCVResampler": "geckoterminal_py.resampling",
+    "resample_ohlcv": "geckoterminal_py.resampling",
+    "timeframe_to_seconds": "geckoterminal_py.resampling",
+    "BatchResult": "geckoterminal_py.batch",
+    "ClientMetrics": "geckoterminal_py.metrics",
+    "OHLCVPanel": "geckoterminal_py.panel",
+    "TokenPool": "geckoterminal_py.token_index",
+    "TokenPoolIndex": "geckoterminal_py.token_index",
+    "ParquetSink": "geckoterminal_py.sinks",
+    "RecordingTransport": "geckoterminal_py.replay",
+    "ReplayArchive": "geckoterminal_py.replay",
+    "ReplayTransport": "geckoterminal_py.replay",
+}
+
+# Spelled out so linters see the TYPE_CHECKING imports below as re-exports.
+__all__ = [
+    "GeckoTerminalSyncClient",
+    "GeckoTerminalAsyncClient",
+    "RateLimiter",
+    "RetryPolicy",
+    "DiskCacheBackend",
+    "MemoryCacheBackend",
+    "ResponseCache",
+    "PoolWatcher",
+    "WatchedPool",
+    "ConnectionConfig",
+    "OHLCVStore",
+    "OHLCVResampler",
+    "resample_ohlcv",
+    "timeframe_to_seconds",
+    "BatchResult",
+    "ClientMetrics",
+    "OHLCVPanel",
+    "TokenPool",
+    "TokenPoolIndex",
+    "ParquetSink",
+    "RecordingTransport",
+    "ReplayArchive",
+    "ReplayTransport",
+]
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from geckoterminal_py.clients.sync_client import GeckoTerminalSyncClient
+    from geckoterminal_py.clients.async_client import GeckoTerminalAsyncClient
+    from geckoterminal_py.rate_limiter import RateLimiter, RetryPolicy
+    from geckoterminal_py.cache import DiskCacheBackend, MemoryCacheBackend, ResponseCache
+    from geckoterminal_py.watcher import PoolWatcher, WatchedPool
+    from geckoterminal_py.config import ConnectionConfig
+    from geckoterminal_py.ohlcv_store import OHLCVStore
+    from geckoterminal_py.resampling import OHLCVResampler, resample_ohlcv, timeframe_to_seconds
+    from geckoterminal_py.batch import BatchResult
+    from geckoterminal_py.metrics import ClientMetrics
+    from geckoterminal_py.panel import OHLCVPanel
+    from geckoterminal_py.token_index import TokenPool, TokenPoolIndex
+    from geckoterminal_py.sinks import ParquetSink
+    from geckoterminal_py.replay import RecordingTransport, ReplayArchive, ReplayTransport
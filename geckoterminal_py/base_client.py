@@ -1,5 +1,34 @@
-from typing import Dict, List
-import pandas as pd
+from __future__ import annotations
+
+import math
+import time
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Any, Callable, ContextManager, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from geckoterminal_py.cache import ResponseCache
+from geckoterminal_py.config import ConnectionConfig
+from geckoterminal_py.decoding import get_json_decoder, ohlcv_array
+from geckoterminal_py.lazy import lazy_import
+from geckoterminal_py.metrics import ClientMetrics, Instrumentation, RequestTrace
+from geckoterminal_py.parsing import extract_columns
+from geckoterminal_py.rate_limiter import RateLimiter, RetryPolicy
+from geckoterminal_py.results import from_columns, validate_result_format
+import geckoterminal_py.constants as CONSTANTS
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+httpx = lazy_import("httpx")
+
+
+class EndpointRequest(NamedTuple):
+    """One endpoint call: the GET request to send and how to turn its decoded response into the result.
+
+    ``path`` is None when the result is known without a request, e.g. prices of no token addresses.
+    """
+    path: Optional[str]
+    params: Optional[dict]
+    parse: Callable[[Optional[dict]], Any]
 
 
 class GeckoTerminalClientBase:
@@ -8,14 +37,229 @@ class GeckoTerminalClientBase:
     }
     base_url = "https://api.geckoterminal.com/api/v2"
     ohlcv_timeframes = ["1m", "5m", "15m", "1h", "4h", "12h", "1d"]
+    ohlcv_timeframe_seconds = {
+        "1m": 60,
+        "5m": 5 * 60,
+        "15m": 15 * 60,
+        "1h": 60 * 60,
+        "4h": 4 * 60 * 60,
+        "12h": 12 * 60 * 60,
+        "1d": 24 * 60 * 60,
+    }
+    ohlcv_columns = ["timestamp", "open", "high", "low", "close", "volume_usd"]
+    result_format = "pandas"
+
+    # Request pipeline shared by both clients, which only add the sending and the sleeping.
+
+    def configure_client(self, client_class: type, transport: Optional[Any] = None,
+                         rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None,
+                         cache: Optional[ResponseCache] = None, connection_config: Optional[ConnectionConfig] = None,
+                         http_client: Optional[Any] = None, result_format: str = "pandas", json_backend: str = "auto",
+                         metrics: Optional[ClientMetrics] = None, tracer: Optional[Any] = None):
+        """Set up the ``httpx`` client and everything every request goes through.
+
+        A new ``client_class`` client is created unless ``http_client`` is injected.
+        """
+        if http_client is not None and transport is not None:
+            raise ValueError("Pass either a transport or an http_client, not both.")
+        if http_client is not None and connection_config is not None:
+            raise ValueError("A connection_config cannot be applied to an injected http_client, configure it "
+                             "when creating the http_client instead.")
+        if http_client is not None:
+            # An injected client is shared with its owner: it is neither reconfigured nor closed here and
+            # the API headers are sent per request instead.
+            self.client = http_client
+            self._owns_client = False
+            self._request_headers = self.headers
+        else:
+            client_kwargs = (connection_config or ConnectionConfig()).client_kwargs()
+            if transport:
+                client_kwargs["transport"] = transport
+            self.client = client_class(headers=self.headers, **client_kwargs)
+            self._owns_client = True
+            self._request_headers = None
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.result_format = validate_result_format(result_format)
+        self.json_loads = get_json_decoder(json_backend)
+        self.cache = cache
+        self.metrics = metrics
+        self.instrumentation = Instrumentation(metrics, tracer) if metrics is not None or tracer is not None else None
+
+    def trace_request(self, method: str, path: str) -> ContextManager[Optional[RequestTrace]]:
+        """Context yielding the request's trace, or None when the client is not instrumented."""
+        if self.instrumentation is None:
+            return nullcontext()
+        return self.instrumentation.trace_request(method, path)
+
+    def cached_response(self, method: str, path: str, params: Optional[dict],
+                        trace: Optional[RequestTrace] = None) -> Optional[Any]:
+        if not self.cache:
+            return None
+        cached = self.cache.get(method, path, params, self.json_loads)
+        if cached is not None and trace is not None:
+            trace.cache_hit = True
+        return cached
+
+    def decode_response(self, body: bytes, trace: Optional[RequestTrace] = None) -> Any:
+        if trace is None:
+            return self.json_loads(body)
+        started = time.perf_counter()
+        response = self.json_loads(body)
+        trace.decode_time = time.perf_counter() - started
+        return response
 
     @staticmethod
-    def process_pools_list(pools_list: List[Dict[str, str]]) -> pd.DataFrame:
-        df = pd.DataFrame(pools_list)
-        df["network_id"] = df["id"].apply(lambda x: x.split("_")[0])
-        df["quote_token_id"] = df["quote_token_id"].apply(lambda x: x.split("_")[1])
-        df["base_token_id"] = df["base_token_id"].apply(lambda x: x.split("_")[1])
-        return df
+    def record_limiter_wait(trace: Optional[RequestTrace], started: float):
+        if trace is not None:
+            trace.limiter_wait += time.perf_counter() - started
+
+    def check_response(self, method: str, path: str, params: Optional[dict], response: httpx.Response,
+                       attempt: int, trace: Optional[RequestTrace] = None,
+                       started: Optional[float] = None) -> Optional[float]:
+        """Seconds to sleep before retrying ``response``, or None when it is final.
+
+        A final response raises for its status or is stored in the cache. A throttled one pauses the rate
+        limiter instead of sleeping, so every caller sharing it backs off.
+        """
+        if trace is not None:
+            trace.add_attempt(response, time.perf_counter() - started)
+        if not self.retry_policy.should_retry(response, attempt):
+            response.raise_for_status()
+            if self.cache:
+                self.cache.set(method, path, params, response.content)
+            return None
+        if trace is not None:
+            trace.retries += 1
+        delay = self.retry_policy.get_delay(response, attempt)
+        if self.rate_limiter and response.status_code == 429:
+            self.rate_limiter.pause(delay)
+            return 0.0
+        return delay
+
+    def parse_response(self, request: EndpointRequest, response: Any) -> Any:
+        """Parse the response of a planned request, timing it for the metrics."""
+        if self.instrumentation is None or request.path is None:
+            return request.parse(response)
+        started = time.perf_counter()
+        result = request.parse(response)
+        self.instrumentation.record_parse(request.path, time.perf_counter() - started)
+        return result
+
+    def resolve_result_format(self, result_format: Optional[str] = None) -> str:
+        return validate_result_format(result_format or self.result_format)
+
+    def build_result(self, columns: Dict[str, List], result_format: Optional[str] = None) -> Any:
+        """Turn extracted ``{column: values}`` into the requested result format (a DataFrame by default)."""
+        result_format = self.resolve_result_format(result_format)
+        if result_format == "pandas":
+            return pd.DataFrame(columns)
+        return from_columns(columns, result_format)
+
+    def build_frame_result(self, df: pd.DataFrame, result_format: Optional[str] = None) -> Any:
+        """Convert a frame built by a multi-request helper to the requested result format."""
+        result_format = self.resolve_result_format(result_format)
+        if result_format == "pandas":
+            return df
+        return from_columns({column: df[column].to_numpy() for column in df.columns}, result_format)
+
+    def build_pools_result(self, pools_list: Dict[str, List], result_format: Optional[str] = None) -> Any:
+        result_format = self.resolve_result_format(result_format)
+        if result_format == "pandas":
+            return self.process_pools_list(pools_list)
+        return from_columns(self.prepare_pool_columns(pools_list), result_format)
+
+    def build_ohlcv_result(self, ohlcv_list: List[List[float]], result_format: Optional[str] = None) -> Any:
+        result_format = self.resolve_result_format(result_format)
+        if result_format == "pandas":
+            return self.process_ohlcv_list(ohlcv_list)
+        values = ohlcv_array(ohlcv_list, len(self.ohlcv_columns))
+        timestamps = values[:, 0].astype(np.int64)
+        timestamps, first_positions = np.unique(timestamps, return_index=True)
+        values = values[first_positions]
+        columns = {"timestamp": timestamps,
+                   **{column: values[:, i] for i, column in enumerate(self.ohlcv_columns) if i},
+                   "datetime": timestamps.astype("datetime64[s]")}
+        return from_columns(columns, result_format)
+
+    def build_simple_token_price_result(self, response: Dict, result_format: Optional[str] = None) -> Any:
+        result_format = self.resolve_result_format(result_format)
+        if result_format == "pandas":
+            return self.process_simple_token_price(response)
+        attributes = response.get("data", {}).get("attributes", {}) or {}
+        token_prices = attributes.get("token_prices", {}) or {}
+        columns = {"token_address": list(token_prices), "price_usd": list(token_prices.values())}
+        for source_field, column in self.SIMPLE_TOKEN_PRICE_OPTIONAL_FIELDS.items():
+            values = attributes.get(source_field)
+            if isinstance(values, dict):
+                columns[column] = [values.get(address) for address in token_prices]
+        return from_columns(columns, result_format)
+
+    # The API returns every decimal as a string; these pool columns are cast once when the frame is built.
+    POOL_FLOAT_COLUMNS = [
+        "base_token_price_usd", "base_token_price_native_currency", "quote_token_price_usd",
+        "quote_token_price_native_currency", "reserve_in_usd", "fdv_usd", "market_cap_usd",
+        "price_change_percentage_h1", "price_change_percentage_h24", "volume_usd_h24",
+    ]
+    POOL_INT_COLUMNS = [
+        "transactions_h1_buys", "transactions_h1_sells", "transactions_h24_buys", "transactions_h24_sells",
+    ]
+    POOL_CATEGORICAL_COLUMNS = ["network_id", "dex_id"]
+
+    @classmethod
+    def process_pools_list(cls, pools_list: Union[List[Dict[str, str]], Dict[str, List]]) -> pd.DataFrame:
+        """Build a typed pool frame from the extracted pool records.
+
+        Ids are split into network and token ids, prices, reserves and volumes become float64, transaction
+        counts Int64, ``pool_created_at`` a UTC datetime and ``network_id``/``dex_id`` categoricals. Every
+        column is cast from its value list before the frame is built once.
+        """
+        columns = cls.prepare_pool_columns(pools_list)
+        for column in cls.POOL_INT_COLUMNS:
+            columns[column] = pd.array(columns[column], dtype="Int64")
+        columns["pool_created_at"] = pd.to_datetime(columns["pool_created_at"], utc=True, errors="coerce")
+        for column in cls.POOL_CATEGORICAL_COLUMNS:
+            columns[column] = pd.Categorical(columns[column])
+        return pd.DataFrame(columns)
+
+    @staticmethod
+    def split_ids(ids: List[Optional[str]]) -> Tuple[List[Optional[str]], List[Optional[str]]]:
+        """Networks and addresses of ``<network>_<address>`` ids.
+
+        The address is what follows the last ``_``, since network ids such as ``polygon_pos`` contain one.
+        """
+        networks, addresses = [], []
+        for value in ids:
+            if value:
+                network, _, address = value.rpartition("_")
+            else:
+                network = address = value
+            networks.append(network)
+            addresses.append(address)
+        return networks, addresses
+
+    @staticmethod
+    def to_float64_array(values: List[Any]) -> np.ndarray:
+        """float64 array of decimal strings, None becoming NaN (and unparsable values too)."""
+        try:
+            return np.array(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(dtype=np.float64)
+
+    @staticmethod
+    def to_int_list(values: List[Any]) -> List[Optional[int]]:
+        """Integer counts, with None for missing, unparsable and non-integral values such as ``"n/a"`` or 1.7."""
+        counts = []
+        for value in values:
+            if type(value) is int:
+                counts.append(value)
+                continue
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                number = math.nan
+            counts.append(int(number) if number.is_integer() else None)
+        return counts
 
     # Optional attribute maps returned by the simple token price endpoint, mapped to the
     # column names already used across the pool DataFrames so downstream code stays consistent.
@@ -46,6 +290,97 @@ class GeckoTerminalClientBase:
                 df[column] = df["token_address"].map(values)
         return df
 
+    @classmethod
+    def prepare_pool_columns(cls, pools_list: Union[List[Dict[str, str]], Dict[str, List]]) -> Dict[str, Any]:
+        """Pandas-free part of ``process_pools_list``, also used as is by the non-pandas result formats.
+
+        Ids are split, numeric columns become float64 arrays and transaction counts lists of ints, with NaN and
+        None for values that are missing or cannot be parsed.
+        """
+        if isinstance(pools_list, list):
+            fields = CONSTANTS.POOL_SPEC[1][0]
+            pools_list = {field: [record.get(field) for record in pools_list] for field in fields}
+        columns = dict(pools_list)
+        network_ids = cls.split_ids(columns["id"])[0]
+        columns["quote_token_id"] = cls.split_ids(columns["quote_token_id"])[1]
+        columns["base_token_id"] = cls.split_ids(columns["base_token_id"])[1]
+        for column in cls.POOL_FLOAT_COLUMNS:
+            columns[column] = cls.to_float64_array(columns[column])
+        for column in cls.POOL_INT_COLUMNS:
+            columns[column] = cls.to_int_list(columns[column])
+        columns["network_id"] = network_ids
+        return columns
+
+    @staticmethod
+    def build_simple_token_price_params(include_market_cap: bool = False, mcap_fdv_fallback: bool = False,
+                                        include_24hr_vol: bool = False, include_24hr_price_change: bool = False,
+                                        include_total_reserve_in_usd: bool = False) -> Dict[str, str]:
+        return {
+            "include_market_cap": str(include_market_cap).lower(),
+            "mcap_fdv_fallback": str(mcap_fdv_fallback).lower(),
+            "include_24hr_vol": str(include_24hr_vol).lower(),
+            "include_24hr_price_change": str(include_24hr_price_change).lower(),
+            "include_total_reserve_in_usd": str(include_total_reserve_in_usd).lower(),
+        }
+
+    @staticmethod
+    def chunk_token_addresses(token_addresses: List[str],
+                              chunk_size: int = CONSTANTS.SIMPLE_TOKEN_PRICE_MAX_ADDRESSES) -> List[List[str]]:
+        """Drop duplicate addresses (keeping first-seen order) and split the rest into per-request chunks."""
+        unique_addresses = list(dict.fromkeys(token_addresses))
+        return [unique_addresses[i:i + chunk_size] for i in range(0, len(unique_addresses), chunk_size)]
+
+    @classmethod
+    def merge_simple_token_prices(cls, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """Concatenate chunked simple token price frames into one frame with every price column present."""
+        columns = ["token_address", "price_usd", *cls.SIMPLE_TOKEN_PRICE_OPTIONAL_FIELDS.values()]
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(frames, ignore_index=True).reindex(columns=columns)
+
+    @classmethod
+    def merge_pool_frames(cls, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """Concatenate pool frames into one universe with a row per pool id, keeping its first occurrence."""
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame(columns=list(CONSTANTS.POOL_SPEC[1][0]) + ["network_id"])
+        df = pd.concat(frames, ignore_index=True).drop_duplicates(subset="id", keep="first", ignore_index=True)
+        # Categories differ between frames, so concat falls back to strings; restore the categoricals.
+        for column in cls.POOL_CATEGORICAL_COLUMNS:
+            df[column] = df[column].astype("category")
+        return df
+
+    @staticmethod
+    def select_trades(trades: pd.DataFrame, seen_ids: set, start: Optional[int] = None, end: Optional[int] = None,
+                      start_block: Optional[int] = None, end_block: Optional[int] = None) -> pd.DataFrame:
+        """Trades not in ``seen_ids`` within the ``[start, end]`` time and ``[start_block, end_block]`` block window.
+
+        The selected ids are added to ``seen_ids`` and the trades are returned in block order.
+        """
+        if trades.empty:
+            return trades
+        keep = ~trades["id"].isin(seen_ids).to_numpy()
+        if start is not None or end is not None:
+            timestamps = pd.to_datetime(trades["block_timestamp"], utc=True)
+            if start is not None:
+                keep &= (timestamps >= pd.Timestamp(start, unit="s", tz="UTC")).to_numpy()
+            if end is not None:
+                keep &= (timestamps <= pd.Timestamp(end, unit="s", tz="UTC")).to_numpy()
+        if start_block is not None or end_block is not None:
+            blocks = pd.to_numeric(trades["block_number"])
+            if start_block is not None:
+                keep &= (blocks >= start_block).to_numpy()
+            if end_block is not None:
+                keep &= (blocks <= end_block).to_numpy()
+        selected = trades[keep]
+        seen_ids.update(selected["id"])
+        return selected.sort_values(["block_number", "block_timestamp"], kind="stable").reset_index(drop=True)
+
+    @staticmethod
+    def page_params(page: Optional[int] = None) -> Optional[Dict[str, int]]:
+        return {"page": page} if page is not None else None
+
     @staticmethod
     def get_timeframe_and_period(timeframe: str) -> (str, str):
         unit_conversion = {
@@ -55,3 +390,176 @@ class GeckoTerminalClientBase:
         }
         period, unit = timeframe[:-1], timeframe[-1]
         return unit_conversion[unit], period
+
+    @classmethod
+    def build_ohlcv_request(cls, network_id: str, pool_address: str, timeframe: str, before_timestamp: int = None,
+                            currency: str = "usd", token: str = "base", limit: int = 1000) -> Tuple[str, Dict]:
+        if timeframe not in cls.ohlcv_timeframes:
+            raise ValueError(f"Timeframe {timeframe} is not supported. Please select one timeframe of the following"
+                             f"list {cls.ohlcv_timeframes}")
+        timeframe, period = cls.get_timeframe_and_period(timeframe)
+        params = {
+            "aggregate": period,
+            "limit": limit,
+            "currency": currency,
+            "token": token,
+        }
+        if before_timestamp:
+            params["before_timestamp"] = before_timestamp
+        return CONSTANTS.GET_OHLCV_DATA_PATH.format(network_id, pool_address, timeframe), params
+
+    @classmethod
+    def process_ohlcv_list(cls, ohlcv_list: List[List[float]]) -> pd.DataFrame:
+        return cls.ohlcv_frame(ohlcv_array(ohlcv_list, len(cls.ohlcv_columns)))
+
+    @classmethod
+    def ohlcv_frame(cls, values: np.ndarray) -> pd.DataFrame:
+        """Sorted, deduplicated OHLCV frame from a float64 ``(rows, 6)`` array with an int64 ``timestamp``."""
+        df = pd.DataFrame(values[:, 1:], columns=cls.ohlcv_columns[1:])
+        df.insert(0, "timestamp", values[:, 0].astype(np.int64))
+        df["datetime"] = pd.to_datetime(df["timestamp"], unit="s")
+        return df.drop_duplicates(subset="timestamp").sort_values("datetime").reset_index(drop=True)
+
+    @staticmethod
+    def to_unix_timestamp(value: Union[int, float, datetime, pd.Timestamp]) -> int:
+        if isinstance(value, datetime):
+            return int(pd.Timestamp(value).timestamp())
+        return int(value)
+
+    @classmethod
+    def plan_ohlcv_windows(cls, timeframe: str, start: int, end: int, limit: int = 1000) -> List[Tuple[int, int]]:
+        """Split ``[start, end]`` into the ``(before_timestamp, limit)`` pages needed to cover it.
+
+        Pages are planned up front from the timeframe's seconds-per-candle so they can be fetched
+        concurrently instead of walking ``before_timestamp`` backwards one response at a time.
+        """
+        if timeframe not in cls.ohlcv_timeframes:
+            raise ValueError(f"Timeframe {timeframe} is not supported. Please select one timeframe of the following"
+                             f"list {cls.ohlcv_timeframes}")
+        if end < start:
+            raise ValueError(f"The end of the range ({end}) must not be before its start ({start}).")
+        seconds = cls.ohlcv_timeframe_seconds[timeframe]
+        windows = []
+        before_timestamp = end + seconds
+        while before_timestamp > start:
+            candles = min(limit, -(-(before_timestamp - start) // seconds))
+            windows.append((before_timestamp, candles))
+            before_timestamp -= candles * seconds
+        return windows
+
+    @classmethod
+    def process_ohlcv_pages(cls, pages: List[List[List[float]]], start: int, end: int) -> pd.DataFrame:
+        """Build a single OHLCV frame from the raw ``ohlcv_list`` pages of a range request.
+
+        Every page is copied once into a preallocated float64 block and the result is trimmed to
+        ``[start, end]`` and deduplicated on ``timestamp`` a single time at the end.
+        """
+        total = sum(len(page) for page in pages)
+        values = np.empty((total, len(cls.ohlcv_columns)), dtype=np.float64)
+        offset = 0
+        for page in pages:
+            if len(page):
+                values[offset:offset + len(page)] = ohlcv_array(page, len(cls.ohlcv_columns))
+                offset += len(page)
+        timestamps = values[:, 0].astype(np.int64)
+        return cls.ohlcv_frame(values[(timestamps >= start) & (timestamps <= end)])
+
+    # Endpoint definitions shared by the sync and async clients, which only execute the returned requests.
+
+    def plan_networks(self, page: Optional[int] = None, result_format: Optional[str] = None) -> EndpointRequest:
+        return EndpointRequest(CONSTANTS.GET_NETWORKS_PATH, self.page_params(page),
+                               lambda response: self.build_result(extract_columns(response, CONSTANTS.NETWORK_SPEC),
+                                                                  result_format))
+
+    def plan_dexes_by_network(self, network_id: str, page: Optional[int] = None,
+                              result_format: Optional[str] = None) -> EndpointRequest:
+        return EndpointRequest(CONSTANTS.GET_DEXES_BY_NETWORK_PATH.format(network_id), self.page_params(page),
+                               lambda response: self.build_result(
+                                   extract_columns(response, CONSTANTS.DEXES_BY_NETWORK_SPEC), result_format))
+
+    def plan_pools(self, path: str, params: Optional[dict] = None,
+                   result_format: Optional[str] = None) -> EndpointRequest:
+        """Request for any endpoint returning a list of pools, parsed into a typed pool result."""
+        return EndpointRequest(path, params, lambda response: self.build_pools_result(
+            extract_columns(response, CONSTANTS.POOL_SPEC), result_format))
+
+    def plan_trending_pools(self, result_format: Optional[str] = None) -> EndpointRequest:
+        return self.plan_pools(CONSTANTS.GET_TRENDING_POOLS_PATH, result_format=result_format)
+
+    def plan_trending_pools_by_network(self, network_id: str, page: Optional[int] = None,
+                                       result_format: Optional[str] = None) -> EndpointRequest:
+        return self.plan_pools(CONSTANTS.GET_TRENDING_POOLS_BY_NETWORK_PATH.format(network_id),
+                               self.page_params(page), result_format)
+
+    def plan_top_pools_by_network(self, network_id: str, page: Optional[int] = None,
+                                  result_format: Optional[str] = None) -> EndpointRequest:
+        return self.plan_pools(CONSTANTS.GET_TOP_POOLS_BY_NETWORK_PATH.format(network_id),
+                               self.page_params(page), result_format)
+
+    def plan_top_pools_by_network_dex(self, network_id: str, dex_id: str, page: Optional[int] = None,
+                                      result_format: Optional[str] = None) -> EndpointRequest:
+        return self.plan_pools(CONSTANTS.GET_TOP_POOLS_BY_NETWORK_DEX_PATH.format(network_id, dex_id),
+                               self.page_params(page), result_format)
+
+    def plan_top_pools_by_network_token(self, network_id: str, token_id: str,
+                                        result_format: Optional[str] = None) -> EndpointRequest:
+        return self.plan_pools(CONSTANTS.GET_TOP_POOLS_BY_NETWORK_TOKEN_PATH.format(network_id, token_id),
+                               result_format=result_format)
+
+    def plan_new_pools_by_network(self, network_id: str, page: Optional[int] = None,
+                                  result_format: Optional[str] = None) -> EndpointRequest:
+        return self.plan_pools(CONSTANTS.GET_NEW_POOLS_BY_NETWORK_PATH.format(network_id),
+                               self.page_params(page), result_format)
+
+    def plan_new_pools_all_networks(self, result_format: Optional[str] = None) -> EndpointRequest:
+        return self.plan_pools(CONSTANTS.GET_NEW_POOLS_ALL_NETWORKS_PATH, result_format=result_format)
+
+    def plan_pool_by_network_address(self, network_id: str, pool_address: str,
+                                     result_format: Optional[str] = None) -> EndpointRequest:
+        def parse(response: dict) -> Any:
+            # A single pool comes back as one object instead of a list of them.
+            response["data"] = [response["data"]]
+            return self.build_pools_result(extract_columns(response, CONSTANTS.POOL_SPEC), result_format)
+
+        return EndpointRequest(CONSTANTS.GET_POOL_BY_NETWORK_AND_ADDRESS_PATH.format(network_id, pool_address),
+                               None, parse)
+
+    def plan_multiple_pools_by_network(self, network_id: str, pool_addresses: List[str],
+                                       result_format: Optional[str] = None) -> EndpointRequest:
+        path = CONSTANTS.GET_MULTIPLE_POOLS_BY_NETWORK_PATH.format(network_id, ",".join(pool_addresses))
+        return self.plan_pools(path, result_format=result_format)
+
+    def plan_specific_token_on_network(self, network_id: str, token_id: str) -> EndpointRequest:
+        return EndpointRequest(CONSTANTS.GET_SPECIFIC_TOKEN_ON_NETWORK_PATH.format(network_id, token_id), None,
+                               lambda response: response["data"])
+
+    def plan_simple_token_price(self, network_id: str, token_addresses: List[str],
+                                include_market_cap: bool = False, mcap_fdv_fallback: bool = False,
+                                include_24hr_vol: bool = False, include_24hr_price_change: bool = False,
+                                include_total_reserve_in_usd: bool = False,
+                                result_format: Optional[str] = None) -> EndpointRequest:
+        if not token_addresses:
+            return EndpointRequest(None, None, lambda _: self.build_result({"token_address": [], "price_usd": []},
+                                                                           result_format))
+        if len(token_addresses) > CONSTANTS.SIMPLE_TOKEN_PRICE_MAX_ADDRESSES:
+            raise ValueError(f"A maximum of {CONSTANTS.SIMPLE_TOKEN_PRICE_MAX_ADDRESSES} token addresses can be "
+                             f"requested per call, got {len(token_addresses)}.")
+        params = self.build_simple_token_price_params(include_market_cap, mcap_fdv_fallback, include_24hr_vol,
+                                                      include_24hr_price_change, include_total_reserve_in_usd)
+        return EndpointRequest(CONSTANTS.GET_SIMPLE_TOKEN_PRICE_PATH.format(network_id, ",".join(token_addresses)),
+                               params, lambda response: self.build_simple_token_price_result(response, result_format))
+
+    def plan_ohlcv(self, network_id: str, pool_address: str, timeframe: str, before_timestamp: int = None,
+                   currency: str = "usd", token: str = "base", limit: int = 1000,
+                   result_format: Optional[str] = None) -> EndpointRequest:
+        path, params = self.build_ohlcv_request(network_id, pool_address, timeframe, before_timestamp,
+                                                currency, token, limit)
+        return EndpointRequest(path, params, lambda response: self.build_ohlcv_result(
+            response["data"]["attributes"]["ohlcv_list"], result_format))
+
+    def plan_trades(self, network: str, pool_address: str, trade_volume_filter: Optional[float] = None,
+                    result_format: Optional[str] = None) -> EndpointRequest:
+        return EndpointRequest(CONSTANTS.GET_TRADES_BY_NETWORK_POOL_PATH.format(network, pool_address),
+                               {"trade_volume_in_usd_greater_than": trade_volume_filter},
+                               lambda response: self.build_result(extract_columns(response, CONSTANTS.TRADES_SPEC),
+                                                                  result_format))
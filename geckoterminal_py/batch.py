@@ -0,0 +1,36 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Union
+
+# A batched call: ``(method, args)`` or ``(method, args, kwargs)``, where ``method`` is the name of a
+# client method or any callable.
+BatchCall = Union[Tuple[Union[str, Callable], Sequence], Tuple[Union[str, Callable], Sequence, Dict[str, Any]]]
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a batch of calls, in input order.
+
+    ``results[i]`` is the return value of call ``i``, or None when it raised; its exception is then
+    ``errors[i]``.
+    """
+
+    results: List[Any] = field(default_factory=list)
+    errors: Dict[int, BaseException] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def raise_first(self):
+        """Re-raise the exception of the first failed call, if any."""
+        if self.errors:
+            raise self.errors[min(self.errors)]
+
+
+def resolve_call(target: Any, call: BatchCall) -> Tuple[Callable, tuple, Dict[str, Any]]:
+    """Split a batched call into ``(function, args, kwargs)``, looking method names up on ``target``."""
+    if not isinstance(call, tuple) or len(call) not in (2, 3):
+        raise ValueError(f"Unsupported batch call {call!r}, expected (method, args) or (method, args, kwargs).")
+    method, args, kwargs = call if len(call) == 3 else (*call, {})
+    function = getattr(target, method) if isinstance(method, str) else method
+    return function, tuple(args), dict(kwargs)
@@ -0,0 +1,259 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from geckoterminal_py.decoding import JsonDecoder, loads
+import geckoterminal_py.constants as CONSTANTS
+
+# Default time to live in seconds per endpoint path template. Reference data changes rarely while
+# anything derived from live trading goes stale within seconds.
+DEFAULT_TTLS = {
+    CONSTANTS.GET_NETWORKS_PATH: 6 * 60 * 60,
+    CONSTANTS.GET_DEXES_BY_NETWORK_PATH: 6 * 60 * 60,
+    CONSTANTS.GET_SPECIFIC_TOKEN_ON_NETWORK_PATH: 60 * 60,
+    CONSTANTS.GET_TRENDING_POOLS_PATH: 30,
+    CONSTANTS.GET_TRENDING_POOLS_BY_NETWORK_PATH: 30,
+    CONSTANTS.GET_POOL_BY_NETWORK_AND_ADDRESS_PATH: 30,
+    CONSTANTS.GET_MULTIPLE_POOLS_BY_NETWORK_PATH: 30,
+    CONSTANTS.GET_TOP_POOLS_BY_NETWORK_PATH: 60,
+    CONSTANTS.GET_TOP_POOLS_BY_NETWORK_DEX_PATH: 60,
+    CONSTANTS.GET_TOP_POOLS_BY_NETWORK_TOKEN_PATH: 60,
+    CONSTANTS.GET_NEW_POOLS_BY_NETWORK_PATH: 30,
+    CONSTANTS.GET_NEW_POOLS_ALL_NETWORKS_PATH: 30,
+    CONSTANTS.GET_SIMPLE_TOKEN_PRICE_PATH: 10,
+    CONSTANTS.GET_OHLCV_DATA_PATH: 60,
+    CONSTANTS.GET_TRADES_BY_NETWORK_POOL_PATH: 10,
+}
+
+
+def compile_path_templates(templates: Iterable[str]) -> List[Tuple["re.Pattern", str]]:
+    """Regexes matching the paths built from ``"networks/{}/pools"``-style templates.
+
+    Literal templates are checked before parametrised ones so e.g. "networks/new_pools" is never
+    taken for a "networks/{}/..." path.
+    """
+    return sorted(((re.compile("^" + "/".join("[^/]+" if part == "{}" else re.escape(part)
+                                              for part in template.split("/")) + "$"), template)
+                   for template in templates),
+                  key=lambda item: "{}" in item[1])
+
+
+def match_path_template(patterns: List[Tuple["re.Pattern", str]], path: str) -> Optional[str]:
+    for pattern, template in patterns:
+        if pattern.match(path):
+            return template
+    return None
+
+
+class MemoryCacheBackend:
+    """Least recently used store bounded by the total size of the cached bodies."""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[float, bytes]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, expires_at: float, body: bytes):
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= len(previous[1])
+            self._entries[key] = (expires_at, body)
+            self.current_bytes += len(body)
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted)
+                self.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.current_bytes -= len(entry[1])
+
+    def purge_expired(self, now: float) -> int:
+        """Drop every entry expired at ``now`` and return how many were dropped."""
+        with self._lock:
+            expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+            for key in expired:
+                self.current_bytes -= len(self._entries.pop(key)[1])
+        return len(expired)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskCacheBackend:
+    """SQLite file store so a restarted process starts with a warm cache."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires_at REAL, body BLOB)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)")
+        self._connection.commit()
+
+    def get(self, key: str) -> Optional[Tuple[float, bytes]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT expires_at, body FROM responses WHERE key = ?", (key,)).fetchone()
+        return (row[0], bytes(row[1])) if row else None
+
+    def set(self, key: str, expires_at: float, body: bytes):
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO responses (key, expires_at, body) VALUES (?, ?, ?)",
+                                     (key, expires_at, body))
+            self._connection.commit()
+
+    def delete(self, key: str):
+        with self._lock:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._connection.commit()
+
+    def purge_expired(self, now: float) -> int:
+        """Delete every row expired at ``now`` and return how many were deleted."""
+        with self._lock:
+            deleted = self._connection.execute("DELETE FROM responses WHERE expires_at <= ?", (now,)).rowcount
+            self._connection.commit()
+        return deleted
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+class ResponseCache:
+    """TTL cache for raw API responses, shareable between sync and async clients.
+
+    Entries live in an in-memory LRU bounded by ``max_bytes`` and, when ``disk_path`` is given, are
+    also written through to a SQLite file that is read back on memory misses. The TTL of a request is
+    looked up from ``ttls``, keyed by the path templates in ``constants.py``; paths without a TTL
+    fall back to ``default_ttl`` and are not cached when it is 0. Bodies are stored as the raw JSON
+    bytes and decoded on every hit, so callers may freely mutate what they get back.
+
+    Expired entries are deleted when read, and every ``purge_interval`` seconds a write also purges all
+    expired entries, so the SQLite file of a long-running job does not keep pages nobody asks for again.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, default_ttl: float = 0,
+                 max_bytes: int = 32 * 1024 * 1024, disk_path: Optional[str] = None,
+                 purge_interval: float = 300.0):
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.memory = MemoryCacheBackend(max_bytes)
+        self.disk = DiskCacheBackend(disk_path) if disk_path else None
+        self.purge_interval = purge_interval
+        self.hits = 0
+        self.misses = 0
+        self.purged = 0
+        self._patterns = compile_path_templates(self.ttls)
+        self._lock = threading.Lock()
+        self._next_purge = time.time() + purge_interval
+
+    def ttl_for(self, path: str) -> float:
+        template = match_path_template(self._patterns, path)
+        return self.ttls[template] if template is not None else self.default_ttl
+
+    @staticmethod
+    def make_key(method: str, path: str, params: Optional[dict] = None) -> str:
+        items = sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None)
+        return json.dumps([method.upper(), path, items], separators=(",", ":"))
+
+    def get(self, method: str, path: str, params: Optional[dict] = None,
+            json_loads: Optional[JsonDecoder] = None) -> Optional[Any]:
+        """Decoded body cached for the request, with ``json_loads`` (the fastest installed backend by default)."""
+        if method.upper() != "GET" or self.ttl_for(path) <= 0:
+            return None
+        key = self.make_key(method, path, params)
+        now = time.time()
+        entry = self.memory.get(key)
+        if entry is None and self.disk is not None:
+            entry = self.disk.get(key)
+            if entry is not None and entry[0] > now:
+                self.memory.set(key, *entry)
+        if entry is None or entry[0] <= now:
+            if entry is not None:
+                self.memory.delete(key)
+                if self.disk is not None:
+                    self.disk.delete(key)
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return (json_loads or loads)(entry[1])
+
+    def set(self, method: str, path: str, params: Optional[dict], body: bytes):
+        ttl = self.ttl_for(path)
+        if method.upper() != "GET" or ttl <= 0:
+            return
+        key = self.make_key(method, path, params)
+        now = time.time()
+        self.memory.set(key, now + ttl, body)
+        if self.disk is not None:
+            self.disk.set(key, now + ttl, body)
+        if now >= self._next_purge:
+            self.purge_expired(now)
+
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        """Delete every expired entry from memory and disk and return how many were deleted."""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._next_purge = now + self.purge_interval
+        purged = self.memory.purge_expired(now)
+        if self.disk is not None:
+            # Every entry in memory was also written to disk.
+            purged = self.disk.purge_expired(now)
+        with self._lock:
+            self.purged += purged
+        return purged
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def close(self):
+        if self.disk is not None:
+            self.disk.close()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.memory.evictions,
+            "purged": self.purged,
+            "entries": len(self.memory),
+            "bytes": self.memory.current_bytes,
+        }
@@ -1,138 +1,415 @@
-from typing import Optional
+from __future__ import annotations
 
-import httpx
-import pandas as pd
-from glom import glom
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
-from geckoterminal_py.base_client import GeckoTerminalClientBase
+from geckoterminal_py.base_client import EndpointRequest, GeckoTerminalClientBase
+from geckoterminal_py.cache import ResponseCache
+from geckoterminal_py.config import ConnectionConfig
+from geckoterminal_py.lazy import lazy_import
+from geckoterminal_py.metrics import ClientMetrics, RequestTrace
+from geckoterminal_py.panel import OHLCVPanel, build_ohlcv_panel
+from geckoterminal_py.rate_limiter import RateLimiter, RetryPolicy
+from geckoterminal_py.sinks import deliver
+from geckoterminal_py.streaming import AdaptiveInterval, SeenIds
 import geckoterminal_py.constants as CONSTANTS
 
+pd = lazy_import("pandas")
+httpx = lazy_import("httpx")
+
 
 class GeckoTerminalAsyncClient(GeckoTerminalClientBase):
-    def __init__(self, transport: Optional[httpx.MockTransport] = None):
-        if transport:
-            self.client = httpx.AsyncClient(headers=self.headers, transport=transport)
-        else:
-            self.client = httpx.AsyncClient(headers=self.headers)
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None,
+                 rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None,
+                 cache: Optional[ResponseCache] = None,
+                 coalesce_requests: bool = True, connection_config: Optional[ConnectionConfig] = None,
+                 http_client: Optional[httpx.AsyncClient] = None, result_format: str = "pandas",
+                 json_backend: str = "auto", metrics: Optional[ClientMetrics] = None, tracer: Optional[Any] = None):
+        self.configure_client(httpx.AsyncClient, transport, rate_limiter, retry_policy, cache, connection_config,
+                              http_client, result_format, json_backend, metrics, tracer)
+        self.coalesce_requests = coalesce_requests
+        self._in_flight: Dict[str, asyncio.Future] = {}
 
     async def api_request(self, method: str, path: str, params: Optional[dict] = None) -> dict:
+        with self.trace_request(method, path) as trace:
+            cached = self.cached_response(method, path, params, trace)
+            if cached is not None:
+                return cached
+            return self.decode_response(await self._fetch(method, path, params, trace), trace)
+
+    async def _fetch(self, method: str, path: str, params: Optional[dict] = None,
+                     trace: Optional[RequestTrace] = None) -> bytes:
+        if not self.coalesce_requests:
+            return await self._send_request(method, path, params, trace)
+        # Single-flight: identical concurrent requests share one in-flight HTTP call. Each caller decodes
+        # its own copy of the body since endpoint methods are free to mutate the response they get.
+        key = ResponseCache.make_key(method, path, params)
+        in_flight = self._in_flight.get(key)
+        if in_flight is None:
+            in_flight = asyncio.ensure_future(self._send_request(method, path, params, trace))
+            self._in_flight[key] = in_flight
+            in_flight.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        elif trace is not None:
+            trace.coalesced = True
+        return await asyncio.shield(in_flight)
+
+    async def _send_request(self, method: str, path: str, params: Optional[dict] = None,
+                            trace: Optional[RequestTrace] = None) -> bytes:
         url = f"{self.base_url}/{path}"
-        response = await self.client.request(method, url, params=params)
-        response.raise_for_status()
-        return response.json()
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                started = time.perf_counter()
+                await self.rate_limiter.acquire_async()
+                self.record_limiter_wait(trace, started)
+            started = time.perf_counter()
+            response = await self.client.request(method, url, params=params, headers=self._request_headers)
+            delay = self.check_response(method, path, params, response, attempt, trace, started)
+            if delay is None:
+                return response.content
+            if delay:
+                await asyncio.sleep(delay)
+            attempt += 1
 
     async def close(self):
-        await self.client.aclose()
-
-    async def get_networks(self) -> pd.DataFrame:
-        response = await self.api_request("GET", CONSTANTS.GET_NETWORKS_PATH)
-        networks = glom(response, CONSTANTS.NETWORK_SPEC)
-        return pd.DataFrame(networks)
-
-    async def get_dexes_by_network(self, network_id: str) -> pd.DataFrame:
-        response = await self.api_request("GET", CONSTANTS.GET_DEXES_BY_NETWORK_PATH.format(network_id))
-        dexes_by_network = glom(response, CONSTANTS.DEXES_BY_NETWORK_SPEC)
-        return pd.DataFrame(dexes_by_network)
-
-    async def get_trending_pools(self) -> pd.DataFrame:
-        response = await self.api_request("GET", CONSTANTS.GET_TRENDING_POOLS_PATH)
-        trending_pools = glom(response, CONSTANTS.POOL_SPEC)
-        return self.process_pools_list(trending_pools)
-
-    async def get_trending_pools_by_network(self, network_id: str) -> pd.DataFrame:
-        response = await self.api_request("GET", CONSTANTS.GET_TRENDING_POOLS_BY_NETWORK_PATH.format(network_id))
-        trending_pools_by_network = glom(response, CONSTANTS.POOL_SPEC)
-        return self.process_pools_list(trending_pools_by_network)
-
-    async def get_top_pools_by_network(self, network_id: str) -> pd.DataFrame:
-        response = await self.api_request("GET", CONSTANTS.GET_TOP_POOLS_BY_NETWORK_PATH.format(network_id))
-        top_pools_by_network = glom(response, CONSTANTS.POOL_SPEC)
-        return self.process_pools_list(top_pools_by_network)
-
-    async def get_top_pools_by_network_dex(self, network_id: str, dex_id: str) -> pd.DataFrame:
-        response = await self.api_request("GET", CONSTANTS.GET_TOP_POOLS_BY_NETWORK_DEX_PATH.format(network_id, dex_id))
-        top_pools_by_dex = glom(response, CONSTANTS.POOL_SPEC)
-        return self.process_pools_list(top_pools_by_dex)
-
-    async def get_pool_by_network_address(self, network_id: str, pool_address: str) -> pd.DataFrame:
-        response = await self.api_request("GET", CONSTANTS.GET_POOL_BY_NETWORK_AND_ADDRESS_PATH.format(network_id, pool_address))
-        response["data"] = [response["data"]]
-        pool = glom(response, CONSTANTS.POOL_SPEC)
-        return pd.DataFrame(pool)
-
-    async def get_multiple_pools_by_network(self, network_id: str, pool_addresses: list) -> pd.DataFrame:
-        pools_str = ",".join(pool_addresses)
-        response = await self.api_request("GET", CONSTANTS.GET_MULTIPLE_POOLS_BY_NETWORK_PATH.format(network_id, pools_str))
-        pools = glom(response, CONSTANTS.POOL_SPEC)
-        return pd.DataFrame(pools)
-
-    async def get_new_pools_by_network(self, network_id: str) -> pd.DataFrame:
-        response = await self.api_request("GET", CONSTANTS.GET_NEW_POOLS_BY_NETWORK_PATH.format(network_id))
-        new_pools_by_network = glom(response, CONSTANTS.POOL_SPEC)
-        return self.process_pools_list(new_pools_by_network)
-
-    async def get_new_pools_all_networks(self) -> pd.DataFrame:
-        response = await self.api_request("GET", CONSTANTS.GET_NEW_POOLS_ALL_NETWORKS_PATH)
-        new_pools_all_networks = glom(response, CONSTANTS.POOL_SPEC)
-        return self.process_pools_list(new_pools_all_networks)
-
-    async def get_top_pools_by_network_token(self, network_id: str, token_id: str) -> pd.DataFrame:
-        response = await self.api_request("GET", CONSTANTS.GET_TOP_POOLS_BY_NETWORK_TOKEN_PATH.format(network_id, token_id))
-        top_pools_by_token = glom(response, CONSTANTS.POOL_SPEC)
-        return self.process_pools_list(top_pools_by_token)
-
-    async def get_specific_token_on_network(self, network_id: str, token_id: str) -> pd.DataFrame:
-        response = await self.api_request("GET", CONSTANTS.GET_SPECIFIC_TOKEN_ON_NETWORK_PATH.format(network_id, token_id))
-        return response["data"]
-
-    async def get_simple_token_price(self, network_id: str, token_addresses: list,
-                                     include_market_cap: bool = False, mcap_fdv_fallback: bool = False,
-                                     include_24hr_vol: bool = False, include_24hr_price_change: bool = False,
-                                     include_total_reserve_in_usd: bool = False) -> pd.DataFrame:
-        if not token_addresses:
-            return pd.DataFrame(columns=["token_address", "price_usd"])
-        if len(token_addresses) > CONSTANTS.SIMPLE_TOKEN_PRICE_MAX_ADDRESSES:
-            raise ValueError(f"A maximum of {CONSTANTS.SIMPLE_TOKEN_PRICE_MAX_ADDRESSES} token addresses can be "
-                             f"requested per call, got {len(token_addresses)}.")
-        addresses_str = ",".join(token_addresses)
-        params = {
-            "include_market_cap": str(include_market_cap).lower(),
-            "mcap_fdv_fallback": str(mcap_fdv_fallback).lower(),
-            "include_24hr_vol": str(include_24hr_vol).lower(),
-            "include_24hr_price_change": str(include_24hr_price_change).lower(),
-            "include_total_reserve_in_usd": str(include_total_reserve_in_usd).lower(),
-        }
-        response = await self.api_request(
-            "GET", CONSTANTS.GET_SIMPLE_TOKEN_PRICE_PATH.format(network_id, addresses_str), params=params)
-        return self.process_simple_token_price(response)
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def __aenter__(self) -> "GeckoTerminalAsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def execute(self, request: EndpointRequest) -> Any:
+        """Send a request planned by one of the base ``plan_*`` methods and parse its response."""
+        response = await self.api_request("GET", request.path, request.params) if request.path is not None else None
+        return self.parse_response(request, response)
+
+    async def get_networks(self, page: Optional[int] = None, result_format: Optional[str] = None) -> pd.DataFrame:
+        return await self.execute(self.plan_networks(page, result_format))
+
+    async def get_dexes_by_network(self, network_id: str, page: Optional[int] = None,
+                                   result_format: Optional[str] = None) -> pd.DataFrame:
+        return await self.execute(self.plan_dexes_by_network(network_id, page, result_format))
+
+    async def get_trending_pools(self, result_format: Optional[str] = None) -> pd.DataFrame:
+        return await self.execute(self.plan_trending_pools(result_format))
+
+    async def get_trending_pools_by_network(self, network_id: str, page: Optional[int] = None,
+                                            result_format: Optional[str] = None) -> pd.DataFrame:
+        return await self.execute(self.plan_trending_pools_by_network(network_id, page, result_format))
+
+    async def get_top_pools_by_network(self, network_id: str, page: Optional[int] = None,
+                                       result_format: Optional[str] = None) -> pd.DataFrame:
+        return await self.execute(self.plan_top_pools_by_network(network_id, page, result_format))
+
+    async def get_top_pools_by_network_dex(self, network_id: str, dex_id: str, page: Optional[int] = None,
+                                           result_format: Optional[str] = None) -> pd.DataFrame:
+        return await self.execute(self.plan_top_pools_by_network_dex(network_id, dex_id, page, result_format))
+
+    async def get_top_pools_by_network_token(self, network_id: str, token_id: str,
+                                             result_format: Optional[str] = None) -> pd.DataFrame:
+        return await self.execute(self.plan_top_pools_by_network_token(network_id, token_id, result_format))
+
+    async def get_new_pools_by_network(self, network_id: str, page: Optional[int] = None,
+                                       result_format: Optional[str] = None) -> pd.DataFrame:
+        return await self.execute(self.plan_new_pools_by_network(network_id, page, result_format))
+
+    async def get_new_pools_all_networks(self, result_format: Optional[str] = None) -> pd.DataFrame:
+        return await self.execute(self.plan_new_pools_all_networks(result_format))
+
+    async def get_pool_by_network_address(self, network_id: str, pool_address: str,
+                                          result_format: Optional[str] = None) -> pd.DataFrame:
+        return await self.execute(self.plan_pool_by_network_address(network_id, pool_address, result_format))
+
+    async def get_multiple_pools_by_network(self, network_id: str, pool_addresses: list,
+                                            result_format: Optional[str] = None) -> pd.DataFrame:
+        return await self.execute(self.plan_multiple_pools_by_network(network_id, pool_addresses, result_format))
+
+    async def get_specific_token_on_network(self, network_id: str, token_id: str) -> dict:
+        return await self.execute(self.plan_specific_token_on_network(network_id, token_id))
+
+    async def get_simple_token_price(self, network_id: str, token_addresses: list, include_market_cap: bool = False,
+                                     mcap_fdv_fallback: bool = False, include_24hr_vol: bool = False,
+                                     include_24hr_price_change: bool = False,
+                                     include_total_reserve_in_usd: bool = False,
+                                     result_format: Optional[str] = None) -> pd.DataFrame:
+        return await self.execute(self.plan_simple_token_price(network_id, token_addresses, include_market_cap,
+                                                               mcap_fdv_fallback, include_24hr_vol,
+                                                               include_24hr_price_change,
+                                                               include_total_reserve_in_usd, result_format))
 
     async def get_ohlcv(self, network_id: str, pool_address: str, timeframe: str, before_timestamp: int = None,
-                        currency: str = "usd", token: str = "base", limit: int = 1000) -> pd.DataFrame:
-        if timeframe not in self.ohlcv_timeframes:
-            raise ValueError(f"Timeframe {timeframe} is not supported. Please select one timeframe of the following"
-                             f"list {self.ohlcv_timeframes}")
-        timeframe, period = self.get_timeframe_and_period(timeframe)
-        params = {
-            "aggregate": period,
-            "limit": limit,
-            "currency": currency,
-            "token": token,
-        }
-        if before_timestamp:
-            params["before_timestamp"] = before_timestamp
-        response = await self.api_request("GET",
-                                          CONSTANTS.GET_OHLCV_DATA_PATH.format(network_id, pool_address, timeframe),
-                                          params=params)
-
-        df = pd.DataFrame(response["data"]["attributes"]["ohlcv_list"],
-                          columns=["timestamp", "open", "high", "low", "close", "volume_usd"])
-        df["datetime"] = pd.to_datetime(df["timestamp"], unit="s")
-        return df.drop_duplicates(subset="timestamp").sort_values("datetime").reset_index(drop=True)
-
-    async def get_trades(self, network: str, pool_address: str, trade_volume_filter: Optional[float]) -> pd.DataFrame:
-        response = await self.api_request("GET", CONSTANTS.GET_TRADES_BY_NETWORK_POOL_PATH.format(network, pool_address),
-                                          params={"trade_volume_in_usd_greater_than": trade_volume_filter})
-        trades = glom(response, CONSTANTS.TRADES_SPEC)
-        return pd.DataFrame(trades)
+                        currency: str = "usd", token: str = "base", limit: int = 1000,
+                        result_format: Optional[str] = None) -> pd.DataFrame:
+        return await self.execute(self.plan_ohlcv(network_id, pool_address, timeframe, before_timestamp, currency,
+                                                  token, limit, result_format))
+
+    async def get_trades(self, network: str, pool_address: str, trade_volume_filter: Optional[float] = None,
+                         result_format: Optional[str] = None) -> pd.DataFrame:
+        return await self.execute(self.plan_trades(network, pool_address, trade_volume_filter, result_format))
+
+    async def iter_pages(self, fetch_page: Callable[..., Any], *args, max_pages: Optional[int] = None,
+                         prefetch: bool = True, result_format: Optional[str] = None,
+                         **kwargs) -> AsyncIterator[Any]:
+        """Yield the pages of a paginated endpoint method from page 1 until an empty page or ``max_pages``.
+
+        With ``prefetch`` the next page is requested in a task while the caller processes the current one,
+        so only one page beyond the one being processed is ever held in memory.
+        """
+        page, pending = 1, None
+        try:
+            while max_pages is None or page <= max_pages:
+                if pending is not None:
+                    result = await pending
+                else:
+                    result = await fetch_page(*args, page=page, result_format=result_format, **kwargs)
+                pending = None
+                if not len(result):
+                    return
+                if prefetch and (max_pages is None or page < max_pages):
+                    pending = asyncio.ensure_future(fetch_page(*args, page=page + 1, result_format=result_format,
+                                                               **kwargs))
+                yield result
+                page += 1
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    def iter_networks(self, max_pages: Optional[int] = None, prefetch: bool = True,
+                      result_format: Optional[str] = None) -> AsyncIterator[pd.DataFrame]:
+        return self.iter_pages(self.get_networks, max_pages=max_pages, prefetch=prefetch,
+                               result_format=result_format)
+
+    def iter_dexes_by_network(self, network_id: str, max_pages: Optional[int] = None, prefetch: bool = True,
+                              result_format: Optional[str] = None) -> AsyncIterator[pd.DataFrame]:
+        return self.iter_pages(self.get_dexes_by_network, network_id, max_pages=max_pages, prefetch=prefetch,
+                               result_format=result_format)
+
+    def iter_top_pools_by_network(self, network_id: str, max_pages: Optional[int] = None, prefetch: bool = True,
+                                  result_format: Optional[str] = None) -> AsyncIterator[pd.DataFrame]:
+        return self.iter_pages(self.get_top_pools_by_network, network_id, max_pages=max_pages, prefetch=prefetch,
+                               result_format=result_format)
+
+    def iter_top_pools_by_network_dex(self, network_id: str, dex_id: str, max_pages: Optional[int] = None,
+                                      prefetch: bool = True,
+                                      result_format: Optional[str] = None) -> AsyncIterator[pd.DataFrame]:
+        return self.iter_pages(self.get_top_pools_by_network_dex, network_id, dex_id, max_pages=max_pages,
+                               prefetch=prefetch, result_format=result_format)
+
+    def iter_new_pools_by_network(self, network_id: str, max_pages: Optional[int] = None, prefetch: bool = True,
+                                  result_format: Optional[str] = None) -> AsyncIterator[pd.DataFrame]:
+        return self.iter_pages(self.get_new_pools_by_network, network_id, max_pages=max_pages, prefetch=prefetch,
+                               result_format=result_format)
+
+    # Per-network pool lists covered by the market scan, by the name used in its ``kinds`` argument.
+
+    SCAN_POOL_ENDPOINTS = {
+        "trending": "get_trending_pools_by_network",
+        "new": "get_new_pools_by_network",
+        "top": "get_top_pools_by_network",
+    }
+
+    async def iter_network_pools(self, network_ids: Optional[List[str]] = None,
+                                 kinds: Iterable[str] = ("trending", "new", "top"), pages: int = 1,
+                                 max_concurrency: int = 10) -> AsyncIterator[Tuple[str, pd.DataFrame]]:
+        """Fetch the pool lists of many networks concurrently, yielding ``(network_id, pools)`` per network.
+
+        Every (network, list, page) request runs as its own task, at most ``max_concurrency`` at once and
+        paced by the client's rate limiter, and a network is yielded as soon as all of its requests are done.
+        ``network_ids`` defaults to every network, read from all pages of ``get_networks``. Each frame holds a pool once,
+        with a ``pool_list`` column naming the first of ``kinds`` it was found in.
+        """
+        kinds = list(kinds)
+        unknown = set(kinds) - set(self.SCAN_POOL_ENDPOINTS)
+        if unknown:
+            raise ValueError(f"Unknown pool lists {sorted(unknown)}, "
+                             f"expected some of {list(self.SCAN_POOL_ENDPOINTS)}.")
+        if network_ids is None:
+            network_ids = [network_id async for networks in self.iter_networks(result_format="pandas")
+                           for network_id in networks["id"]]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_page(network_id: str, kind: str, page: int) -> pd.DataFrame:
+            async with semaphore:
+                pools = await getattr(self, self.SCAN_POOL_ENDPOINTS[kind])(network_id, page=page,
+                                                                            result_format="pandas")
+            pools["pool_list"] = kind
+            return pools
+
+        async def scan_network(network_id: str) -> Tuple[str, pd.DataFrame]:
+            frames = await asyncio.gather(*(fetch_page(network_id, kind, page)
+                                            for kind in kinds for page in range(1, pages + 1)))
+            return network_id, self.merge_pool_frames(frames)
+
+        tasks = [asyncio.ensure_future(scan_network(network_id)) for network_id in network_ids]
+        try:
+            for next_network in asyncio.as_completed(tasks):
+                yield await next_network
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def scan_pools(self, network_ids: Optional[List[str]] = None,
+                         kinds: Iterable[str] = ("trending", "new", "top"), pages: int = 1,
+                         max_concurrency: int = 10,
+                         on_network: Optional[Callable[[str, pd.DataFrame], Any]] = None,
+                         result_format: Optional[str] = None) -> pd.DataFrame:
+        """Scan the trending, new and top pools of every network into one deduplicated pool universe.
+
+        See ``iter_network_pools`` for the fan-out; ``on_network`` is called with each network's pools as
+        soon as they arrive.
+        """
+        frames = []
+        async for network_id, pools in self.iter_network_pools(network_ids, kinds, pages, max_concurrency):
+            if on_network is not None:
+                on_network(network_id, pools)
+            frames.append(pools)
+        return self.build_frame_result(self.merge_pool_frames(frames), result_format)
+
+    async def get_simple_token_price_bulk(self, network_id: str, token_addresses: list,
+                                          include_market_cap: bool = False, mcap_fdv_fallback: bool = False,
+                                          include_24hr_vol: bool = False, include_24hr_price_change: bool = False,
+                                          include_total_reserve_in_usd: bool = False,
+                                          max_concurrency: int = 5,
+                                          result_format: Optional[str] = None) -> pd.DataFrame:
+        """Fetch prices for any number of addresses by splitting them into concurrent per-request chunks.
+
+        Duplicate addresses are requested once and the result always carries every price column.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_chunk(chunk: list) -> pd.DataFrame:
+            async with semaphore:
+                return await self.get_simple_token_price(network_id, chunk, include_market_cap, mcap_fdv_fallback,
+                                                         include_24hr_vol, include_24hr_price_change,
+                                                         include_total_reserve_in_usd, result_format="pandas")
+
+        frames = await asyncio.gather(*(fetch_chunk(chunk) for chunk in self.chunk_token_addresses(token_addresses)))
+        return self.build_frame_result(self.merge_simple_token_prices(frames), result_format)
+
+    async def get_ohlcv_range(self, network_id: str, pool_address: str, timeframe: str,
+                              start: Union[int, datetime], end: Union[int, datetime],
+                              currency: str = "usd", token: str = "base", limit: int = 1000,
+                              max_concurrency: int = 5,
+                              result_format: Optional[str] = None) -> pd.DataFrame:
+        """Fetch every candle between ``start`` and ``end`` with concurrent ``before_timestamp`` pages.
+
+        At most ``max_concurrency`` page requests are in flight at once.
+        """
+        start, end = self.to_unix_timestamp(start), self.to_unix_timestamp(end)
+        pages = await self.fetch_ohlcv_pages(network_id, pool_address, timeframe, start, end, currency, token,
+                                             limit, asyncio.Semaphore(max_concurrency))
+        return self.build_frame_result(self.process_ohlcv_pages(pages, start, end), result_format)
+
+    async def fetch_ohlcv_pages(self, network_id: str, pool_address: str, timeframe: str, start: int, end: int,
+                                currency: str, token: str, limit: int, semaphore: asyncio.Semaphore) -> List[list]:
+        """Raw ``ohlcv_list`` pages covering ``[start, end]``, fetched concurrently under ``semaphore``."""
+        windows = self.plan_ohlcv_windows(timeframe, start, end, limit)
+
+        async def fetch_page(before_timestamp: int, page_limit: int) -> list:
+            path, params = self.build_ohlcv_request(network_id, pool_address, timeframe, before_timestamp,
+                                                    currency, token, page_limit)
+            async with semaphore:
+                response = await self.api_request("GET", path, params=params)
+            return response["data"]["attributes"]["ohlcv_list"]
+
+        return list(await asyncio.gather(*(fetch_page(before, page_limit) for before, page_limit in windows)))
+
+    async def get_ohlcv_panel(self, pools: Iterable[Tuple[str, str]], timeframe: str,
+                              start: Union[int, datetime], end: Union[int, datetime],
+                              currency: str = "usd", token: str = "base", limit: int = 1000,
+                              max_concurrency: int = 10) -> OHLCVPanel:
+        """Fetch the candles of many ``(network_id, pool_address)`` pairs into one aligned ``OHLCVPanel``.
+
+        The pages of every pool are fetched concurrently, at most ``max_concurrency`` in flight overall.
+        """
+        pools = list(pools)
+        start, end = self.to_unix_timestamp(start), self.to_unix_timestamp(end)
+        # Rejects an unsupported timeframe or an inverted window before anything is fetched, even without pools.
+        self.plan_ohlcv_windows(timeframe, start, end, limit)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        pool_pages = await asyncio.gather(*(
+            self.fetch_ohlcv_pages(network_id, pool_address, timeframe, start, end, currency, token, limit,
+                                   semaphore)
+            for network_id, pool_address in pools))
+        return build_ohlcv_panel(pools, pool_pages, self.ohlcv_timeframe_seconds[timeframe], start, end)
+
+    async def stream_trades(self, network: str, pool_address: str, interval: float = 10.0,
+                            trade_volume_filter: Optional[float] = None, min_interval: float = 2.0,
+                            max_interval: float = 60.0, max_seen_ids: int = 10_000) -> AsyncIterator[pd.DataFrame]:
+        """Poll a pool's trades forever, yielding only trades not seen before in block order.
+
+        The poll interval starts at ``interval`` and adapts between ``min_interval`` and ``max_interval``
+        to how many new trades each poll found. Seen trade ids are kept in a set bounded by
+        ``max_seen_ids``, which should stay well above the size of one trades page.
+        """
+        seen_ids = SeenIds(max_seen_ids)
+        poll_interval = AdaptiveInterval(interval, min_interval, max_interval)
+        first_poll = True
+        while True:
+            trades = await self.get_trades(network, pool_address, trade_volume_filter, result_format="pandas")
+            new_trades = trades[[trade_id not in seen_ids for trade_id in trades["id"]]]
+            if not new_trades.empty:
+                new_trades = new_trades.sort_values(["block_number", "block_timestamp"], kind="stable")
+                seen_ids.add_many(new_trades["id"])
+                yield new_trades.reset_index(drop=True)
+            sleep_for = poll_interval.current if first_poll else poll_interval.update(len(new_trades), len(trades))
+            first_poll = False
+            await asyncio.sleep(sleep_for)
+
+    async def iter_trade_history(self, network: str, pool_address: str,
+                                 start: Optional[Union[int, datetime]] = None,
+                                 end: Optional[Union[int, datetime]] = None,
+                                 start_block: Optional[int] = None, end_block: Optional[int] = None,
+                                 volume_thresholds: Optional[Sequence[Optional[float]]] = None,
+                                 max_concurrency: int = 5) -> AsyncIterator[pd.DataFrame]:
+        """Yield a pool's trades within a time and/or block window in chunks, each trade once.
+
+        The trades endpoint has no block, timestamp or page parameter: it returns the latest
+        ``TRADES_PAGE_MAX_TRADES`` trades of the past 24 hours above an optional minimum volume. Every
+        minimum volume of ``volume_thresholds`` (``TRADES_HISTORY_VOLUME_THRESHOLDS`` by default, where None
+        is the unfiltered page) is fetched as its own window, concurrently under
+        ``max_concurrency`` and the client's rate limiter, which reaches further back in time for larger
+        trades once the unfiltered page is full. Each window's new trades inside ``[start, end]`` and
+        ``[start_block, end_block]`` are yielded as one chunk in block order as soon as it arrives, so
+        chunks are not ordered with each other.
+        """
+        start = self.to_unix_timestamp(start) if start is not None else None
+        end = self.to_unix_timestamp(end) if end is not None else None
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_window(threshold: Optional[float]) -> pd.DataFrame:
+            async with semaphore:
+                return await self.get_trades(network, pool_address, threshold, result_format="pandas")
+
+        thresholds = dict.fromkeys(volume_thresholds or CONSTANTS.TRADES_HISTORY_VOLUME_THRESHOLDS)
+        tasks = [asyncio.ensure_future(fetch_window(threshold)) for threshold in thresholds]
+        seen_ids = set()
+        try:
+            for next_window in asyncio.as_completed(tasks):
+                chunk = self.select_trades(await next_window, seen_ids, start, end, start_block, end_block)
+                if not chunk.empty:
+                    yield chunk
+        finally:
+            for task in tasks:
+                task.cancel()
 
+    async def backfill_trades(self, network: str, pool_address: str,
+                              callback: Optional[Callable[[pd.DataFrame], Any]] = None,
+                              queue: Optional[asyncio.Queue] = None, **kwargs) -> int:
+        """Stream the ``iter_trade_history`` chunks to ``callback`` (sync or async) and/or ``queue``.
 
+        ``callback`` can be a ``ParquetSink`` to write the history to disk chunk by chunk. Keyword
+        arguments go to ``iter_trade_history``. Returns the number of trades delivered.
+        """
+        if callback is None and queue is None:
+            raise ValueError("Pass a callback and/or a queue to receive the trades.")
+        delivered = 0
+        async for chunk in self.iter_trade_history(network, pool_address, **kwargs):
+            await deliver(chunk, callback, queue)
+            delivered += len(chunk)
+        return delivered
@@ -1,110 +1,278 @@
-from typing import Optional
+from __future__ import annotations
 
-import httpx
-import pandas as pd
-from glom import glom
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
 
-from geckoterminal_py.base_client import GeckoTerminalClientBase
-import geckoterminal_py.constants as CONSTANTS
+from geckoterminal_py.base_client import EndpointRequest, GeckoTerminalClientBase
+from geckoterminal_py.batch import BatchCall, BatchResult, resolve_call
+from geckoterminal_py.cache import ResponseCache
+from geckoterminal_py.config import ConnectionConfig
+from geckoterminal_py.lazy import lazy_import
+from geckoterminal_py.metrics import ClientMetrics, RequestTrace
+from geckoterminal_py.panel import OHLCVPanel, build_ohlcv_panel
+from geckoterminal_py.rate_limiter import RateLimiter, RetryPolicy
+
+pd = lazy_import("pandas")
+httpx = lazy_import("httpx")
 
 
 class GeckoTerminalSyncClient(GeckoTerminalClientBase):
-    def __init__(self, transport: Optional[httpx.MockTransport] = None):
-        if transport:
-            self.client = httpx.Client(headers=self.headers, transport=transport)
-        else:
-            self.client = httpx.Client(headers=self.headers)
+    def __init__(self, transport: Optional[httpx.BaseTransport] = None,
+                 rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None,
+                 cache: Optional[ResponseCache] = None, connection_config: Optional[ConnectionConfig] = None,
+                 http_client: Optional[httpx.Client] = None, result_format: str = "pandas",
+                 json_backend: str = "auto", metrics: Optional[ClientMetrics] = None, tracer: Optional[Any] = None):
+        self.configure_client(httpx.Client, transport, rate_limiter, retry_policy, cache, connection_config,
+                              http_client, result_format, json_backend, metrics, tracer)
 
     def api_request(self, method: str, path: str, params: Optional[dict] = None) -> dict:
+        with self.trace_request(method, path) as trace:
+            cached = self.cached_response(method, path, params, trace)
+            if cached is not None:
+                return cached
+            return self.decode_response(self._send_request(method, path, params, trace), trace)
+
+    def _send_request(self, method: str, path: str, params: Optional[dict] = None,
+                      trace: Optional[RequestTrace] = None) -> bytes:
         url = f"{self.base_url}/{path}"
-        response = self.client.request(method, url, params=params)
-        response.raise_for_status()
-        return response.json()
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                started = time.perf_counter()
+                self.rate_limiter.acquire()
+                self.record_limiter_wait(trace, started)
+            started = time.perf_counter()
+            response = self.client.request(method, url, params=params, headers=self._request_headers)
+            delay = self.check_response(method, path, params, response, attempt, trace, started)
+            if delay is None:
+                return response.content
+            if delay:
+                time.sleep(delay)
+            attempt += 1
 
     def close(self):
-        self.client.close()
-
-    def get_networks(self) -> pd.DataFrame:
-        response = self.api_request("GET", CONSTANTS.GET_NETWORKS_PATH)
-        networks = glom(response, CONSTANTS.NETWORK_SPEC)
-        return pd.DataFrame(networks)
-
-    def get_dexes_by_network(self, network_id: str) -> pd.DataFrame:
-        response = self.api_request("GET", CONSTANTS.GET_DEXES_BY_NETWORK_PATH.format(network_id))
-        dexes_by_network = glom(response, CONSTANTS.DEXES_BY_NETWORK_SPEC)
-        return pd.DataFrame(dexes_by_network)
-
-    def get_top_pools_by_network(self, network_id: str) -> pd.DataFrame:
-        response = self.api_request("GET", CONSTANTS.GET_TOP_POOLS_BY_NETWORK_PATH.format(network_id))
-        top_pools_by_network = glom(response, CONSTANTS.POOL_SPEC)
-        return self.process_pools_list(top_pools_by_network)
-
-    def get_top_pools_by_network_dex(self, network_id: str, dex_id: str) -> pd.DataFrame:
-        response = self.api_request("GET", CONSTANTS.GET_TOP_POOLS_BY_NETWORK_DEX_PATH.format(network_id, dex_id))
-        top_pools_by_dex = glom(response, CONSTANTS.POOL_SPEC)
-        return self.process_pools_list(top_pools_by_dex)
-
-    def get_top_pools_by_network_token(self, network_id: str, token_id: str) -> pd.DataFrame:
-        response = self.api_request("GET", CONSTANTS.GET_TOP_POOLS_BY_NETWORK_TOKEN_PATH.format(network_id, token_id))
-        top_pools_by_token = glom(response, CONSTANTS.POOL_SPEC)
-        return self.process_pools_list(top_pools_by_token)
-
-    def get_new_pools_by_network(self, network_id: str) -> pd.DataFrame:
-        response = self.api_request("GET", CONSTANTS.GET_NEW_POOLS_BY_NETWORK_PATH.format(network_id))
-        new_pools_by_network = glom(response, CONSTANTS.POOL_SPEC)
-        return self.process_pools_list(new_pools_by_network)
-
-    def get_new_pools_all_networks(self) -> pd.DataFrame:
-        response = self.api_request("GET", CONSTANTS.GET_NEW_POOLS_ALL_NETWORKS_PATH)
-        new_pools_all_networks = glom(response, CONSTANTS.POOL_SPEC)
-        return self.process_pools_list(new_pools_all_networks)
-
-    def get_pool_by_network_address(self, network_id: str, pool_address: str) -> pd.DataFrame:
-        response = self.api_request("GET", CONSTANTS.GET_POOL_BY_NETWORK_AND_ADDRESS_PATH.format(network_id, pool_address))
-        pool = glom(response, CONSTANTS.POOL_SPEC)
-        return pd.DataFrame(pool)
+        if self._owns_client:
+            self.client.close()
+
+    def __enter__(self) -> "GeckoTerminalSyncClient":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def execute(self, request: EndpointRequest) -> Any:
+        """Send a request planned by one of the base ``plan_*`` methods and parse its response."""
+        response = self.api_request("GET", request.path, request.params) if request.path is not None else None
+        return self.parse_response(request, response)
+
+    def get_networks(self, page: Optional[int] = None, result_format: Optional[str] = None) -> pd.DataFrame:
+        return self.execute(self.plan_networks(page, result_format))
+
+    def get_dexes_by_network(self, network_id: str, page: Optional[int] = None,
+                             result_format: Optional[str] = None) -> pd.DataFrame:
+        return self.execute(self.plan_dexes_by_network(network_id, page, result_format))
+
+    def get_trending_pools(self, result_format: Optional[str] = None) -> pd.DataFrame:
+        return self.execute(self.plan_trending_pools(result_format))
+
+    def get_trending_pools_by_network(self, network_id: str, page: Optional[int] = None,
+                                      result_format: Optional[str] = None) -> pd.DataFrame:
+        return self.execute(self.plan_trending_pools_by_network(network_id, page, result_format))
+
+    def get_top_pools_by_network(self, network_id: str, page: Optional[int] = None,
+                                 result_format: Optional[str] = None) -> pd.DataFrame:
+        return self.execute(self.plan_top_pools_by_network(network_id, page, result_format))
+
+    def get_top_pools_by_network_dex(self, network_id: str, dex_id: str, page: Optional[int] = None,
+                                     result_format: Optional[str] = None) -> pd.DataFrame:
+        return self.execute(self.plan_top_pools_by_network_dex(network_id, dex_id, page, result_format))
+
+    def get_top_pools_by_network_token(self, network_id: str, token_id: str,
+                                       result_format: Optional[str] = None) -> pd.DataFrame:
+        return self.execute(self.plan_top_pools_by_network_token(network_id, token_id, result_format))
+
+    def get_new_pools_by_network(self, network_id: str, page: Optional[int] = None,
+                                 result_format: Optional[str] = None) -> pd.DataFrame:
+        return self.execute(self.plan_new_pools_by_network(network_id, page, result_format))
+
+    def get_new_pools_all_networks(self, result_format: Optional[str] = None) -> pd.DataFrame:
+        return self.execute(self.plan_new_pools_all_networks(result_format))
+
+    def get_pool_by_network_address(self, network_id: str, pool_address: str,
+                                    result_format: Optional[str] = None) -> pd.DataFrame:
+        return self.execute(self.plan_pool_by_network_address(network_id, pool_address, result_format))
+
+    def get_multiple_pools_by_network(self, network_id: str, pool_addresses: list,
+                                      result_format: Optional[str] = None) -> pd.DataFrame:
+        return self.execute(self.plan_multiple_pools_by_network(network_id, pool_addresses, result_format))
+
+    def get_specific_token_on_network(self, network_id: str, token_id: str) -> dict:
+        return self.execute(self.plan_specific_token_on_network(network_id, token_id))
+
+    def get_simple_token_price(self, network_id: str, token_addresses: list, include_market_cap: bool = False,
+                               mcap_fdv_fallback: bool = False, include_24hr_vol: bool = False,
+                               include_24hr_price_change: bool = False, include_total_reserve_in_usd: bool = False,
+                               result_format: Optional[str] = None) -> pd.DataFrame:
+        return self.execute(self.plan_simple_token_price(network_id, token_addresses, include_market_cap,
+                                                         mcap_fdv_fallback, include_24hr_vol,
+                                                         include_24hr_price_change, include_total_reserve_in_usd,
+                                                         result_format))
 
     def get_ohlcv(self, network_id: str, pool_address: str, timeframe: str, before_timestamp: int = None,
-                  currency: str = "usd", token: str = "base", limit: int = 1000) -> pd.DataFrame:
-        if timeframe not in self.ohlcv_timeframes:
-            raise ValueError(f"Timeframe {timeframe} is not supported. Please select one timeframe of the following"
-                             f"list {self.ohlcv_timeframes}")
-        timeframe, period = self.get_timeframe_and_period(timeframe)
-        params = {
-            "aggregate": period,
-            "limit": limit,
-            "currency": currency,
-            "token": token,
-        }
-        if before_timestamp:
-            params["before_timestamp"] = before_timestamp
-        response = self.api_request("GET",
-                                    CONSTANTS.GET_OHLCV_DATA_PATH.format(network_id, pool_address, timeframe),
-                                    params=params)
-
-        df = pd.DataFrame(response["data"]["attributes"]["ohlcv_list"],
-                          columns=["timestamp", "open", "high", "low", "close", "volume_usd"])
-        df["datetime"] = pd.to_datetime(df["timestamp"], unit="s")
-        return df.drop_duplicates(subset="timestamp").sort_values("datetime").reset_index(drop=True)
-
-    def get_simple_token_price(self, network_id: str, token_addresses: list,
-                               include_market_cap: bool = False, mcap_fdv_fallback: bool = False,
-                               include_24hr_vol: bool = False, include_24hr_price_change: bool = False,
-                               include_total_reserve_in_usd: bool = False) -> pd.DataFrame:
-        if not token_addresses:
-            return pd.DataFrame(columns=["token_address", "price_usd"])
-        if len(token_addresses) > CONSTANTS.SIMPLE_TOKEN_PRICE_MAX_ADDRESSES:
-            raise ValueError(f"A maximum of {CONSTANTS.SIMPLE_TOKEN_PRICE_MAX_ADDRESSES} token addresses can be "
-                             f"requested per call, got {len(token_addresses)}.")
-        addresses_str = ",".join(token_addresses)
-        params = {
-            "include_market_cap": str(include_market_cap).lower(),
-            "mcap_fdv_fallback": str(mcap_fdv_fallback).lower(),
-            "include_24hr_vol": str(include_24hr_vol).lower(),
-            "include_24hr_price_change": str(include_24hr_price_change).lower(),
-            "include_total_reserve_in_usd": str(include_total_reserve_in_usd).lower(),
-        }
-        response = self.api_request(
-            "GET", CONSTANTS.GET_SIMPLE_TOKEN_PRICE_PATH.format(network_id, addresses_str), params=params)
-        return self.process_simple_token_price(response)
+                  currency: str = "usd", token: str = "base", limit: int = 1000,
+                  result_format: Optional[str] = None) -> pd.DataFrame:
+        return self.execute(self.plan_ohlcv(network_id, pool_address, timeframe, before_timestamp, currency, token,
+                                            limit, result_format))
+
+    def get_trades(self, network: str, pool_address: str, trade_volume_filter: Optional[float] = None,
+                   result_format: Optional[str] = None) -> pd.DataFrame:
+        return self.execute(self.plan_trades(network, pool_address, trade_volume_filter, result_format))
+
+    def batch(self, calls: Iterable[BatchCall], max_workers: int = 8) -> BatchResult:
+        """Run many endpoint calls on a thread pool sharing this client's connections, rate limiter and cache.
+
+        Each call is ``(method, args)`` or ``(method, args, kwargs)``, with ``method`` the name of a client
+        method or any callable. Results keep the input order and a failing call does not stop the batch:
+        its slot is left None and its exception is collected in ``errors``, as is the error of a call that cannot
+        be resolved, e.g. an unknown method name.
+        """
+        def run_call(call: BatchCall) -> Any:
+            function, args, kwargs = resolve_call(self, call)
+            return function(*args, **kwargs)
+
+        calls = list(calls)
+        batch_result = BatchResult(results=[None] * len(calls))
+        if not calls:
+            return batch_result
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+            futures = [executor.submit(run_call, call) for call in calls]
+        for index, future in enumerate(futures):
+            error = future.exception()
+            if error is not None:
+                batch_result.errors[index] = error
+            else:
+                batch_result.results[index] = future.result()
+        return batch_result
+
+    def map(self, method: Union[str, Callable], items: Iterable[Any], max_workers: int = 8,
+            **kwargs) -> BatchResult:
+        """``batch`` of one method over ``items``.
+
+        Each item is the call's only positional argument, or all of them when it is a tuple, and ``kwargs``
+        are passed to every call, e.g. ``client.map("get_pool_by_network_address", [("eth", address), ...])``.
+        """
+        return self.batch(((method, item if isinstance(item, tuple) else (item,), kwargs) for item in items),
+                          max_workers)
+
+    def iter_pages(self, fetch_page: Callable[..., Any], *args, max_pages: Optional[int] = None,
+                   prefetch: bool = True, result_format: Optional[str] = None, **kwargs) -> Iterator[Any]:
+        """Yield the pages of a paginated endpoint method from page 1 until an empty page or ``max_pages``.
+
+        With ``prefetch`` the next page is requested on a background thread while the caller processes the
+        current one, so only one page beyond the one being processed is ever held in memory.
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        page, pending = 1, None
+        try:
+            while max_pages is None or page <= max_pages:
+                if pending is not None:
+                    result = pending.result()
+                else:
+                    result = fetch_page(*args, page=page, result_format=result_format, **kwargs)
+                pending = None
+                if not len(result):
+                    return
+                if executor is not None and (max_pages is None or page < max_pages):
+                    pending = executor.submit(fetch_page, *args, page=page + 1, result_format=result_format,
+                                              **kwargs)
+                yield result
+                page += 1
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_networks(self, max_pages: Optional[int] = None, prefetch: bool = True,
+                      result_format: Optional[str] = None) -> Iterator[pd.DataFrame]:
+        return self.iter_pages(self.get_networks, max_pages=max_pages, prefetch=prefetch,
+                               result_format=result_format)
+
+    def iter_dexes_by_network(self, network_id: str, max_pages: Optional[int] = None, prefetch: bool = True,
+                              result_format: Optional[str] = None) -> Iterator[pd.DataFrame]:
+        return self.iter_pages(self.get_dexes_by_network, network_id, max_pages=max_pages, prefetch=prefetch,
+                               result_format=result_format)
+
+    def iter_top_pools_by_network(self, network_id: str, max_pages: Optional[int] = None, prefetch: bool = True,
+                                  result_format: Optional[str] = None) -> Iterator[pd.DataFrame]:
+        return self.iter_pages(self.get_top_pools_by_network, network_id, max_pages=max_pages, prefetch=prefetch,
+                               result_format=result_format)
+
+    def iter_top_pools_by_network_dex(self, network_id: str, dex_id: str, max_pages: Optional[int] = None,
+                                      prefetch: bool = True,
+                                      result_format: Optional[str] = None) -> Iterator[pd.DataFrame]:
+        return self.iter_pages(self.get_top_pools_by_network_dex, network_id, dex_id, max_pages=max_pages,
+                               prefetch=prefetch, result_format=result_format)
+
+    def iter_new_pools_by_network(self, network_id: str, max_pages: Optional[int] = None, prefetch: bool = True,
+                                  result_format: Optional[str] = None) -> Iterator[pd.DataFrame]:
+        return self.iter_pages(self.get_new_pools_by_network, network_id, max_pages=max_pages, prefetch=prefetch,
+                               result_format=result_format)
+
+    def get_ohlcv_range(self, network_id: str, pool_address: str, timeframe: str,
+                        start: Union[int, datetime], end: Union[int, datetime],
+                        currency: str = "usd", token: str = "base", limit: int = 1000,
+                        result_format: Optional[str] = None) -> pd.DataFrame:
+        """Fetch every candle between ``start`` and ``end`` by walking the planned ``before_timestamp`` pages."""
+        start, end = self.to_unix_timestamp(start), self.to_unix_timestamp(end)
+        pages = self.fetch_ohlcv_pages(network_id, pool_address, timeframe, start, end, currency, token, limit)
+        return self.build_frame_result(self.process_ohlcv_pages(pages, start, end), result_format)
+
+    def fetch_ohlcv_pages(self, network_id: str, pool_address: str, timeframe: str, start: int, end: int,
+                          currency: str = "usd", token: str = "base", limit: int = 1000) -> List[list]:
+        """Raw ``ohlcv_list`` pages covering ``[start, end]``, fetched one after the other."""
+        pages = []
+        for before_timestamp, page_limit in self.plan_ohlcv_windows(timeframe, start, end, limit):
+            path, params = self.build_ohlcv_request(network_id, pool_address, timeframe, before_timestamp,
+                                                    currency, token, page_limit)
+            response = self.api_request("GET", path, params=params)
+            pages.append(response["data"]["attributes"]["ohlcv_list"])
+        return pages
+
+    def get_ohlcv_panel(self, pools: Iterable[Tuple[str, str]], timeframe: str,
+                        start: Union[int, datetime], end: Union[int, datetime],
+                        currency: str = "usd", token: str = "base", limit: int = 1000,
+                        max_workers: int = 8) -> OHLCVPanel:
+        """Fetch the candles of many ``(network_id, pool_address)`` pairs into one aligned ``OHLCVPanel``.
+
+        Pools are fetched concurrently on a pool of ``max_workers`` threads.
+        """
+        pools = list(pools)
+        start, end = self.to_unix_timestamp(start), self.to_unix_timestamp(end)
+        # Rejects an unsupported timeframe or an inverted window before anything is fetched, even without pools.
+        self.plan_ohlcv_windows(timeframe, start, end, limit)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pools)))) as executor:
+            pool_pages = list(executor.map(
+                lambda pool: self.fetch_ohlcv_pages(pool[0], pool[1], timeframe, start, end, currency, token, limit),
+                pools))
+        return build_ohlcv_panel(pools, pool_pages, self.ohlcv_timeframe_seconds[timeframe], start, end)
+
+    def get_simple_token_price_bulk(self, network_id: str, token_addresses: list,
+                                    include_market_cap: bool = False, mcap_fdv_fallback: bool = False,
+                                    include_24hr_vol: bool = False, include_24hr_price_change: bool = False,
+                                    include_total_reserve_in_usd: bool = False,
+                                    max_workers: int = 5, result_format: Optional[str] = None) -> pd.DataFrame:
+        """Fetch prices for any number of addresses by splitting them into chunks run on a thread pool.
 
+        Duplicate addresses are requested once and the result always carries every price column.
+        """
+        chunks = self.chunk_token_addresses(token_addresses)
+        if not chunks:
+            return self.build_frame_result(self.merge_simple_token_prices([]), result_format)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            frames = list(executor.map(
+                lambda chunk: self.get_simple_token_price(network_id, chunk, include_market_cap, mcap_fdv_fallback,
+                                                          include_24hr_vol, include_24hr_price_change,
+                                                          include_total_reserve_in_usd, result_format="pandas"),
+                chunks))
+        return self.build_frame_result(self.merge_simple_token_prices(frames), result_format)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from geckoterminal_py.lazy import lazy_import
+
+httpx = lazy_import("httpx")
+
+
+@dataclass
+class ConnectionConfig:
+    """Connection pool, keep-alive, protocol and timeout settings for the clients' ``httpx`` client.
+
+    The defaults are the ``httpx`` ones. Raise ``max_connections`` for wide concurrent fan-outs and
+    ``keepalive_expiry`` to keep TLS connections warm between bursts. ``http2`` multiplexes requests over
+    few connections and needs the ``h2`` package (``pip install httpx[http2]``).
+    """
+
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 20
+    keepalive_expiry: Optional[float] = 5.0
+    http2: bool = False
+    connect_timeout: Optional[float] = 5.0
+    read_timeout: Optional[float] = 5.0
+    write_timeout: Optional[float] = 5.0
+    pool_timeout: Optional[float] = 5.0
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(max_connections=self.max_connections,
+                            max_keepalive_connections=self.max_keepalive_connections,
+                            keepalive_expiry=self.keepalive_expiry)
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(connect=self.connect_timeout, read=self.read_timeout, write=self.write_timeout,
+                             pool=self.pool_timeout)
+
+    def client_kwargs(self) -> Dict[str, Any]:
+        return {"limits": self.limits, "timeout": self.timeout, "http2": self.http2}
@@ -9,6 +9,8 @@ GET_TRENDING_POOLS_PATH = "networks/trending_pools"
 GET_TRENDING_POOLS_BY_NETWORK_PATH = "networks/{}/trending_pools"
 GET_POOL_BY_NETWORK_AND_ADDRESS_PATH = "networks/{}/pools/{}"
 GET_MULTIPLE_POOLS_BY_NETWORK_PATH = "networks/{}/pools/multi/{}"
+# GeckoTerminal accepts at most 30 pool addresses per multiple pools request.
+MULTIPLE_POOLS_MAX_ADDRESSES = 30
 GET_TOP_POOLS_BY_NETWORK_PATH = "networks/{}/pools"
 GET_TOP_POOLS_BY_NETWORK_DEX_PATH = "networks/{}/dexes/{}/pools"
 GET_NEW_POOLS_BY_NETWORK_PATH = "networks/{}/new_pools"
@@ -28,6 +30,11 @@ GET_OHLCV_DATA_PATH = "networks/{}/pools/{}/ohlcv/{}"
 
 # Trades
 GET_TRADES_BY_NETWORK_POOL_PATH = "networks/{}/pools/{}/trades"
+# The trades endpoint returns at most this many of the latest trades of the past 24 hours, newest first, and can
+# only be narrowed with a minimum trade volume in USD.
+TRADES_PAGE_MAX_TRADES = 300
+# Minimum volumes used to reach further back for larger trades once the unfiltered page is full.
+TRADES_HISTORY_VOLUME_THRESHOLDS = (None, 1_000, 10_000, 100_000, 1_000_000)
 
 # GLOM SPECS
 
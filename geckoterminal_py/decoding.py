@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import importlib
+import itertools
+import json
+from typing import Any, Callable, Sequence, Union
+
+from geckoterminal_py.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+JsonDecoder = Callable[[Union[bytes, str]], Any]
+
+# "auto" picks the first installed of orjson and msgspec and falls back to the standard library.
+JSON_BACKENDS = ("auto", "orjson", "msgspec", "json")
+
+
+def _load_backend(backend: str) -> JsonDecoder:
+    if backend == "json":
+        return json.loads
+    module = importlib.import_module(backend)
+    return module.loads if backend == "orjson" else module.json.Decoder().decode
+
+
+def get_json_decoder(backend: str = "auto") -> JsonDecoder:
+    """Return the ``loads`` function of a JSON backend; optional backends raise ImportError when missing."""
+    if backend not in JSON_BACKENDS:
+        raise ValueError(f"JSON backend {backend} is not supported. Please select one of {JSON_BACKENDS}")
+    if backend != "auto":
+        return _load_backend(backend)
+    for candidate in ("orjson", "msgspec"):
+        try:
+            return _load_backend(candidate)
+        except ImportError:
+            continue
+    return json.loads
+
+
+loads = get_json_decoder()
+
+
+def ohlcv_array(ohlcv_list: Sequence[Sequence[float]], width: int = 6) -> np.ndarray:
+    """Copy a decoded ``ohlcv_list`` into a ``(rows, width)`` float64 array.
+
+    The rows are streamed into a single preallocated buffer, which skips the per-row conversions
+    ``np.asarray`` does on a list of lists. Rows holding nulls or strings take the ``np.asarray`` path.
+    Rows without exactly ``width`` entries raise a ValueError instead of shifting the candles after them.
+    """
+    if isinstance(ohlcv_list, np.ndarray):
+        return ohlcv_list.astype(np.float64, copy=False).reshape(-1, width)
+    widths = set(map(len, ohlcv_list))
+    if widths - {width}:
+        raise ValueError(f"Every OHLCV row must hold {width} values, got rows of {sorted(widths)}.")
+    try:
+        values = np.fromiter(itertools.chain.from_iterable(ohlcv_list), dtype=np.float64,
+                             count=len(ohlcv_list) * width)
+    except (TypeError, ValueError):
+        values = np.asarray(ohlcv_list, dtype=np.float64)
+    return values.reshape(-1, width)
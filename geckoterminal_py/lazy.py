@@ -0,0 +1,32 @@
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+
+
+class _LazyModule(ModuleType):
+    """Stand-in for a module that imports it on the first attribute access it cannot answer.
+
+    The import goes through ``importlib.import_module``, whose per-module import lock makes threads that
+    touch the module at the same time wait for one complete import, unlike ``importlib.util.LazyLoader``
+    before Python 3.12. The real module's namespace is then copied in, so later lookups are plain
+    attribute reads.
+    """
+
+    def __getattr__(self, attribute: str):
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attribute)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return ``name`` as a module that is only imported on its first attribute access.
+
+    Keeps heavy dependencies such as pandas out of ``import geckoterminal_py`` for callers that never
+    touch them. A module that is already imported is returned as is.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    if importlib.util.find_spec(name) is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+    return _LazyModule(name)
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import bisect
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from geckoterminal_py.cache import compile_path_templates, match_path_template
+import geckoterminal_py.constants as CONSTANTS
+from geckoterminal_py.lazy import lazy_import
+
+httpx = lazy_import("httpx")
+
+# Upper bounds in seconds of the latency histogram buckets; the last bucket takes everything slower.
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_ENDPOINT_PATTERNS = compile_path_templates(
+    value for name, value in vars(CONSTANTS).items() if name.endswith("_PATH") and isinstance(value, str))
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(path: str) -> str:
+    """The ``constants.py`` path template a request path was built from, used as its endpoint name."""
+    return match_path_template(_ENDPOINT_PATTERNS, path) or path
+
+
+class LatencyHistogram:
+    """Count, sum and bucketed distribution of durations in seconds."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile (``max`` for the overflow bucket)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip([*self.buckets, float("inf")], self.counts)),
+        }
+
+
+class RequestTrace:
+    """What happened to one ``api_request`` call, filled in by the client while it runs."""
+
+    __slots__ = ("method", "endpoint", "status_codes", "network_time", "decode_time", "response_bytes",
+                 "retries", "limiter_wait", "cache_hit", "coalesced", "error")
+
+    def __init__(self, method: str, endpoint: str):
+        self.method = method
+        self.endpoint = endpoint
+        self.status_codes: List[int] = []
+        self.network_time = 0.0
+        self.decode_time = 0.0
+        self.response_bytes = 0
+        self.retries = 0
+        self.limiter_wait = 0.0
+        self.cache_hit = False
+        self.coalesced = False
+        self.error = False
+
+    def add_attempt(self, response: httpx.Response, network_time: float):
+        self.status_codes.append(response.status_code)
+        self.network_time += network_time
+        self.response_bytes += len(response.content)
+
+
+class EndpointStats:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.calls = 0
+        self.requests = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.retries = 0
+        self.response_bytes = 0
+        self.limiter_wait = 0.0
+        self.status_codes: Counter = Counter()
+        self.network = LatencyHistogram(buckets)
+        self.decode = LatencyHistogram(buckets)
+        self.parse = LatencyHistogram(buckets)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "retries": self.retries,
+            "response_bytes": self.response_bytes,
+            "limiter_wait": self.limiter_wait,
+            "status_codes": dict(self.status_codes),
+            "network": self.network.to_dict(),
+            "decode": self.decode.to_dict(),
+            "parse": self.parse.to_dict(),
+        }
+
+
+class ClientMetrics:
+    """Per-endpoint request metrics, shareable between clients.
+
+    For every endpoint (keyed by its path template, e.g. ``"networks/{}/pools"``) it counts calls, HTTP
+    requests, cache hits, coalesced calls, errors, retries, status codes, response bytes and rate limiter
+    wait, and keeps separate latency histograms for the network round trips, the JSON decoding and the
+    parsing into the result format.
+    """
+
+    def __init__(self, latency_buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.latency_buckets = latency_buckets
+        self._endpoints: Dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, endpoint: str) -> EndpointStats:
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints.setdefault(endpoint, EndpointStats(self.latency_buckets))
+        return stats
+
+    def record(self, trace: RequestTrace):
+        with self._lock:
+            stats = self._stats(trace.endpoint)
+            stats.calls += 1
+            stats.cache_hits += trace.cache_hit
+            stats.coalesced += trace.coalesced
+            stats.errors += trace.error
+            if trace.status_codes:
+                stats.requests += len(trace.status_codes)
+                stats.retries += trace.retries
+                stats.response_bytes += trace.response_bytes
+                stats.limiter_wait += trace.limiter_wait
+                stats.status_codes.update(trace.status_codes)
+                stats.network.observe(trace.network_time)
+            if trace.decode_time:
+                stats.decode.observe(trace.decode_time)
+
+    def record_parse(self, endpoint: str, seconds: float):
+        with self._lock:
+            self._stats(endpoint).parse.observe(seconds)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {endpoint: stats.to_dict() for endpoint, stats in self._endpoints.items()}
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+class Instrumentation:
+    """Feeds request traces to a ``ClientMetrics`` and/or OpenTelemetry-style spans.
+
+    ``tracer`` is anything with ``start_as_current_span(name, attributes=...)`` returning a context
+    manager around a span with ``set_attribute``, such as ``opentelemetry.trace.get_tracer(__name__)``.
+    Clients only build one when metrics or a tracer were given, so uninstrumented requests skip all of it.
+    """
+
+    def __init__(self, metrics: Optional[ClientMetrics] = None, tracer: Optional[Any] = None):
+        self.metrics = metrics
+        self.tracer = tracer
+
+    @contextmanager
+    def trace_request(self, method: str, path: str) -> Iterator[RequestTrace]:
+        trace = RequestTrace(method, endpoint_template(path))
+        if self.tracer is None:
+            try:
+                yield trace
+            except BaseException:
+                trace.error = True
+                raise
+            finally:
+                if self.metrics is not None:
+                    self.metrics.record(trace)
+            return
+        with self.tracer.start_as_current_span(f"GeckoTerminal {method} {trace.endpoint}",
+                                               attributes={"http.request.method": method, "url.path": path,
+                                                           "geckoterminal.endpoint": trace.endpoint}) as span:
+            try:
+                yield trace
+            except BaseException:
+                trace.error = True
+                raise
+            finally:
+                if trace.status_codes:
+                    span.set_attribute("http.response.status_code", trace.status_codes[-1])
+                span.set_attribute("http.response.body.size", trace.response_bytes)
+                span.set_attribute("geckoterminal.retries", trace.retries)
+                span.set_attribute("geckoterminal.cache_hit", trace.cache_hit)
+                if self.metrics is not None:
+                    self.metrics.record(trace)
+
+    def record_parse(self, path: str, seconds: float):
+        if self.metrics is not None:
+            self.metrics.record_parse(endpoint_template(path), seconds)
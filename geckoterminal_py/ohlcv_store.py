@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+
+from geckoterminal_py.base_client import GeckoTerminalClientBase
+from geckoterminal_py.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+try:
+    pa = lazy_import("pyarrow")
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    pa = None
+
+if TYPE_CHECKING:
+    from geckoterminal_py.clients.async_client import GeckoTerminalAsyncClient
+    from geckoterminal_py.clients.sync_client import GeckoTerminalSyncClient
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+class OHLCVStore:
+    """Local candle store with incremental sync, partitioned by day in Arrow IPC files.
+
+    Candles are kept under ``root/<network_id>/<pool_address>/<timeframe>/<currency>_<token>/`` with one
+    uncompressed ``YYYY-MM-DD.arrow`` file per day, so reads memory-map only the partitions overlapping the
+    requested window and hand their buffers to pandas without copying them through Python. Next to the
+    partitions a ``coverage.json`` file records which time ranges were already fetched; ``sync`` and
+    ``sync_async`` only request the ranges outside it, which covers both new candles after the last sync and
+    holes left by earlier partial syncs, without re-requesting periods in which the pool simply had no trades.
+    """
+
+    def __init__(self, root: Union[str, os.PathLike]):
+        if pa is None:
+            raise ImportError("OHLCVStore requires pyarrow, install it with `pip install pyarrow`.")
+        import pyarrow.ipc  # noqa: F401
+        self.root = Path(root)
+
+    def key_dir(self, network_id: str, pool_address: str, timeframe: str, currency: str = "usd",
+                token: str = "base") -> Path:
+        return self.root / network_id / pool_address / timeframe / f"{currency}_{token}"
+
+    @staticmethod
+    def partition_name(day: int) -> str:
+        return time.strftime("%Y-%m-%d.arrow", time.gmtime(day * SECONDS_PER_DAY))
+
+    def partitions(self, network_id: str, pool_address: str, timeframe: str, currency: str = "usd",
+                   token: str = "base", start: Optional[int] = None, end: Optional[int] = None) -> List[Path]:
+        """Partition files of a key overlapping ``[start, end]``, oldest first."""
+        first = self.partition_name(start // SECONDS_PER_DAY) if start is not None else ""
+        last = self.partition_name(end // SECONDS_PER_DAY) if end is not None else "~"
+        directory = self.key_dir(network_id, pool_address, timeframe, currency, token)
+        if not directory.exists():
+            return []
+        return sorted(path for path in directory.glob("*.arrow") if first <= path.name <= last)
+
+    def read_table(self, network_id: str, pool_address: str, timeframe: str, start: Optional[int] = None,
+                   end: Optional[int] = None, currency: str = "usd", token: str = "base") -> "pa.Table":
+        """Memory-map the partitions overlapping ``[start, end]`` into one Arrow table."""
+        start = GeckoTerminalClientBase.to_unix_timestamp(start) if start is not None else None
+        end = GeckoTerminalClientBase.to_unix_timestamp(end) if end is not None else None
+        tables = [pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+                  for path in self.partitions(network_id, pool_address, timeframe, currency, token, start, end)]
+        if not tables:
+            return self._empty_table()
+        table = pa.concat_tables(tables)
+        timestamps = table.column("timestamp").to_numpy()
+        mask = np.ones(len(timestamps), dtype=bool)
+        if start is not None:
+            mask &= timestamps >= start
+        if end is not None:
+            mask &= timestamps <= end
+        return table if mask.all() else table.filter(pa.array(mask))
+
+    def read(self, network_id: str, pool_address: str, timeframe: str, start: Optional[int] = None,
+             end: Optional[int] = None, currency: str = "usd", token: str = "base") -> pd.DataFrame:
+        """Read stored candles as the same frame ``get_ohlcv`` returns."""
+        df = self.read_table(network_id, pool_address, timeframe, start, end, currency, token).to_pandas()
+        df["datetime"] = pd.to_datetime(df["timestamp"], unit="s")
+        return df
+
+    def last_timestamp(self, network_id: str, pool_address: str, timeframe: str, currency: str = "usd",
+                       token: str = "base") -> Optional[int]:
+        partitions = self.partitions(network_id, pool_address, timeframe, currency, token)
+        if not partitions:
+            return None
+        table = pa.ipc.open_file(pa.memory_map(str(partitions[-1]))).read_all()
+        timestamps = table.column("timestamp").to_numpy()
+        return int(timestamps[-1]) if len(timestamps) else None
+
+    def write(self, network_id: str, pool_address: str, timeframe: str, candles: pd.DataFrame,
+              currency: str = "usd", token: str = "base") -> int:
+        """Merge candles into their day partitions, newer values winning on duplicate timestamps."""
+        if candles.empty:
+            return 0
+        directory = self.key_dir(network_id, pool_address, timeframe, currency, token)
+        directory.mkdir(parents=True, exist_ok=True)
+        candles = candles[GeckoTerminalClientBase.ohlcv_columns]
+        days = candles["timestamp"].to_numpy() // SECONDS_PER_DAY
+        for day in np.unique(days):
+            path = directory / self.partition_name(int(day))
+            day_candles = candles[days == day]
+            if path.exists():
+                stored = pa.ipc.open_file(pa.memory_map(str(path))).read_all().to_pandas()
+                day_candles = pd.concat([stored, day_candles], ignore_index=True)
+            day_candles = day_candles.drop_duplicates(subset="timestamp", keep="last").sort_values("timestamp")
+            self._write_partition(path, day_candles)
+        return len(candles)
+
+    def covered_ranges(self, network_id: str, pool_address: str, timeframe: str, currency: str = "usd",
+                       token: str = "base") -> List[Tuple[int, int]]:
+        path = self.key_dir(network_id, pool_address, timeframe, currency, token) / "coverage.json"
+        if not path.exists():
+            return []
+        return [tuple(candle_range) for candle_range in json.loads(path.read_text())]
+
+    def missing_ranges(self, network_id: str, pool_address: str, timeframe: str, start: int, end: int,
+                       currency: str = "usd", token: str = "base") -> List[Tuple[int, int]]:
+        """Candle ranges within ``[start, end]`` that were never fetched."""
+        seconds = GeckoTerminalClientBase.ohlcv_timeframe_seconds[timeframe]
+        start, end = -(-start // seconds) * seconds, end // seconds * seconds
+        missing = []
+        cursor = start
+        for covered_start, covered_end in self.covered_ranges(network_id, pool_address, timeframe, currency, token):
+            if covered_end < cursor:
+                continue
+            if covered_start > end:
+                break
+            if covered_start > cursor:
+                missing.append((cursor, covered_start - seconds))
+            cursor = max(cursor, covered_end + seconds)
+        if cursor <= end:
+            missing.append((cursor, end))
+        return missing
+
+    def sync(self, client: "GeckoTerminalSyncClient", network_id: str, pool_address: str, timeframe: str,
+             start: Union[int, datetime], end: Optional[Union[int, datetime]] = None, currency: str = "usd",
+             token: str = "base") -> int:
+        """Fetch every not yet stored range of ``[start, end]`` (``end`` defaults to now) and store it."""
+        written = 0
+        for range_start, range_end, fetch_end in self._plan_sync(network_id, pool_address, timeframe, start, end,
+                                                                 currency, token):
+            candles = client.get_ohlcv_range(network_id, pool_address, timeframe, range_start, fetch_end,
+                                             currency=currency, token=token, result_format="pandas")
+            written += self._store_range(network_id, pool_address, timeframe, currency, token, candles,
+                                         range_start, range_end)
+        return written
+
+    async def sync_async(self, client: "GeckoTerminalAsyncClient", network_id: str, pool_address: str,
+                         timeframe: str, start: Union[int, datetime], end: Optional[Union[int, datetime]] = None,
+                         currency: str = "usd", token: str = "base") -> int:
+        """``sync`` for the async client, fetching each missing range with concurrent pages."""
+        written = 0
+        for range_start, range_end, fetch_end in self._plan_sync(network_id, pool_address, timeframe, start, end,
+                                                                 currency, token):
+            candles = await client.get_ohlcv_range(network_id, pool_address, timeframe, range_start, fetch_end,
+                                                   currency=currency, token=token, result_format="pandas")
+            written += self._store_range(network_id, pool_address, timeframe, currency, token, candles,
+                                         range_start, range_end)
+        return written
+
+    def _plan_sync(self, network_id: str, pool_address: str, timeframe: str, start: Union[int, datetime],
+                   end: Optional[Union[int, datetime]], currency: str, token: str) -> List[Tuple[int, int, int]]:
+        """Missing ranges as ``(start, last closed candle, fetch end)``.
+
+        The candle still open at ``end`` is fetched and stored but not marked as covered, so the next sync
+        picks up its final values.
+        """
+        seconds = GeckoTerminalClientBase.ohlcv_timeframe_seconds[timeframe]
+        now = int(time.time())
+        start = GeckoTerminalClientBase.to_unix_timestamp(start)
+        end = min(GeckoTerminalClientBase.to_unix_timestamp(end) if end is not None else now, now)
+        last_candle = end // seconds * seconds
+        open_candle = last_candle + seconds > now
+        last_closed = last_candle - seconds if open_candle else last_candle
+        plan = [(range_start, range_end, range_end)
+                for range_start, range_end in self.missing_ranges(network_id, pool_address, timeframe, start,
+                                                                  last_closed, currency, token)]
+        if open_candle and last_candle >= start:
+            if plan and plan[-1][1] == last_closed:
+                plan[-1] = (plan[-1][0], last_closed, last_candle)
+            else:
+                plan.append((last_candle, last_closed, last_candle))
+        return plan
+
+    def _store_range(self, network_id: str, pool_address: str, timeframe: str, currency: str, token: str,
+                     candles: pd.DataFrame, range_start: int, range_end: int) -> int:
+        written = self.write(network_id, pool_address, timeframe, candles, currency, token)
+        if range_start <= range_end:
+            self._add_coverage(network_id, pool_address, timeframe, currency, token, range_start, range_end)
+        return written
+
+    def _add_coverage(self, network_id: str, pool_address: str, timeframe: str, currency: str, token: str,
+                      start: int, end: int):
+        seconds = GeckoTerminalClientBase.ohlcv_timeframe_seconds[timeframe]
+        ranges = sorted(self.covered_ranges(network_id, pool_address, timeframe, currency, token) + [(start, end)])
+        merged = [list(ranges[0])]
+        for range_start, range_end in ranges[1:]:
+            if range_start <= merged[-1][1] + seconds:
+                merged[-1][1] = max(merged[-1][1], range_end)
+            else:
+                merged.append([range_start, range_end])
+        directory = self.key_dir(network_id, pool_address, timeframe, currency, token)
+        directory.mkdir(parents=True, exist_ok=True)
+        temporary_path = directory / "coverage.json.tmp"
+        temporary_path.write_text(json.dumps(merged))
+        os.replace(temporary_path, directory / "coverage.json")
+
+    @staticmethod
+    def _empty_table() -> "pa.Table":
+        return pa.table({"timestamp": pa.array([], pa.int64()),
+                         **{column: pa.array([], pa.float64())
+                            for column in GeckoTerminalClientBase.ohlcv_columns[1:]}})
+
+    @staticmethod
+    def _write_partition(path: Path, candles: pd.DataFrame):
+        table = pa.table({"timestamp": pa.array(candles["timestamp"].to_numpy(dtype=np.int64)),
+                          **{column: pa.array(candles[column].to_numpy(dtype=np.float64))
+                             for column in GeckoTerminalClientBase.ohlcv_columns[1:]}})
+        temporary_path = path.with_suffix(".arrow.tmp")
+        with pa.OSFile(str(temporary_path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(temporary_path, path)
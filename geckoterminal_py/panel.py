@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+from geckoterminal_py.base_client import GeckoTerminalClientBase
+from geckoterminal_py.decoding import ohlcv_array
+from geckoterminal_py.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+PANEL_FIELDS = tuple(GeckoTerminalClientBase.ohlcv_columns[1:])
+
+
+@dataclass
+class OHLCVPanel:
+    """Candles of many pools aligned on one regular time grid.
+
+    ``timestamps`` holds the ``T`` candle open times of the grid and ``pools`` the ``N`` ``(network_id,
+    pool_address)`` pairs. Every field (``open``, ``high``, ``low``, ``close``, ``volume_usd``) is a float64
+    ``(T, N)`` matrix and ``mask[t, n]`` is True where pool ``n`` has a candle at ``timestamps[t]``. Cells
+    without a candle are left at 0.0; read them through ``mask`` rather than their value.
+    """
+
+    timestamps: np.ndarray
+    pools: List[Tuple[str, str]]
+    fields: Dict[str, np.ndarray]
+    mask: np.ndarray
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.fields[field]
+
+    @property
+    def missing(self) -> np.ndarray:
+        return ~self.mask
+
+    @property
+    def datetimes(self) -> np.ndarray:
+        return self.timestamps.astype("datetime64[s]")
+
+    def to_frame(self, field: str) -> pd.DataFrame:
+        """One field as a datetime-indexed frame with a ``<network_id>_<pool_address>`` column per pool.
+
+        Missing candles become NaN here, which is the only place the panel uses them.
+        """
+        return pd.DataFrame(np.where(self.mask, self.fields[field], np.nan), index=pd.DatetimeIndex(self.datetimes),
+                            columns=[f"{network_id}_{pool_address}" for network_id, pool_address in self.pools])
+
+
+def build_ohlcv_panel(pools: Sequence[Tuple[str, str]], pool_pages: Sequence[Sequence[Sequence[List[float]]]],
+                      timeframe_seconds: int, start: int, end: int) -> OHLCVPanel:
+    """Scatter the raw ``ohlcv_list`` pages of every pool into an ``OHLCVPanel`` over ``[start, end]``.
+
+    ``pool_pages[n]`` holds the pages fetched for ``pools[n]``. Every candle is copied once into a single
+    float64 block and placed on the grid by its timestamp, so the cost is that of one concatenation
+    whatever the number of pools.
+    """
+    width = len(PANEL_FIELDS) + 1
+    first = -(-start // timeframe_seconds) * timeframe_seconds
+    timestamps = np.arange(first, end + 1, timeframe_seconds, dtype=np.int64)
+    arrays = [ohlcv_array(page, width) for pages in pool_pages for page in pages if len(page)]
+    values = np.concatenate(arrays) if arrays else np.empty((0, width), dtype=np.float64)
+    columns = np.repeat(np.arange(len(pools)), [sum(len(page) for page in pages) for pages in pool_pages])
+
+    rows = values[:, 0].astype(np.int64) - first
+    on_grid = (rows >= 0) & (rows % timeframe_seconds == 0) & (rows < len(timestamps) * timeframe_seconds)
+    rows, columns, values = rows[on_grid] // timeframe_seconds, columns[on_grid], values[on_grid]
+
+    mask = np.zeros((len(timestamps), len(pools)), dtype=bool)
+    mask[rows, columns] = True
+    fields = {}
+    for i, field in enumerate(PANEL_FIELDS, start=1):
+        matrix = np.zeros((len(timestamps), len(pools)), dtype=np.float64)
+        matrix[rows, columns] = values[:, i]
+        fields[field] = matrix
+    return OHLCVPanel(timestamps, list(pools), fields, mask)
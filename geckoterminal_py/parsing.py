@@ -0,0 +1,66 @@
+from typing import Callable, Dict, List, Tuple
+
+ColumnExtractor = Callable[[dict], Dict[str, list]]
+
+_EMPTY: dict = {}
+_compiled_specs: Dict[int, Tuple[tuple, ColumnExtractor]] = {}
+
+
+def _spec_fields(spec: tuple) -> Tuple[str, Dict[str, Tuple[str, ...]]]:
+    """Validate a ``(records_key, [{column: path}])`` glom spec and split every path into its keys."""
+    if not (isinstance(spec, tuple) and len(spec) == 2 and isinstance(spec[0], str)
+            and isinstance(spec[1], list) and len(spec[1]) == 1 and isinstance(spec[1][0], dict)):
+        raise ValueError(f"Unsupported spec {spec!r}, expected ('<records key>', [{{column: path}}]).")
+    fields = {}
+    for column, path in spec[1][0].items():
+        if isinstance(path, tuple) and len(path) == 1:
+            path = path[0]
+        if not isinstance(path, str):
+            raise ValueError(f"Unsupported path {path!r} for column {column!r}, expected a dotted string.")
+        fields[column] = tuple(path.split("."))
+    return spec[0], fields
+
+
+def compile_spec(spec: tuple) -> ColumnExtractor:
+    """Generate a column extractor for one of the ``*_SPEC`` definitions in ``constants.py``.
+
+    The returned function takes a JSON:API response and returns ``{column: [values]}`` ready for
+    ``pd.DataFrame``, walking the records once and appending each value straight to its column list.
+    Nested objects shared by several columns (``attributes``, ``relationships.dex.data``...) are looked up
+    once per record. Unlike ``glom``, a missing key yields ``None`` instead of raising.
+    """
+    records_key, fields = _spec_fields(spec)
+    prefixes: Dict[Tuple[str, ...], str] = {(): "record"}
+    lines = []
+    for keys in fields.values():
+        for depth in range(1, len(keys)):
+            prefix = keys[:depth]
+            if prefix not in prefixes:
+                prefixes[prefix] = f"p{len(prefixes)}"
+                lines.append(f"        {prefixes[prefix]} = {prefixes[prefix[:-1]]}.get({prefix[-1]!r}) or _EMPTY")
+    for index, keys in enumerate(fields.values()):
+        lines.append(f"        append_{index}({prefixes[keys[:-1]]}.get({keys[-1]!r}))")
+    source = "\n".join([
+        "def extract(response):",
+        f"    records = response.get({records_key!r}) or []",
+        *(f"    column_{index} = []\n    append_{index} = column_{index}.append" for index in range(len(fields))),
+        "    for record in records:",
+        *lines,
+        "    return {" + ", ".join(f"{column!r}: column_{index}" for index, column in enumerate(fields)) + "}",
+    ])
+    namespace = {"_EMPTY": _EMPTY}
+    exec(compile(source, f"<compiled spec {records_key}>", "exec"), namespace)
+    return namespace["extract"]
+
+
+def get_extractor(spec: tuple) -> ColumnExtractor:
+    """Return the compiled extractor for ``spec``, compiling it the first time it is used."""
+    cached = _compiled_specs.get(id(spec))
+    if cached is None or cached[0] is not spec:
+        cached = (spec, compile_spec(spec))
+        _compiled_specs[id(spec)] = cached
+    return cached[1]
+
+
+def extract_columns(response: dict, spec: tuple) -> Dict[str, List]:
+    return get_extractor(spec)(response)
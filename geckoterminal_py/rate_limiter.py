@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Dict, FrozenSet, Optional
+
+from geckoterminal_py.lazy import lazy_import
+
+# Only needed by the async and HTTP paths, so sync callers and plain imports do not pay for them.
+asyncio = lazy_import("asyncio")
+httpx = lazy_import("httpx")
+
+
+class RateLimiter:
+    """Token bucket shared by every request issued through one client.
+
+    Each request takes one token. Tokens refill continuously at ``rate`` per ``period`` seconds up
+    to ``capacity``. When the bucket is empty a caller reserves the next token ahead of time and
+    sleeps until it is due, so waiting callers are served in arrival order whether they are threads
+    of a ``GeckoTerminalSyncClient`` or coroutines of a ``GeckoTerminalAsyncClient``.
+    """
+
+    def __init__(self, rate: float = 30, period: float = 60.0, capacity: Optional[float] = None):
+        if rate <= 0 or period <= 0:
+            raise ValueError(f"Rate and period must be positive, got rate={rate} and period={period}.")
+        self.rate = rate
+        self.period = period
+        self.capacity = capacity if capacity is not None else rate
+        self._refill_per_second = rate / period
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        # No token is handed out before this moment, set by ``pause``.
+        self._not_before = 0.0
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self.acquired = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def _reserve(self) -> float:
+        """Take a token and return how many seconds the caller has to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self._refill_per_second)
+            self._updated_at = now
+            self._tokens -= 1
+            self.acquired += 1
+            wait = max(0.0, -self._tokens / self._refill_per_second, self._not_before - now)
+            if wait > 0:
+                self._waiting += 1
+                self.total_wait_time += wait
+                self.max_wait_time = max(self.max_wait_time, wait)
+            return wait
+
+    def _release_waiter(self):
+        with self._lock:
+            self._waiting -= 1
+
+    def acquire(self):
+        """Block the calling thread until a token is available."""
+        wait = self._reserve()
+        if wait > 0:
+            try:
+                time.sleep(wait)
+            finally:
+                self._release_waiter()
+
+    async def acquire_async(self):
+        """Suspend the calling coroutine until a token is available."""
+        wait = self._reserve()
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self._release_waiter()
+
+    def pause(self, seconds: float):
+        """Hold every caller back for ``seconds``, e.g. after the API answered with a 429.
+
+        Overlapping pauses do not add up: callers wait until the latest of their ends.
+        """
+        with self._lock:
+            self._not_before = max(self._not_before, time.monotonic() + seconds)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of callers currently waiting for a token."""
+        return self._waiting
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "acquired": self.acquired,
+            "queue_depth": self.queue_depth,
+            "total_wait_time": self.total_wait_time,
+            "max_wait_time": self.max_wait_time,
+        }
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with full jitter for throttled (429) and server error (5xx) responses.
+
+    A ``Retry-After`` header sent by the API always takes precedence over the computed backoff.
+    """
+
+    max_retries: int = 5
+    backoff_base: float = 1.0
+    backoff_max: float = 60.0
+    retry_statuses: FrozenSet[int] = field(default_factory=lambda: frozenset({429, 500, 502, 503, 504}))
+
+    def should_retry(self, response: httpx.Response, attempt: int) -> bool:
+        return attempt < self.max_retries and response.status_code in self.retry_statuses
+
+    def get_delay(self, response: httpx.Response, attempt: int) -> float:
+        retry_after = self.parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import gzip
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+import httpx
+
+if TYPE_CHECKING:
+    from geckoterminal_py.clients.async_client import GeckoTerminalAsyncClient
+
+ARCHIVE_VERSION = 1
+
+# Headers describing the encoding of the body on the wire; recorded bodies are stored decoded.
+_WIRE_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+
+
+def _response_headers(headers: httpx.Headers) -> Dict[str, str]:
+    return {key: value for key, value in headers.items() if key.lower() not in _WIRE_HEADERS}
+
+
+def _request_key(method: str, path: str, params: List[Tuple[str, str]]) -> Tuple[str, str, Tuple]:
+    return method.upper(), path, tuple(sorted(params))
+
+
+@dataclass
+class RecordedExchange:
+    """One request and its response; ``offset`` is when it was sent, in seconds since recording started."""
+
+    method: str
+    path: str
+    params: List[Tuple[str, str]]
+    status: int
+    headers: Dict[str, str]
+    latency: float
+    offset: float
+    body: bytes = field(repr=False)
+
+    @property
+    def key(self) -> Tuple[str, str, Tuple]:
+        return _request_key(self.method, self.path, self.params)
+
+    def to_json(self) -> str:
+        record = asdict(self)
+        try:
+            record["body"] = self.body.decode()
+        except UnicodeDecodeError:
+            record["body"], record["body_base64"] = base64.b64encode(self.body).decode(), True
+        return json.dumps(record, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, line: str) -> "RecordedExchange":
+        record = json.loads(line)
+        body = record.pop("body")
+        record["body"] = base64.b64decode(body) if record.pop("body_base64", False) else body.encode()
+        record["params"] = [tuple(param) for param in record["params"]]
+        return cls(**record)
+
+
+class ReplayArchive:
+    """Recorded exchanges, saved as gzip-compressed JSON lines.
+
+    The first line holds the archive version and every following line one ``RecordedExchange``. Bodies
+    are kept as text, since the API only returns JSON, which gzip shrinks to a fraction of their size.
+    """
+
+    def __init__(self, exchanges: Optional[List[RecordedExchange]] = None):
+        self.exchanges: List[RecordedExchange] = exchanges or []
+
+    def __len__(self) -> int:
+        return len(self.exchanges)
+
+    def save(self, path: Union[str, os.PathLike], compresslevel: int = 6):
+        with gzip.open(path, "wt", encoding="utf-8", compresslevel=compresslevel) as file:
+            file.write(json.dumps({"version": ARCHIVE_VERSION}) + "\n")
+            for exchange in sorted(self.exchanges, key=lambda exchange: exchange.offset):
+                file.write(exchange.to_json() + "\n")
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> "ReplayArchive":
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            header = json.loads(file.readline())
+            if header.get("version") != ARCHIVE_VERSION:
+                raise ValueError(f"Unsupported replay archive version {header.get('version')} in {path}.")
+            return cls([RecordedExchange.from_json(line) for line in file if line.strip()])
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Transport forwarding every request to a real transport and recording each exchange in ``archive``.
+
+    Works with both clients: pass it as ``transport`` and call ``archive.save(path)`` when done.
+    """
+
+    def __init__(self, transport: Optional[Union[httpx.BaseTransport, httpx.AsyncBaseTransport]] = None,
+                 archive: Optional[ReplayArchive] = None):
+        self.transport = transport
+        self.archive = archive or ReplayArchive()
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def _record(self, request: httpx.Request, response: httpx.Response, offset: float, latency: float):
+        exchange = RecordedExchange(request.method, request.url.path, list(request.url.params.multi_items()),
+                                    response.status_code, _response_headers(response.headers), latency, offset,
+                                    response.content)
+        with self._lock:
+            self.archive.exchanges.append(exchange)
+        return httpx.Response(response.status_code, headers=exchange.headers, content=exchange.body,
+                              request=request)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.transport is None:
+            self.transport = httpx.HTTPTransport()
+        started = time.perf_counter()
+        response = self.transport.handle_request(request)
+        response.read()
+        response.close()
+        return self._record(request, response, started - self._started, time.perf_counter() - started)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.transport is None:
+            self.transport = httpx.AsyncHTTPTransport()
+        started = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        await response.aread()
+        await response.aclose()
+        return self._record(request, response, started - self._started, time.perf_counter() - started)
+
+    def close(self):
+        if isinstance(self.transport, httpx.BaseTransport):
+            self.transport.close()
+
+    async def aclose(self):
+        if isinstance(self.transport, httpx.AsyncBaseTransport):
+            await self.transport.aclose()
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Transport answering from a ``ReplayArchive`` without any network access.
+
+    Requests are matched on method, path and params. Repeated requests get the recorded responses for
+    them in recording order, starting over once all were served. Each response is delayed by its recorded
+    latency divided by ``speed`` (``speed=0`` answers at once); async delays only suspend the request,
+    so concurrent requests overlap as they did when recorded. Requests missing from the archive raise a
+    ``LookupError``, or get a 404 with ``strict=False``.
+    """
+
+    def __init__(self, archive: ReplayArchive, speed: float = 1.0, strict: bool = True):
+        if speed < 0:
+            raise ValueError(f"The replay speed must not be negative, got {speed}.")
+        self.speed = speed
+        self.strict = strict
+        self.requests = 0
+        self.misses = 0
+        self._exchanges: Dict[Tuple, List[RecordedExchange]] = defaultdict(list)
+        for exchange in sorted(archive.exchanges, key=lambda exchange: exchange.offset):
+            self._exchanges[exchange.key].append(exchange)
+        self._next: Dict[Tuple, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def _lookup(self, request: httpx.Request) -> Optional[RecordedExchange]:
+        key = _request_key(request.method, request.url.path, list(request.url.params.multi_items()))
+        with self._lock:
+            self.requests += 1
+            exchanges = self._exchanges.get(key)
+            if not exchanges:
+                self.misses += 1
+                if self.strict:
+                    raise LookupError(f"No recorded response for {request.method} {request.url}.")
+                return None
+            position = self._next[key]
+            self._next[key] = (position + 1) % len(exchanges)
+            return exchanges[position]
+
+    def _delay(self, exchange: Optional[RecordedExchange]) -> float:
+        return exchange.latency / self.speed if exchange is not None and self.speed else 0.0
+
+    @staticmethod
+    def _response(request: httpx.Request, exchange: Optional[RecordedExchange]) -> httpx.Response:
+        if exchange is None:
+            return httpx.Response(404, json={"errors": [{"status": "404", "title": "Not recorded"}]},
+                                  request=request)
+        return httpx.Response(exchange.status, headers=exchange.headers, content=exchange.body, request=request)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        exchange = self._lookup(request)
+        delay = self._delay(exchange)
+        if delay:
+            time.sleep(delay)
+        return self._response(request, exchange)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        exchange = self._lookup(request)
+        delay = self._delay(exchange)
+        if delay:
+            await asyncio.sleep(delay)
+        return self._response(request, exchange)
+
+
+async def replay_requests(client: "GeckoTerminalAsyncClient", archive: ReplayArchive, speed: float = 1.0,
+                          max_concurrency: int = 100) -> int:
+    """Send the recorded requests through ``client`` on their recorded schedule, scaled by ``speed``.
+
+    Combined with a ``ReplayTransport`` on the client, this reproduces the recorded load offline: each
+    request starts at its recorded offset divided by ``speed`` (all at once with ``speed=0``), with at
+    most ``max_concurrency`` in flight. Returns the number of requests that succeeded.
+    """
+    api_root = httpx.URL(client.base_url).path.rstrip("/") + "/"
+    semaphore = asyncio.Semaphore(max_concurrency)
+    started = time.perf_counter()
+
+    async def send(exchange: RecordedExchange) -> bool:
+        if speed:
+            await asyncio.sleep(max(0.0, exchange.offset / speed - (time.perf_counter() - started)))
+        async with semaphore:
+            try:
+                await client.api_request(exchange.method, exchange.path[len(api_root):], dict(exchange.params))
+            except httpx.HTTPStatusError:
+                return False
+        return True
+
+    exchanges = sorted((exchange for exchange in archive.exchanges if exchange.path.startswith(api_root)),
+                       key=lambda exchange: exchange.offset)
+    return sum(await asyncio.gather(*(send(exchange) for exchange in exchanges)))
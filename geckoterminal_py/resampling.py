@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import re
+from typing import List, Optional
+
+from geckoterminal_py.base_client import GeckoTerminalClientBase
+from geckoterminal_py.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+TIMEFRAME_UNIT_SECONDS = {"m": 60, "h": 60 * 60, "d": 24 * 60 * 60, "w": 7 * 24 * 60 * 60}
+
+
+def timeframe_to_seconds(timeframe: str) -> int:
+    """Seconds per candle of any ``<n><unit>`` timeframe, e.g. ``"5m"``, ``"2h"``, ``"3d"`` or ``"1w"``."""
+    match = re.fullmatch(r"(\d+)([mhdw])", timeframe)
+    if not match or int(match.group(1)) <= 0:
+        raise ValueError(f"Timeframe {timeframe} is not supported. Please use <number><unit> with the unit one of "
+                         f"{list(TIMEFRAME_UNIT_SECONDS)}")
+    return int(match.group(1)) * TIMEFRAME_UNIT_SECONDS[match.group(2)]
+
+
+def resample_ohlcv(candles: pd.DataFrame, timeframe: str, origin: int = 0, fill_gaps: bool = False) -> pd.DataFrame:
+    """Aggregate fine candles (as returned by ``get_ohlcv``) into coarser ``timeframe`` candles.
+
+    Buckets start at ``origin`` plus a multiple of the timeframe (UTC epoch by default, so daily candles start at
+    midnight). Each bucket opens at its first candle's open, closes at its last candle's close, takes the extreme
+    high and low and sums ``volume_usd``. Buckets without any source candle are left out, like the API does, unless
+    ``fill_gaps`` is set; they are then filled with flat candles at the previous close and zero volume.
+    """
+    seconds = timeframe_to_seconds(timeframe)
+    columns = GeckoTerminalClientBase.ohlcv_columns
+    if candles.empty:
+        return _empty_frame()
+    candles = candles.sort_values("timestamp", kind="stable").drop_duplicates(subset="timestamp", keep="last")
+    timestamps = candles["timestamp"].to_numpy(dtype=np.int64)
+    values = candles[columns[1:]].to_numpy(dtype=np.float64)
+    buckets = (timestamps - origin) // seconds * seconds + origin
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(buckets)] - 1
+    aggregated = np.column_stack([
+        values[starts, 0],
+        np.maximum.reduceat(values[:, 1], starts),
+        np.minimum.reduceat(values[:, 2], starts),
+        values[ends, 3],
+        np.add.reduceat(values[:, 4], starts),
+    ])
+    bucket_timestamps = buckets[starts]
+    if fill_gaps and len(bucket_timestamps) > 1:
+        bucket_timestamps, aggregated = _fill_gaps(bucket_timestamps, aggregated, seconds)
+    return _frame(bucket_timestamps, aggregated)
+
+
+def _fill_gaps(bucket_timestamps: np.ndarray, aggregated: np.ndarray, seconds: int):
+    full_timestamps = np.arange(bucket_timestamps[0], bucket_timestamps[-1] + seconds, seconds, dtype=np.int64)
+    positions = (bucket_timestamps - bucket_timestamps[0]) // seconds
+    present = np.zeros(len(full_timestamps), dtype=bool)
+    present[positions] = True
+    # Index of the last real bucket at or before every slot, to carry its close forward.
+    last_real = np.maximum.accumulate(np.where(present, np.arange(len(full_timestamps)), 0))
+    filled = np.empty((len(full_timestamps), aggregated.shape[1]))
+    filled[positions] = aggregated
+    previous_close = filled[last_real, 3]
+    filled[~present, :4] = previous_close[~present, None]
+    filled[~present, 4] = 0.0
+    return full_timestamps, filled
+
+
+def _frame(timestamps: np.ndarray, values: np.ndarray) -> pd.DataFrame:
+    columns = GeckoTerminalClientBase.ohlcv_columns
+    df = pd.DataFrame(values, columns=columns[1:])
+    df.insert(0, "timestamp", timestamps)
+    df["datetime"] = pd.to_datetime(df["timestamp"], unit="s")
+    return df
+
+
+def _empty_frame() -> pd.DataFrame:
+    return _frame(np.empty(0, dtype=np.int64), np.empty((0, len(GeckoTerminalClientBase.ohlcv_columns) - 1)))
+
+
+class OHLCVResampler:
+    """Incrementally maintain coarse candles from a stream of fine ones.
+
+    Completed buckets are kept as they are and only the last, still open bucket is recomputed when ``update``
+    receives new fine candles. Candles older than the open bucket are ignored, since their bucket is final.
+    """
+
+    def __init__(self, timeframe: str, origin: int = 0, fill_gaps: bool = False):
+        self.timeframe = timeframe
+        self.seconds = timeframe_to_seconds(timeframe)
+        self.origin = origin
+        self.fill_gaps = fill_gaps
+        self._completed: List[pd.DataFrame] = []
+        self._open_source: Optional[pd.DataFrame] = None
+        self._open_bucket: Optional[int] = None
+        self._last_close: Optional[float] = None
+        self._last_completed: Optional[int] = None
+
+    def update(self, candles: pd.DataFrame) -> pd.DataFrame:
+        """Add fine candles and return the coarse candles they created or changed, the open one last."""
+        if self._open_bucket is not None:
+            candles = candles[candles["timestamp"] >= self._open_bucket]
+        if candles.empty:
+            return _empty_frame()
+        if self._open_source is not None:
+            candles = pd.concat([self._open_source, candles], ignore_index=True)
+        resampled = resample_ohlcv(candles, self.timeframe, self.origin, fill_gaps=self.fill_gaps)
+        if self.fill_gaps and self._last_completed is not None:
+            resampled = self._prepend_gap(resampled)
+        self._open_bucket = int(resampled["timestamp"].iloc[-1])
+        bucket_starts = (candles["timestamp"] - self.origin) // self.seconds * self.seconds + self.origin
+        self._open_source = candles.loc[bucket_starts == self._open_bucket, GeckoTerminalClientBase.ohlcv_columns]
+        completed = resampled.iloc[:-1]
+        if not completed.empty:
+            self._completed.append(completed)
+            self._last_completed = int(completed["timestamp"].iloc[-1])
+            self._last_close = float(completed["close"].iloc[-1])
+        return resampled.reset_index(drop=True)
+
+    def _prepend_gap(self, resampled: pd.DataFrame) -> pd.DataFrame:
+        """Flat candles for the buckets between the last completed one and the first of this update."""
+        first = int(resampled["timestamp"].iloc[0])
+        missing = np.arange(self._last_completed + self.seconds, first, self.seconds, dtype=np.int64)
+        if not len(missing):
+            return resampled
+        flat = np.column_stack([np.full((len(missing), 4), self._last_close), np.zeros(len(missing))])
+        return pd.concat([_frame(missing, flat), resampled], ignore_index=True)
+
+    @property
+    def candles(self) -> pd.DataFrame:
+        """Every coarse candle so far, the open one included."""
+        if len(self._completed) > 1:
+            self._completed = [pd.concat(self._completed, ignore_index=True)]
+        frames = list(self._completed)
+        if self._open_source is not None:
+            frames.append(resample_ohlcv(self._open_source, self.timeframe, self.origin))
+        if not frames:
+            return _empty_frame()
+        return pd.concat(frames, ignore_index=True)
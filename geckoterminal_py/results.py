@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from collections import namedtuple
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
+
+from geckoterminal_py.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# "pandas" builds a DataFrame; the other formats never import pandas.
+RESULT_FORMATS = ("pandas", "arrow", "numpy", "records")
+
+
+def validate_result_format(result_format: str) -> str:
+    if result_format not in RESULT_FORMATS:
+        raise ValueError(f"Result format {result_format} is not supported. Please select one of {RESULT_FORMATS}")
+    return result_format
+
+
+@lru_cache(maxsize=None)
+def record_type(fields: Tuple[str, ...]) -> type:
+    """Namedtuple class for one column layout. Namedtuples use ``__slots__``, so records carry no ``__dict__``."""
+    return namedtuple("Record", fields)
+
+
+def to_arrow_table(columns: Dict[str, Sequence]) -> Any:
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError("The arrow result format requires pyarrow, install it with `pip install pyarrow`.") from e
+    return pa.table({name: pa.array(values) for name, values in columns.items()})
+
+
+def to_structured_array(columns: Dict[str, Sequence]) -> Any:
+    """Pack columns into a NumPy structured array; numeric columns keep their dtype, the rest become objects."""
+    arrays = {}
+    for name, values in columns.items():
+        array = np.asarray(values)
+        arrays[name] = array if array.dtype.kind in "biufmM" else np.asarray(values, dtype=object)
+    length = len(next(iter(arrays.values()))) if arrays else 0
+    structured = np.empty(length, dtype=[(name, array.dtype) for name, array in arrays.items()])
+    for name, array in arrays.items():
+        structured[name] = array
+    return structured
+
+
+def to_records(columns: Dict[str, Sequence]) -> List[tuple]:
+    record = record_type(tuple(columns))
+    values = [column.tolist() if hasattr(column, "tolist") else column for column in columns.values()]
+    return [record(*row) for row in zip(*values)]
+
+
+def from_columns(columns: Dict[str, Sequence], result_format: str) -> Any:
+    """Convert ``{column: values}`` to an Arrow table, a NumPy structured array or a list of records."""
+    if result_format == "arrow":
+        return to_arrow_table(columns)
+    if result_format == "numpy":
+        return to_structured_array(columns)
+    if result_format == "records":
+        return to_records(columns)
+    raise ValueError(f"Result format {result_format} cannot be built from columns.")
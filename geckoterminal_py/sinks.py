@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import os
+from typing import Any, Callable, Optional, Union
+
+from geckoterminal_py.lazy import lazy_import
+
+pd = lazy_import("pandas")
+try:
+    pa = lazy_import("pyarrow")
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    pa = None
+
+
+async def deliver(chunk: pd.DataFrame, callback: Optional[Callable[[pd.DataFrame], Any]] = None,
+                  queue: Optional[asyncio.Queue] = None):
+    """Hand a chunk to a sync or async ``callback`` and/or put it on ``queue``."""
+    if callback is not None:
+        result = callback(chunk)
+        if inspect.isawaitable(result):
+            await result
+    if queue is not None:
+        await queue.put(chunk)
+
+
+class ParquetSink:
+    """Callback appending every chunk it receives to one Parquet file as a new row group.
+
+    The schema is ``schema`` or taken from the first chunk, and later chunks are converted to it so a chunk
+    whose column happens to hold only nulls still fits. Use it as a context manager, or call ``close``, to finish
+    the file.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], compression: str = "zstd",
+                 schema: Optional[pa.Schema] = None):
+        if pa is None:
+            raise ImportError("ParquetSink requires pyarrow, install it with `pip install pyarrow`.")
+        import pyarrow.parquet  # noqa: F401
+        self.path = path
+        self.compression = compression
+        self.schema = schema
+        self.rows = 0
+        self._writer = None
+
+    def __call__(self, chunk: pd.DataFrame):
+        table = pa.Table.from_pandas(chunk, schema=self.schema, preserve_index=False)
+        if self._writer is None:
+            self.schema = table.schema
+            self._writer = pa.parquet.ParquetWriter(self.path, self.schema, compression=self.compression)
+        self._writer.write_table(table)
+        self.rows += len(chunk)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> "ParquetSink":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
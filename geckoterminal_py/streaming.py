@@ -0,0 +1,50 @@
+from collections import OrderedDict
+from typing import Hashable, Iterable
+
+
+class SeenIds:
+    """Insertion-ordered set that forgets its oldest ids once it holds ``max_size`` of them.
+
+    Used to deduplicate overlapping polls with memory that stays flat however long a stream runs.
+    """
+
+    def __init__(self, max_size: int = 10_000):
+        self.max_size = max_size
+        self._ids: "OrderedDict[Hashable, None]" = OrderedDict()
+
+    def add_many(self, ids: Iterable[Hashable]):
+        for id_ in ids:
+            self._ids[id_] = None
+            self._ids.move_to_end(id_)
+        while len(self._ids) > self.max_size:
+            self._ids.popitem(last=False)
+
+    def __contains__(self, id_: Hashable) -> bool:
+        return id_ in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class AdaptiveInterval:
+    """Poll interval that tightens while polls keep finding new items and relaxes while they find none.
+
+    ``update`` takes the number of new items a poll found and the number it could have found at most;
+    a completely new page means items may have been missed between polls, so the interval is halved.
+    """
+
+    def __init__(self, interval: float, min_interval: float, max_interval: float,
+                 speedup: float = 0.5, slowdown: float = 1.5):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.speedup = speedup
+        self.slowdown = slowdown
+        self.current = min(max(interval, min_interval), max_interval)
+
+    def update(self, new_items: int, page_size: int) -> float:
+        if new_items == 0:
+            self.current *= self.slowdown
+        elif page_size and new_items >= page_size:
+            self.current *= self.speedup
+        self.current = min(max(self.current, self.min_interval), self.max_interval)
+        return self.current
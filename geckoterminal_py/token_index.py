@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from geckoterminal_py.clients.async_client import GeckoTerminalAsyncClient
+from geckoterminal_py.lazy import lazy_import
+
+pd = lazy_import("pandas")
+
+
+class TokenPool(NamedTuple):
+    """A pool a token trades in, as indexed for that token."""
+
+    network_id: str
+    pool_address: str
+    dex_id: Optional[str]
+    reserve_in_usd: float
+    side: str  # "base" or "quote": which side of the pool the token is on
+    paired_token: Optional[str]
+    refreshed_at: float
+
+
+class TokenPoolIndex:
+    """Token to deepest pools index, built from pool frames and kept fresh in the background.
+
+    Every pool frame added (from ``get_top_pools_by_network``, ``get_top_pools_by_network_token`` or any
+    other pool endpoint, with token ids split or still ``<network>_<address>``) indexes each pool under both
+    its base and quote token. ``pools`` then answers
+    which pools price a token with a dict lookup, deepest ``reserve_in_usd`` first, without an API call.
+
+    With a client, the networks and tokens passed to ``track_network`` / ``track_token`` (and every token
+    ``resolve`` had to fetch) are refetched once their ``ttl`` expires by ``refresh_once`` or ``run``, and
+    pools not seen again within ``max_age`` are dropped.
+    """
+
+    def __init__(self, client: Optional[GeckoTerminalAsyncClient] = None, ttl: float = 300.0,
+                 max_age: Optional[float] = None, max_pools_per_token: int = 10):
+        self.client = client
+        self.ttl = ttl
+        self.max_age = 3 * ttl if max_age is None else max_age
+        self.max_pools_per_token = max_pools_per_token
+        self.requests = 0
+        self._pools: Dict[Tuple[str, str], Dict[str, TokenPool]] = {}
+        self._ranked: Dict[Tuple[str, str], List[TokenPool]] = {}
+        # (network_id, token_address or None for the network's top pools) -> (pages, last refresh).
+        self._sources: Dict[Tuple[str, Optional[str]], Tuple[int, Optional[float]]] = {}
+        self._running = False
+
+    @staticmethod
+    def _key(network_id: str, token_address: str) -> Tuple[str, str]:
+        return network_id, token_address.lower()
+
+    def __len__(self) -> int:
+        return len(self._ranked)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return self._key(*key) in self._ranked
+
+    def pools(self, network_id: str, token_address: str, limit: Optional[int] = None) -> List[TokenPool]:
+        """Indexed pools of a token, deepest first; empty when the token is not indexed."""
+        ranked = self._ranked.get(self._key(network_id, token_address), [])
+        return ranked if limit is None else ranked[:limit]
+
+    def best_pool(self, network_id: str, token_address: str) -> Optional[TokenPool]:
+        ranked = self._ranked.get(self._key(network_id, token_address))
+        return ranked[0] if ranked else None
+
+    def add_pools(self, pools_df: pd.DataFrame, network_id: Optional[str] = None,
+                  refreshed_at: Optional[float] = None) -> int:
+        """Index the pools of a typed pool frame under their base and quote tokens.
+
+        ``network_id`` is only needed for frames without a ``network_id`` column. Token ids still prefixed
+        with their network are indexed under their address. Pools already indexed are replaced. Returns the
+        number of pools read from the frame.
+        """
+        if pools_df.empty:
+            return 0
+        refreshed_at = time.monotonic() if refreshed_at is None else refreshed_at
+        if "network_id" in pools_df.columns:
+            networks = pools_df["network_id"].astype(str)
+        else:
+            networks = [network_id] * len(pools_df)
+        reserves = pd.to_numeric(pools_df["reserve_in_usd"], errors="coerce").astype("float64")
+        touched = set()
+        for network, address, dex_id, reserve, base_token, quote_token in zip(
+                networks, pools_df["address"], pools_df["dex_id"], reserves, pools_df["base_token_id"],
+                pools_df["quote_token_id"]):
+            base_token = self._token_address(network, base_token)
+            quote_token = self._token_address(network, quote_token)
+            for side, token, paired_token in (("base", base_token, quote_token), ("quote", quote_token, base_token)):
+                if not isinstance(token, str) or not token:
+                    continue
+                key = self._key(network, token)
+                self._pools.setdefault(key, {})[address] = TokenPool(
+                    network, address, dex_id, reserve, side, paired_token, refreshed_at)
+                touched.add(key)
+        for key in touched:
+            self._rank(key)
+        return len(pools_df)
+
+    @staticmethod
+    def _token_address(network_id: str, token_id: Optional[str]) -> Optional[str]:
+        prefix = f"{network_id}_"
+        if isinstance(token_id, str) and token_id.startswith(prefix):
+            return token_id[len(prefix):]
+        return token_id
+
+    def _rank(self, key: Tuple[str, str]):
+        pools = self._pools.get(key)
+        if not pools:
+            self._pools.pop(key, None)
+            self._ranked.pop(key, None)
+            return
+        # Deepest first; pools without a reserve go last.
+        ranked = sorted(pools.values(), key=lambda pool: (math.isnan(pool.reserve_in_usd), -pool.reserve_in_usd))
+        self._ranked[key] = ranked[:self.max_pools_per_token]
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """Drop pools not refreshed within ``max_age`` and return how many were dropped."""
+        cutoff = (time.monotonic() if now is None else now) - self.max_age
+        dropped = 0
+        for key in list(self._pools):
+            pools = self._pools[key]
+            stale = [address for address, pool in pools.items() if pool.refreshed_at < cutoff]
+            for address in stale:
+                del pools[address]
+            if stale:
+                dropped += len(stale)
+                self._rank(key)
+        return dropped
+
+    def track_network(self, network_id: str, pages: int = 1):
+        """Keep the tokens of the network's ``pages`` first pages of top pools indexed."""
+        previous = self._sources.get((network_id, None))
+        self._sources[(network_id, None)] = (pages, previous[1] if previous else None)
+
+    def track_token(self, network_id: str, token_address: str):
+        """Keep the top pools of a token indexed."""
+        self._sources.setdefault((network_id, token_address.lower()), (1, None))
+
+    def untrack(self, network_id: str, token_address: Optional[str] = None):
+        self._sources.pop((network_id, token_address.lower() if token_address else None), None)
+
+    async def resolve(self, network_id: str, token_address: str, limit: Optional[int] = None) -> List[TokenPool]:
+        """Indexed pools of a token, fetching and tracking them first when the token is not indexed yet."""
+        pools = self.pools(network_id, token_address, limit)
+        if pools or self.client is None:
+            return pools
+        self.track_token(network_id, token_address)
+        await self._refresh_source(network_id, token_address.lower(), 1)
+        return self.pools(network_id, token_address, limit)
+
+    async def _refresh_source(self, network_id: str, token_address: Optional[str], pages: int):
+        if token_address is None:
+            frames = await asyncio.gather(*(
+                self.client.get_top_pools_by_network(network_id, page=page, result_format="pandas")
+                for page in (range(1, pages + 1) if pages > 1 else [None])))
+        else:
+            frames = [await self.client.get_top_pools_by_network_token(network_id, token_address,
+                                                                       result_format="pandas")]
+        self.requests += len(frames)
+        refreshed_at = time.monotonic()
+        for frame in frames:
+            self.add_pools(frame, network_id, refreshed_at)
+        if (network_id, token_address) in self._sources:
+            self._sources[(network_id, token_address)] = (pages, refreshed_at)
+
+    def due_sources(self, now: float) -> List[Tuple[str, Optional[str], int]]:
+        return [(network_id, token_address, pages)
+                for (network_id, token_address), (pages, refreshed_at) in self._sources.items()
+                if refreshed_at is None or now - refreshed_at >= self.ttl]
+
+    async def refresh_once(self) -> int:
+        """Refetch every tracked source whose TTL expired, drop stale pools and return the sources refreshed."""
+        due = self.due_sources(time.monotonic())
+        await asyncio.gather(*(self._refresh_source(*source) for source in due))
+        self.expire()
+        return len(due)
+
+    def seconds_until_due(self, now: float) -> float:
+        if not self._sources:
+            return self.ttl
+        return max(0.0, min(0.0 if refreshed_at is None else refreshed_at + self.ttl - now
+                            for _, refreshed_at in self._sources.values()))
+
+    async def run(self):
+        """Refresh the tracked sources on their TTL until ``stop`` is called."""
+        if self.client is None:
+            raise ValueError("A client is needed to refresh the index.")
+        self._running = True
+        while self._running:
+            await self.refresh_once()
+            await asyncio.sleep(self.seconds_until_due(time.monotonic()))
+
+    def stop(self):
+        self._running = False
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from geckoterminal_py.clients.async_client import GeckoTerminalAsyncClient
+from geckoterminal_py.lazy import lazy_import
+from geckoterminal_py.rate_limiter import RateLimiter
+import geckoterminal_py.constants as CONSTANTS
+
+pd = lazy_import("pandas")
+
+
+@dataclass
+class WatchedPool:
+    network_id: str
+    pool_address: str
+    priority: float = 1.0
+    max_staleness: float = 60.0
+    last_refreshed: Optional[float] = None
+    fingerprint: Optional[int] = None
+
+    def urgency(self, now: float) -> float:
+        """How overdue the pool is: its age relative to ``max_staleness``, weighted by ``priority``."""
+        if self.last_refreshed is None:
+            return float("inf")
+        return (now - self.last_refreshed) / self.max_staleness * self.priority
+
+
+class PoolWatcher:
+    """Keep many pools fresh through batched ``get_multiple_pools_by_network`` calls under one request budget.
+
+    Watched pools are grouped by network. Every request refreshes the network whose most overdue pools
+    are the most urgent, with up to ``batch_size`` of them in one call, so hundreds of pools cost a
+    fraction of the requests that polling each one would. Only rows that changed since the previous
+    refresh of their pool are handed to ``callback`` (sync or async) and put on ``queue``.
+    """
+
+    def __init__(self, client: GeckoTerminalAsyncClient, requests_per_minute: float = 30,
+                 batch_size: int = CONSTANTS.MULTIPLE_POOLS_MAX_ADDRESSES, min_refresh_interval: float = 5.0,
+                 callback: Optional[Callable[[pd.DataFrame], None]] = None, queue: Optional[asyncio.Queue] = None):
+        if not 0 < batch_size <= CONSTANTS.MULTIPLE_POOLS_MAX_ADDRESSES:
+            raise ValueError(f"The batch size must be between 1 and {CONSTANTS.MULTIPLE_POOLS_MAX_ADDRESSES}, "
+                             f"got {batch_size}.")
+        self.client = client
+        self.budget = RateLimiter(rate=requests_per_minute, period=60.0, capacity=1)
+        self.batch_size = batch_size
+        self.min_refresh_interval = min_refresh_interval
+        self.callback = callback
+        self.queue = queue
+        self.requests = 0
+        self._pools: Dict[Tuple[str, str], WatchedPool] = {}
+        self._running = False
+
+    def watch(self, network_id: str, pool_address: str, priority: float = 1.0, max_staleness: float = 60.0):
+        key = (network_id, pool_address.lower())
+        pool = self._pools.get(key)
+        if pool is None:
+            self._pools[key] = WatchedPool(network_id, pool_address, priority, max_staleness)
+        else:
+            pool.priority, pool.max_staleness = priority, max_staleness
+
+    def unwatch(self, network_id: str, pool_address: str):
+        self._pools.pop((network_id, pool_address.lower()), None)
+
+    @property
+    def watched_pools(self) -> List[WatchedPool]:
+        return list(self._pools.values())
+
+    def next_batch(self, now: float) -> Optional[Tuple[str, List[WatchedPool]]]:
+        """Pick the network and pools for the next request, or ``None`` when no pool is due yet."""
+        due_by_network: Dict[str, List[WatchedPool]] = {}
+        for pool in self._pools.values():
+            if pool.last_refreshed is None or now - pool.last_refreshed >= self.min_refresh_interval:
+                due_by_network.setdefault(pool.network_id, []).append(pool)
+        best = None
+        for network_id, pools in due_by_network.items():
+            pools.sort(key=lambda p: p.urgency(now), reverse=True)
+            batch = pools[:self.batch_size]
+            score = sum(min(p.urgency(now), 1e12) for p in batch)
+            if best is None or score > best[0]:
+                best = (score, network_id, batch)
+        return (best[1], best[2]) if best else None
+
+    def seconds_until_due(self, now: float) -> float:
+        if not self._pools:
+            return self.min_refresh_interval
+        return max(0.0, min(0.0 if p.last_refreshed is None else p.last_refreshed + self.min_refresh_interval - now
+                            for p in self._pools.values()))
+
+    async def refresh_once(self) -> Optional[pd.DataFrame]:
+        """Spend one request of the budget on the most urgent batch and return its changed rows."""
+        if self.next_batch(time.monotonic()) is None:
+            return None
+        await self.budget.acquire_async()
+        batch = self.next_batch(time.monotonic())
+        if batch is None:
+            return None
+        network_id, pools = batch
+        pools_df = await self.client.get_multiple_pools_by_network(network_id, [p.pool_address for p in pools],
+                                                                   result_format="pandas")
+        self.requests += 1
+        refreshed_at = time.monotonic()
+        for pool in pools:
+            pool.last_refreshed = refreshed_at
+        changed = self._changed_rows(network_id, pools_df)
+        if not changed.empty:
+            if self.callback is not None:
+                result = self.callback(changed)
+                if inspect.isawaitable(result):
+                    await result
+            if self.queue is not None:
+                await self.queue.put(changed)
+        return changed
+
+    def _changed_rows(self, network_id: str, pools_df: pd.DataFrame) -> pd.DataFrame:
+        if pools_df.empty:
+            return pools_df
+        fingerprints = pd.util.hash_pandas_object(pools_df, index=False).to_numpy()
+        changed_positions = []
+        for position, (address, fingerprint) in enumerate(zip(pools_df["address"], fingerprints)):
+            pool = self._pools.get((network_id, str(address).lower()))
+            if pool is not None and pool.fingerprint != fingerprint:
+                pool.fingerprint = fingerprint
+                changed_positions.append(position)
+        changed = pools_df.iloc[changed_positions].reset_index(drop=True)
+        if "network_id" not in changed.columns:
+            changed.insert(0, "network_id", network_id)
+        return changed
+
+    async def run(self):
+        """Refresh watched pools until ``stop`` is called."""
+        self._running = True
+        while self._running:
+            if await self.refresh_once() is None:
+                await asyncio.sleep(self.seconds_until_due(time.monotonic()))
+
+    def stop(self):
+        self._running = False
@@ -0,0 +1,135 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from geckoterminal_py import GeckoTerminalAsyncClient, GeckoTerminalSyncClient, MemoryCacheBackend, ResponseCache
+import geckoterminal_py.constants as CONSTANTS
+from tests.utils import get_response_from_file
+
+
+class TestResponseCache:
+    """Test suite for the ResponseCache TTL/LRU layer."""
+
+    def test_ttl_is_resolved_from_path_templates(self):
+        """Literal and parametrised path templates resolve to their own TTLs."""
+        cache = ResponseCache(ttls={"networks/{}/dexes": 5}, default_ttl=0)
+        assert cache.ttl_for("networks") == 6 * 60 * 60
+        assert cache.ttl_for("networks/new_pools") == 30
+        assert cache.ttl_for("networks/eth/dexes") == 5
+        assert cache.ttl_for("search/pools") == 0
+
+    def test_hit_returns_a_fresh_copy(self):
+        """Hits decode the stored body again so callers cannot corrupt the cache."""
+        cache = ResponseCache()
+        cache.set("GET", "networks", None, b'{"data": [1]}')
+        first = cache.get("GET", "networks")
+        first["data"] = "mutated"
+        assert cache.get("GET", "networks") == {"data": [1]}
+        assert cache.stats()["hits"] == 2
+
+    def test_expired_entries_miss(self):
+        """An entry whose TTL elapsed is reported as a miss."""
+        cache = ResponseCache(ttls={"networks": -1}, default_ttl=0)
+        cache.set("GET", "networks", None, b"{}")
+        assert cache.get("GET", "networks") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction_respects_byte_budget(self):
+        """The least recently used entries are evicted once the byte budget is exceeded."""
+        backend = MemoryCacheBackend(max_bytes=10)
+        backend.set("a", 0, b"12345")
+        backend.set("b", 0, b"12345")
+        backend.get("a")
+        backend.set("c", 0, b"12345")
+        assert backend.get("b") is None
+        assert backend.get("a") is not None
+        assert backend.evictions == 1
+        assert backend.current_bytes == 10
+
+    def test_disk_backend_starts_warm(self, tmp_path):
+        """A new cache pointing to the same file serves what a previous one stored."""
+        path = str(tmp_path / "cache.sqlite")
+        cache = ResponseCache(disk_path=path)
+        cache.set("GET", "networks/eth/dexes", {"page": 1}, b'{"data": []}')
+        cache.close()
+        restarted = ResponseCache(disk_path=path)
+        assert restarted.get("GET", "networks/eth/dexes", {"page": 1}) == {"data": []}
+        assert restarted.get("GET", "networks/eth/dexes", {"page": 2}) is None
+        restarted.close()
+
+    def test_expired_rows_are_deleted_from_disk(self, tmp_path):
+        """Expired rows are deleted when read and by the periodic purge instead of piling up in the file."""
+        cache = ResponseCache(ttls={CONSTANTS.GET_TRADES_BY_NETWORK_POOL_PATH: 0.05},
+                              disk_path=str(tmp_path / "cache.sqlite"), purge_interval=0)
+        cache.set("GET", "networks/eth/pools/0xa/trades", None, b"{}")
+        cache.set("GET", "networks/eth/pools/0xb/trades", None, b"{}")
+        time.sleep(0.1)
+        assert cache.get("GET", "networks/eth/pools/0xa/trades") is None
+        assert len(cache.disk) == 1
+        cache.set("GET", "networks/eth/dexes", None, b"{}")
+        assert len(cache.disk) == 1
+        assert len(cache.memory) == 1
+        assert cache.stats()["purged"] == 1
+        cache.close()
+
+    def test_counters_are_exact_under_threads(self):
+        cache = ResponseCache()
+        cache.set("GET", "networks", None, b"{}")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: cache.get("GET", "networks"), range(2000)))
+        assert cache.stats()["hits"] == 2000
+
+
+class TestClientCaching:
+    """Both clients serve repeated reference data requests from a shared cache."""
+
+    def test_sync_client_uses_cache(self):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(200, json=get_response_from_file("get_networks"))
+
+        cache = ResponseCache()
+        client = GeckoTerminalSyncClient(transport=httpx.MockTransport(handler), cache=cache)
+        first, second = client.get_networks(), client.get_networks()
+        client.close()
+        assert first.equals(second)
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_hits_are_decoded_with_the_client_json_backend(self):
+        decoded = []
+
+        def json_loads(body):
+            decoded.append(body)
+            return json.loads(body)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=get_response_from_file("get_networks"))
+
+        cache = ResponseCache()
+        client = GeckoTerminalSyncClient(transport=httpx.MockTransport(handler), cache=cache, json_backend="json")
+        client.json_loads = json_loads
+        client.get_networks()
+        client.get_networks()
+        client.close()
+        assert len(decoded) == 2
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_client_uses_cache(self):
+        calls = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(200, json=get_response_from_file("get_networks"))
+
+        client = GeckoTerminalAsyncClient(transport=httpx.MockTransport(handler), cache=ResponseCache())
+        await client.get_networks()
+        await client.get_networks()
+        await client.close()
+        assert len(calls) == 1
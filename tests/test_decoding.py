@@ -0,0 +1,44 @@
+import json
+
+import numpy as np
+import pytest
+
+from geckoterminal_py import GeckoTerminalSyncClient
+from geckoterminal_py.decoding import get_json_decoder, ohlcv_array
+
+
+class TestJsonDecoder:
+    """Test suite for the JSON backend selection."""
+
+    def test_backends_decode_alike(self):
+        body = json.dumps({"data": [{"id": "eth_0x1", "attributes": {"price": "1.5", "volume": 2.25}}]}).encode()
+        assert get_json_decoder("auto")(body) == get_json_decoder("json")(body) == json.loads(body)
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            get_json_decoder("yaml")
+
+    def test_client_uses_requested_backend(self):
+        assert GeckoTerminalSyncClient(json_backend="json").json_loads is json.loads
+
+
+class TestOhlcvArray:
+    """Test suite for the float64 OHLCV conversion."""
+
+    def test_matches_asarray(self):
+        ohlcv_list = [[1700000000 + i * 60, 1.5 + i, 2, 0.5, 1.75, 1000] for i in range(5)]
+        values = ohlcv_array(ohlcv_list)
+        assert values.dtype == np.float64
+        np.testing.assert_array_equal(values, np.asarray(ohlcv_list, dtype=np.float64))
+
+    def test_nulls_become_nan(self):
+        values = ohlcv_array([[1700000000, 1.0, None, 0.5, 1.0, 10.0]])
+        assert np.isnan(values[0, 2])
+
+    def test_empty(self):
+        assert ohlcv_array([]).shape == (0, 6)
+
+    def test_rows_of_the_wrong_width_are_rejected(self):
+        for bad_row in ([1700000060, 1.0, 1.0, 1.0, 1.0, 1.0, 99.0], [1700000060, 1.0]):
+            with pytest.raises(ValueError):
+                ohlcv_array([[1700000000, 1.0, 2.0, 0.5, 1.0, 10.0], bad_row, [1700000120, 1.0, 2.0, 0.5, 1.0, 10.0]])
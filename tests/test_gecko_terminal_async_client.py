@@ -1,9 +1,10 @@
 import asyncio
+import numpy as np
 import pandas as pd
 import pytest
 import httpx
 from httpx import Request, Response
-from geckoterminal_py import GeckoTerminalAsyncClient
+from geckoterminal_py import ConnectionConfig, GeckoTerminalAsyncClient, ParquetSink, RetryPolicy
 
 
 # Helper function to load JSON data from a file.
@@ -44,6 +45,54 @@ async def unified_request_handler(request: Request) -> Response:
     return httpx.Response(404, json={"error": "not found"})
 
 
+# Request handler that serves synthetic hourly candles honouring ``before_timestamp`` and ``limit``.
+async def ohlcv_range_request_handler(request: Request) -> Response:
+    """Serve up to ``limit`` hourly candles strictly before ``before_timestamp``."""
+    before_timestamp = int(request.url.params["before_timestamp"])
+    limit = int(request.url.params["limit"])
+    last = (before_timestamp - 1) // 3600 * 3600
+    ohlcv_list = [[ts, 1.0, 2.0, 0.5, 1.5, 100.0] for ts in range(last, last - limit * 3600, -3600)]
+    return httpx.Response(200, json={"data": {"attributes": {"ohlcv_list": ohlcv_list}}})
+
+
+# Request handler that prices every address found in a simple token price path.
+async def simple_token_price_request_handler(request: Request) -> Response:
+    """Answer a simple token price request with one price per requested address."""
+    addresses = request.url.path.rsplit("/", 1)[-1].split(",")
+    assert len(addresses) <= 30
+    attributes = {"token_prices": {address: "1.5" for address in addresses}}
+    if request.url.params.get("include_24hr_vol") == "true":
+        attributes["h24_volume_usd"] = {address: "1000" for address in addresses}
+    return httpx.Response(200, json={"data": {"id": "1", "type": "simple_token_price", "attributes": attributes}})
+
+
+def trades_page(blocks) -> dict:
+    """Build a trades response with one trade per block, newest first like the API."""
+    return {"data": [{"id": f"eth_{block}_0xhash_{block}", "type": "trade",
+                      "attributes": {"block_number": block, "block_timestamp": f"2024-01-01T00:{block:02d}:00Z",
+                                     "tx_hash": f"0x{block}", "kind": "buy", "volume_in_usd": "10.0"}}
+                     for block in sorted(blocks, reverse=True)]}
+
+
+# Request handler serving the 10 newest of 50 trades above the requested volume; older trades are larger.
+async def trades_history_request_handler(request: Request) -> Response:
+    """Serve one block per trade (minute ``block`` of the hour) with ``(60 - block) * 1000`` USD volume."""
+    min_volume = float(request.url.params.get("trade_volume_in_usd_greater_than") or 0)
+    blocks = [block for block in range(50) if (60 - block) * 1000 > min_volume][-10:]
+    page = trades_page(blocks)
+    for trade in page["data"]:
+        trade["attributes"]["volume_in_usd"] = str((60 - trade["attributes"]["block_number"]) * 1000)
+    return httpx.Response(200, json=page)
+
+
+def pools_page(network_id, addresses) -> dict:
+    """Build a pools response with one pool per address on a DEX named after the network."""
+    return {"data": [{"id": f"{network_id}_{address}", "type": "pool",
+                      "attributes": {"address": address, "reserve_in_usd": "1000.5"},
+                      "relationships": {"dex": {"data": {"id": f"{network_id}_dex", "type": "dex"}}}}
+                     for address in addresses]}
+
+
 @pytest.fixture
 def client():
     """Pytest fixture to provide a GeckoTerminalAsyncClient instance with a mocked HTTP transport."""
@@ -88,6 +137,18 @@ class TestGeckoTerminalAsyncClient:
         assert list(top_pools.columns) == expected_columns
         assert all(top_pools['network_id'] == 'eth')
 
+    @pytest.mark.asyncio
+    async def test_pool_columns_are_typed(self, client):
+        """Pool frames carry numeric, datetime and categorical dtypes instead of strings."""
+        top_pools = await client.get_top_pools_by_network(network_id="eth")
+        assert top_pools["reserve_in_usd"].dtype == "float64"
+        assert top_pools["base_token_price_usd"].dtype == "float64"
+        assert top_pools["transactions_h24_buys"].dtype == "Int64"
+        assert isinstance(top_pools["pool_created_at"].dtype, pd.DatetimeTZDtype)
+        assert isinstance(top_pools["network_id"].dtype, pd.CategoricalDtype)
+        assert isinstance(top_pools["dex_id"].dtype, pd.CategoricalDtype)
+        assert not top_pools["base_token_id"].str.contains("_").any()
+
     @pytest.mark.asyncio
     async def test_get_top_pools_by_network_dex(self, client):
         """Test fetching top pools by network and DEX and validate the response."""
@@ -153,6 +214,42 @@ class TestGeckoTerminalAsyncClient:
         expected_columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume_usd', 'datetime']
         assert list(ohlcv.columns) == expected_columns
 
+    @pytest.mark.asyncio
+    async def test_get_ohlcv_range(self):
+        """A range spanning several pages is fetched concurrently and returned as one deduplicated frame."""
+        range_client = GeckoTerminalAsyncClient(transport=httpx.MockTransport(ohlcv_range_request_handler))
+        start, end = 1_700_000_000 // 3600 * 3600, 1_700_000_000 // 3600 * 3600 + 2500 * 3600
+        ohlcv = await range_client.get_ohlcv_range(network_id="eth", pool_address="0xpool", timeframe="1h",
+                                                   start=start, end=end)
+        await range_client.close()
+        assert list(ohlcv.columns) == ['timestamp', 'open', 'high', 'low', 'close', 'volume_usd', 'datetime']
+        assert len(ohlcv) == 2501
+        assert ohlcv["timestamp"].iloc[0] == start
+        assert ohlcv["timestamp"].iloc[-1] == end
+        assert ohlcv["timestamp"].is_unique
+
+    @pytest.mark.asyncio
+    async def test_get_ohlcv_panel(self):
+        """Pools with missing candles are aligned on one grid and their gaps show up in the mask."""
+        async def handler(request: Request) -> Response:
+            response = await ohlcv_range_request_handler(request)
+            if "/0xgappy/" not in request.url.path:
+                return response
+            ohlcv_list = response.json()["data"]["attributes"]["ohlcv_list"]
+            return httpx.Response(200, json={"data": {"attributes": {
+                "ohlcv_list": [candle for candle in ohlcv_list if candle[0] // 3600 % 4]}}})
+
+        panel_client = GeckoTerminalAsyncClient(transport=httpx.MockTransport(handler))
+        start = 1_700_000_000 // 3600 * 3600
+        panel = await panel_client.get_ohlcv_panel([("eth", "0xfull"), ("eth", "0xgappy")], "1h",
+                                                   start=start, end=start + 1200 * 3600, max_concurrency=3)
+        await panel_client.close()
+        assert panel["open"].shape == (1201, 2)
+        assert panel.mask[:, 0].all()
+        np.testing.assert_array_equal(panel.missing[:, 1], panel.timestamps // 3600 % 4 == 0)
+        assert (panel["volume_usd"][panel.mask] == 100.0).all()
+        assert panel.to_frame("close")["eth_0xgappy"].isna().sum() == panel.missing[:, 1].sum()
+
     @pytest.mark.asyncio
     async def test_get_simple_token_price(self, client):
         """Test fetching simple token prices for multiple addresses in a single call."""
@@ -174,6 +271,21 @@ class TestGeckoTerminalAsyncClient:
         assert weth["price_usd"] == "2958.19885153499"
         assert weth["volume_usd_h24"] == "1200000000"
 
+    @pytest.mark.asyncio
+    async def test_get_simple_token_price_bulk(self):
+        """Any number of addresses is chunked, deduplicated and merged into one frame with every price column."""
+        bulk_client = GeckoTerminalAsyncClient(transport=httpx.MockTransport(simple_token_price_request_handler))
+        token_addresses = [f"0x{i:040x}" for i in range(75)]
+        prices = await bulk_client.get_simple_token_price_bulk(network_id="eth",
+                                                               token_addresses=token_addresses + token_addresses[:10],
+                                                               include_24hr_vol=True)
+        await bulk_client.close()
+        assert list(prices.columns) == ['token_address', 'price_usd', 'market_cap_usd', 'volume_usd_h24',
+                                        'price_change_percentage_h24', 'reserve_in_usd']
+        assert list(prices["token_address"]) == token_addresses
+        assert all(prices["volume_usd_h24"] == "1000")
+        assert prices["market_cap_usd"].isna().all()
+
     @pytest.mark.asyncio
     async def test_get_simple_token_price_empty(self, client):
         """An empty address list returns an empty frame without hitting the API."""
@@ -187,3 +299,170 @@ class TestGeckoTerminalAsyncClient:
         """Requesting more than the per-call address limit raises a ValueError."""
         with pytest.raises(ValueError):
             await client.get_simple_token_price(network_id="eth", token_addresses=[str(i) for i in range(31)])
+
+    @pytest.mark.asyncio
+    async def test_api_request_retries_throttled_responses(self):
+        """A 429 with Retry-After is retried until the API answers."""
+        responses = [httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(503),
+                     httpx.Response(200, json=load_json("test_data/get_networks.json"))]
+
+        async def handler(request: Request) -> Response:
+            return responses.pop(0)
+
+        retry_client = GeckoTerminalAsyncClient(transport=httpx.MockTransport(handler),
+                                              retry_policy=RetryPolicy(backoff_base=0.001))
+        networks = await retry_client.get_networks()
+        await retry_client.close()
+        assert not networks.empty
+        assert responses == []
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_requests_are_coalesced(self):
+        """Concurrent identical requests share one HTTP call and each get their own parsed copy."""
+        calls = []
+
+        async def handler(request: Request) -> Response:
+            calls.append(request.url.path)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=load_json("test_data/get_top_pools_by_network.json"))
+
+        coalescing_client = GeckoTerminalAsyncClient(transport=httpx.MockTransport(handler))
+        results = await asyncio.gather(*(coalescing_client.get_top_pools_by_network(network_id="eth")
+                                         for _ in range(10)))
+        other = await coalescing_client.get_top_pools_by_network(network_id="eth")
+        await coalescing_client.close()
+        assert len(calls) == 2
+        assert all(result.equals(results[0]) for result in results)
+        assert other.equals(results[0])
+        assert coalescing_client._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_stream_trades_yields_only_new_trades(self):
+        """Overlapping polls yield each trade once, in block order, and empty polls yield nothing."""
+        pages = [trades_page(range(1, 4)), trades_page(range(2, 6)), trades_page(range(2, 6)), trades_page(range(4, 8))]
+
+        async def handler(request: Request) -> Response:
+            return httpx.Response(200, json=pages.pop(0))
+
+        stream_client = GeckoTerminalAsyncClient(transport=httpx.MockTransport(handler))
+        stream = stream_client.stream_trades("eth", "0xpool", interval=0, min_interval=0, max_interval=0,
+                                             max_seen_ids=4)
+        batches = [await stream.__anext__() for _ in range(3)]
+        await stream.aclose()
+        await stream_client.close()
+        assert [list(batch["block_number"]) for batch in batches] == [[1, 2, 3], [4, 5], [6, 7]]
+        assert pages == []
+
+    @pytest.mark.asyncio
+    async def test_context_manager_applies_connection_config(self):
+        """Connection settings reach the underlying client, which is closed when the block exits."""
+        config = ConnectionConfig(max_connections=7, read_timeout=30.0)
+        async with GeckoTerminalAsyncClient(transport=httpx.MockTransport(unified_request_handler),
+                                            connection_config=config) as configured_client:
+            assert configured_client.client.timeout.read == 30.0
+            assert not (await configured_client.get_networks()).empty
+        assert configured_client.client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_injected_http_client_is_shared(self):
+        """An injected client gets the API headers per request and is left open on close."""
+        seen_headers = []
+
+        async def handler(request: Request) -> Response:
+            seen_headers.append(request.headers["Accept"])
+            return await unified_request_handler(request)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+            async with GeckoTerminalAsyncClient(http_client=http_client) as shared_client:
+                await shared_client.get_networks()
+            assert not http_client.is_closed
+        assert seen_headers == [GeckoTerminalAsyncClient.headers["Accept"]]
+
+    @pytest.mark.asyncio
+    async def test_scan_pools_fans_out_across_networks_and_pages(self):
+        """Every network page is read, each network, list and page requested once and each pool kept once."""
+        calls = []
+        network_pages = {"1": ["eth", "bsc"], "2": ["base"]}
+
+        async def handler(request: Request) -> Response:
+            calls.append((request.url.path, request.url.params.get("page")))
+            parts = request.url.path.split("/")
+            if parts[-1] == "networks":
+                return httpx.Response(200, json={"data": [{"id": network_id, "type": "network"} for network_id
+                                                          in network_pages.get(request.url.params["page"], [])]})
+            network_id, pool_list, page = parts[-2], parts[-1], request.url.params["page"]
+            if page == "2":
+                return httpx.Response(200, json=pools_page(network_id, []))
+            addresses = {"trending_pools": ["0xa", "0xb"], "new_pools": ["0xc"], "pools": ["0xb", "0xd"]}[pool_list]
+            return httpx.Response(200, json=pools_page(network_id, addresses))
+
+        scan_client = GeckoTerminalAsyncClient(transport=httpx.MockTransport(handler))
+        streamed = {}
+        universe = await scan_client.scan_pools(pages=2, max_concurrency=4,
+                                                on_network=lambda network_id, pools: streamed.update(
+                                                    {network_id: pools}))
+        await scan_client.close()
+        assert len(calls) == 3 + 3 * 3 * 2
+        assert set(streamed) == {"eth", "bsc", "base"}
+        assert streamed["eth"]["address"].tolist() == ["0xa", "0xb", "0xc", "0xd"]
+        assert streamed["eth"]["pool_list"].tolist() == ["trending", "trending", "new", "top"]
+        assert len(universe) == 12
+        assert universe["id"].is_unique
+        assert isinstance(universe["network_id"].dtype, pd.CategoricalDtype)
+        assert universe["reserve_in_usd"].dtype == "float64"
+
+    @pytest.mark.asyncio
+    async def test_scan_pools_rejects_unknown_lists(self, client):
+        with pytest.raises(ValueError):
+            await client.scan_pools(network_ids=["eth"], kinds=["hot"])
+
+    @pytest.mark.asyncio
+    async def test_iter_top_pools_walks_pages_until_empty(self):
+        """Pages are prefetched one ahead, iteration stops on an empty page and honours ``max_pages``."""
+        requested_pages = []
+
+        async def handler(request: Request) -> Response:
+            page = int(request.url.params["page"])
+            requested_pages.append(page)
+            addresses = [f"0x{page}{i}" for i in range(3)] if page <= 2 else []
+            return httpx.Response(200, json=pools_page("eth", addresses))
+
+        paged_client = GeckoTerminalAsyncClient(transport=httpx.MockTransport(handler))
+        pages = [page async for page in paged_client.iter_top_pools_by_network("eth")]
+        assert [page["address"].tolist() for page in pages] == [["0x10", "0x11", "0x12"], ["0x20", "0x21", "0x22"]]
+        assert requested_pages == [1, 2, 3]
+        requested_pages.clear()
+        pages = [page async for page in paged_client.iter_top_pools_by_network("eth", max_pages=1)]
+        assert len(pages) == 1
+        assert requested_pages == [1]
+        await paged_client.close()
+
+    @pytest.mark.asyncio
+    async def test_iter_trade_history_reaches_back_through_volume_windows(self):
+        """Every volume window adds older trades, each trade is yielded once and the block window applies."""
+        history_client = GeckoTerminalAsyncClient(transport=httpx.MockTransport(trades_history_request_handler))
+        chunks = [chunk async for chunk in history_client.iter_trade_history(
+            "eth", "0xpool", start_block=15, volume_thresholds=(None, 20_000, 20_000, 40_000))]
+        await history_client.close()
+        trades = pd.concat(chunks)
+        assert len(chunks) == 3
+        assert trades["id"].is_unique
+        assert sorted(trades["block_number"]) == list(range(15, 20)) + list(range(30, 50))
+        assert all(chunk["block_number"].is_monotonic_increasing for chunk in chunks)
+
+    @pytest.mark.asyncio
+    async def test_backfill_trades_streams_to_sinks(self, tmp_path):
+        """Chunks go to a Parquet file and a queue; the time window filters on ``block_timestamp``."""
+        pytest.importorskip("pyarrow")
+        history_client = GeckoTerminalAsyncClient(transport=httpx.MockTransport(trades_history_request_handler))
+        queue = asyncio.Queue()
+        start = int(pd.Timestamp("2024-01-01T00:35:00Z").timestamp())
+        with ParquetSink(tmp_path / "trades.parquet") as sink:
+            delivered = await history_client.backfill_trades("eth", "0xpool", callback=sink, queue=queue,
+                                                             start=start, volume_thresholds=(None, 20_000))
+        await history_client.close()
+        assert delivered == sink.rows == 15
+        assert sorted(pd.read_parquet(tmp_path / "trades.parquet")["block_number"]) == list(range(35, 50))
+        assert sum(len(queue.get_nowait()) for _ in range(queue.qsize())) == 15
+        with pytest.raises(ValueError):
+            await history_client.backfill_trades("eth", "0xpool")
@@ -1,9 +1,12 @@
 import asyncio
+import threading
+import time
 import pandas as pd
 import pytest
 import httpx
 from httpx import Request, Response
-from geckoterminal_py import GeckoTerminalAsyncClient, GeckoTerminalSyncClient
+from geckoterminal_py import (ConnectionConfig, GeckoTerminalAsyncClient, GeckoTerminalSyncClient, RateLimiter,
+                              RetryPolicy)
 
 
 # Helper function to load JSON data from a file.
@@ -44,6 +47,27 @@ def unified_request_handler(request: Request) -> Response:
     return httpx.Response(404, json={"error": "not found"})
 
 
+# Request handler that serves synthetic hourly candles honouring ``before_timestamp`` and ``limit``.
+def ohlcv_range_request_handler(request: Request) -> Response:
+    """Serve up to ``limit`` hourly candles strictly before ``before_timestamp``."""
+    before_timestamp = int(request.url.params["before_timestamp"])
+    limit = int(request.url.params["limit"])
+    last = (before_timestamp - 1) // 3600 * 3600
+    ohlcv_list = [[ts, 1.0, 2.0, 0.5, 1.5, 100.0] for ts in range(last, last - limit * 3600, -3600)]
+    return httpx.Response(200, json={"data": {"attributes": {"ohlcv_list": ohlcv_list}}})
+
+
+# Request handler that prices every address found in a simple token price path.
+def simple_token_price_request_handler(request: Request) -> Response:
+    """Answer a simple token price request with one price per requested address."""
+    addresses = request.url.path.rsplit("/", 1)[-1].split(",")
+    assert len(addresses) <= 30
+    attributes = {"token_prices": {address: "1.5" for address in addresses}}
+    if request.url.params.get("include_24hr_vol") == "true":
+        attributes["h24_volume_usd"] = {address: "1000" for address in addresses}
+    return httpx.Response(200, json={"data": {"id": "1", "type": "simple_token_price", "attributes": attributes}})
+
+
 @pytest.fixture
 def client():
     """Pytest fixture to provide a GeckoTerminalAsyncClient instance with a mocked HTTP transport."""
@@ -85,6 +109,17 @@ class TestGeckoTerminalSyncClient:
         assert list(top_pools.columns) == expected_columns
         assert all(top_pools['network_id'] == 'eth')
 
+    def test_pool_columns_are_typed(self, client):
+        """Pool frames carry numeric, datetime and categorical dtypes instead of strings."""
+        top_pools = client.get_top_pools_by_network(network_id="eth")
+        assert top_pools["reserve_in_usd"].dtype == "float64"
+        assert top_pools["base_token_price_usd"].dtype == "float64"
+        assert top_pools["transactions_h24_buys"].dtype == "Int64"
+        assert isinstance(top_pools["pool_created_at"].dtype, pd.DatetimeTZDtype)
+        assert isinstance(top_pools["network_id"].dtype, pd.CategoricalDtype)
+        assert isinstance(top_pools["dex_id"].dtype, pd.CategoricalDtype)
+        assert not top_pools["base_token_id"].str.contains("_").any()
+
     def test_get_top_pools_by_network_dex(self, client):
         """Test fetching top pools by network and DEX and validate the response."""
         top_pools = client.get_top_pools_by_network_dex(network_id="eth", dex_id="sushiswap")
@@ -125,6 +160,21 @@ class TestGeckoTerminalSyncClient:
                             'base_token_id', 'quote_token_id', 'network_id']
         assert list(new_pools.columns) == expected_columns
 
+    def test_network_ids_with_underscores(self, client):
+        """Network ids such as ``polygon_pos`` stay whole and token ids lose the full network prefix."""
+        new_pools = client.get_new_pools_all_networks()
+        assert {"polygon_pos", "arbitrum_nova"} <= set(new_pools["network_id"])
+        nova = new_pools[new_pools["network_id"] == "arbitrum_nova"].iloc[0]
+        assert nova["base_token_id"] == "0x1d05e4e72cd994cdf976181cfb0707345763564d"
+        assert nova["quote_token_id"] == "0x722e8bdd2ce80a4422e880164f2079488e115365"
+        # The fixture row also carries malformed transaction counts, which become missing instead of failing.
+        assert pd.isna(nova["transactions_h1_buys"]) and pd.isna(nova["transactions_h24_sells"])
+        assert nova["transactions_h24_buys"] == 3
+        assert new_pools["transactions_h24_buys"].dtype == "Int64"
+        records = client.get_new_pools_all_networks(result_format="records")
+        assert [pool.network_id for pool in records] == new_pools["network_id"].tolist()
+        assert [pool.base_token_id for pool in records] == new_pools["base_token_id"].tolist()
+
     def test_get_new_pools_by_network(self, client):
         """Test fetching new pools by network and validate the response."""
         new_pools = client.get_new_pools_by_network(network_id="eth")
@@ -145,6 +195,32 @@ class TestGeckoTerminalSyncClient:
         expected_columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume_usd', 'datetime']
         assert list(ohlcv.columns) == expected_columns
 
+    def test_get_ohlcv_range(self):
+        """A range spanning several pages is walked page by page and returned as one deduplicated frame."""
+        range_client = GeckoTerminalSyncClient(transport=httpx.MockTransport(ohlcv_range_request_handler))
+        start, end = 1_700_000_000 // 3600 * 3600, 1_700_000_000 // 3600 * 3600 + 2500 * 3600
+        ohlcv = range_client.get_ohlcv_range(network_id="eth", pool_address="0xpool", timeframe="1h",
+                                             start=start, end=end)
+        range_client.close()
+        assert list(ohlcv.columns) == ['timestamp', 'open', 'high', 'low', 'close', 'volume_usd', 'datetime']
+        assert len(ohlcv) == 2501
+        assert ohlcv["timestamp"].iloc[0] == start
+        assert ohlcv["timestamp"].iloc[-1] == end
+        assert ohlcv["timestamp"].is_unique
+
+    def test_get_ohlcv_panel(self):
+        """Every pool of a panel is fetched and aligned on the same hourly grid."""
+        panel_client = GeckoTerminalSyncClient(transport=httpx.MockTransport(ohlcv_range_request_handler))
+        start = 1_700_000_000 // 3600 * 3600
+        pools = [("eth", "0xa"), ("eth", "0xb"), ("base", "0xc")]
+        panel = panel_client.get_ohlcv_panel(pools, "1h", start=start, end=start + 1500 * 3600)
+        panel_client.close()
+        assert panel.pools == pools
+        assert panel["close"].shape == panel.mask.shape == (1501, 3)
+        assert panel.mask.all()
+        assert panel.timestamps[0] == start
+        assert (panel["close"] == 1.5).all()
+
     def test_get_simple_token_price(self, client):
         """Test fetching simple token prices for multiple addresses in a single call."""
         prices = client.get_simple_token_price(
@@ -162,6 +238,20 @@ class TestGeckoTerminalSyncClient:
         assert list(prices.columns) == expected_columns
         assert len(prices) == 2
 
+    def test_get_simple_token_price_bulk(self):
+        """Any number of addresses is chunked, deduplicated and merged into one frame with every price column."""
+        bulk_client = GeckoTerminalSyncClient(transport=httpx.MockTransport(simple_token_price_request_handler))
+        token_addresses = [f"0x{i:040x}" for i in range(75)]
+        prices = bulk_client.get_simple_token_price_bulk(network_id="eth",
+                                                         token_addresses=token_addresses + token_addresses[:10],
+                                                         include_24hr_vol=True)
+        bulk_client.close()
+        assert list(prices.columns) == ['token_address', 'price_usd', 'market_cap_usd', 'volume_usd_h24',
+                                        'price_change_percentage_h24', 'reserve_in_usd']
+        assert list(prices["token_address"]) == token_addresses
+        assert all(prices["volume_usd_h24"] == "1000")
+        assert prices["market_cap_usd"].isna().all()
+
     def test_get_simple_token_price_empty(self, client):
         """An empty address list returns an empty frame without hitting the API."""
         prices = client.get_simple_token_price(network_id="eth", token_addresses=[])
@@ -173,3 +263,134 @@ class TestGeckoTerminalSyncClient:
         """Requesting more than the per-call address limit raises a ValueError."""
         with pytest.raises(ValueError):
             client.get_simple_token_price(network_id="eth", token_addresses=[str(i) for i in range(31)])
+
+    def test_api_request_retries_throttled_responses(self):
+        """A 429 with Retry-After is retried until the API answers."""
+        responses = [httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(503),
+                     httpx.Response(200, json=load_json("test_data/get_networks.json"))]
+        retry_client = GeckoTerminalSyncClient(transport=httpx.MockTransport(lambda request: responses.pop(0)),
+                                             retry_policy=RetryPolicy(backoff_base=0.001))
+        networks = retry_client.get_networks()
+        retry_client.close()
+        assert not networks.empty
+        assert responses == []
+
+    def test_context_manager_applies_connection_config(self):
+        """Connection settings reach the underlying client, which is closed when the block exits."""
+        config = ConnectionConfig(max_connections=7, read_timeout=30.0)
+        with GeckoTerminalSyncClient(transport=httpx.MockTransport(unified_request_handler),
+                                     connection_config=config) as configured_client:
+            assert configured_client.client.timeout.read == 30.0
+            assert not configured_client.get_networks().empty
+        assert configured_client.client.is_closed
+
+    def test_injected_http_client_is_shared(self):
+        """An injected client gets the API headers per request and is left open on close."""
+        seen_headers = []
+
+        def handler(request: Request) -> Response:
+            seen_headers.append(request.headers["Accept"])
+            return unified_request_handler(request)
+
+        with httpx.Client(transport=httpx.MockTransport(handler)) as http_client:
+            with GeckoTerminalSyncClient(http_client=http_client) as shared_client:
+                shared_client.get_networks()
+            assert not http_client.is_closed
+        assert seen_headers == [GeckoTerminalSyncClient.headers["Accept"]]
+
+    def test_transport_and_http_client_are_exclusive(self):
+        with pytest.raises(ValueError):
+            GeckoTerminalSyncClient(transport=httpx.MockTransport(unified_request_handler), http_client=httpx.Client())
+        with pytest.raises(ValueError):
+            GeckoTerminalSyncClient(connection_config=ConnectionConfig(http2=True), http_client=httpx.Client())
+
+    def test_iter_networks_walks_pages_until_empty(self):
+        """Pages are requested in order, prefetched one ahead and iteration stops on the first empty page."""
+        requested_pages = []
+
+        def handler(request: Request) -> Response:
+            page = int(request.url.params["page"])
+            requested_pages.append(page)
+            networks = [{"id": f"net_{page}_{i}", "type": "network"} for i in range(2)] if page <= 3 else []
+            return httpx.Response(200, json={"data": networks})
+
+        with GeckoTerminalSyncClient(transport=httpx.MockTransport(handler)) as paged_client:
+            pages = list(paged_client.iter_networks())
+            assert [page["id"].iloc[0] for page in pages] == ["net_1_0", "net_2_0", "net_3_0"]
+            assert sorted(requested_pages) == [1, 2, 3, 4]
+            requested_pages.clear()
+            pages = list(paged_client.iter_networks(max_pages=2, prefetch=False, result_format="records"))
+            assert [len(page) for page in pages] == [2, 2]
+            assert requested_pages == [1, 2]
+
+    def test_pool_endpoints_match_the_async_client(self):
+        """Endpoints that used to be async only are available and parse single and multiple pools alike."""
+        def pool(address):
+            return {"id": f"eth_{address}", "type": "pool", "attributes": {"address": address},
+                    "relationships": {"dex": {"data": {"id": "uniswap_v3", "type": "dex"}}}}
+
+        def handler(request: Request) -> Response:
+            path = request.url.path
+            if "/multi/" in path:
+                return httpx.Response(200, json={"data": [pool(a) for a in path.rsplit("/", 1)[-1].split(",")]})
+            if path.endswith("/trending_pools"):
+                return httpx.Response(200, json={"data": [pool("0xt")]})
+            if path.endswith("/trades"):
+                assert request.url.params["trade_volume_in_usd_greater_than"] == "100"
+                return httpx.Response(200, json={"data": [{"id": "eth_1_0xhash", "type": "trade",
+                                                           "attributes": {"block_number": 1, "tx_hash": "0xhash"}}]})
+            if "/tokens/" in path:
+                return httpx.Response(200, json={"data": {"id": "eth_0xtoken", "type": "token"}})
+            return httpx.Response(200, json={"data": pool(path.rsplit("/", 1)[-1])})
+
+        with GeckoTerminalSyncClient(transport=httpx.MockTransport(handler)) as parity_client:
+            assert parity_client.get_pool_by_network_address("eth", "0xa")["address"].tolist() == ["0xa"]
+            multiple = parity_client.get_multiple_pools_by_network("eth", ["0xa", "0xb"])
+            assert multiple["address"].tolist() == ["0xa", "0xb"]
+            assert multiple["network_id"].tolist() == ["eth", "eth"]
+            assert isinstance(multiple["dex_id"].dtype, pd.CategoricalDtype)
+            assert multiple["reserve_in_usd"].dtype == "float64"
+            assert parity_client.get_trending_pools()["address"].tolist() == ["0xt"]
+            assert parity_client.get_trending_pools_by_network("eth")["dex_id"].tolist() == ["uniswap_v3"]
+            assert parity_client.get_trades("eth", "0xa", trade_volume_filter=100)["tx_hash"].tolist() == ["0xhash"]
+            assert parity_client.get_specific_token_on_network("eth", "0xtoken")["id"] == "eth_0xtoken"
+
+    def test_map_runs_calls_concurrently_in_input_order(self):
+        """Calls overlap on the thread pool, keep their order and a failing call does not stop the batch."""
+        lock = threading.Lock()
+        active, peak = [0], [0]
+
+        def handler(request: Request) -> Response:
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            address = request.url.path.rsplit("/", 1)[-1]
+            if address == "0xbad":
+                return httpx.Response(404, json={"error": "not found"})
+            return httpx.Response(200, json={"data": {"id": f"eth_{address}", "type": "pool",
+                                                      "attributes": {"address": address}}})
+
+        rate_limiter = RateLimiter(rate=100, period=1.0)
+        addresses = [f"0x{i}" for i in range(10)] + ["0xbad"]
+        with GeckoTerminalSyncClient(transport=httpx.MockTransport(handler),
+                                     rate_limiter=rate_limiter) as batch_client:
+            batch = batch_client.map("get_pool_by_network_address", [("eth", address) for address in addresses],
+                                     max_workers=4)
+        assert [pool["address"].iloc[0] for pool in batch.results[:-1]] == addresses[:-1]
+        assert batch.results[-1] is None
+        assert isinstance(batch.errors[10], httpx.HTTPStatusError)
+        assert not batch.ok
+        assert 1 < peak[0] <= 4
+        assert rate_limiter.stats()["acquired"] == len(addresses)
+        with pytest.raises(httpx.HTTPStatusError):
+            batch.raise_first()
+
+    def test_batch_collects_calls_that_cannot_be_resolved(self, client):
+        """An unknown method or a malformed call fails alone instead of aborting the batch."""
+        batch = client.batch([("get_networks", ()), ("get_netwrks", ()), ("get_networks",), ("get_networks", ())])
+        assert [result is not None for result in batch.results] == [True, False, False, True]
+        assert isinstance(batch.errors[1], AttributeError)
+        assert isinstance(batch.errors[2], ValueError)
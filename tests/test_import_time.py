@@ -0,0 +1,87 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import geckoterminal_py
+
+PACKAGE_ROOT = Path(geckoterminal_py.__file__).resolve().parents[1]
+HEAVY_MODULES = ("httpx", "pandas", "numpy", "glom", "pyarrow", "asyncio")
+
+# Budgets in milliseconds for the best of a few cold interpreters. The loaded-module checks catch a heavy
+# dependency imported eagerly; the budgets are generous and catch the slower creep of everything else.
+IMPORT_BUDGETS_MS = {
+    "import geckoterminal_py.constants": 25,
+    "from geckoterminal_py import GeckoTerminalSyncClient": 150,
+}
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+loaded = [name for name in {modules!r} if name in sys.modules]
+print(json.dumps({{"ms": elapsed * 1000, "loaded": loaded}}))
+"""
+
+CONCURRENT_CONSTRUCTION = """
+import threading
+from geckoterminal_py import GeckoTerminalAsyncClient, GeckoTerminalSyncClient
+errors = []
+barrier = threading.Barrier(8)
+
+def build(client_class):
+    barrier.wait()
+    try:
+        client_class()
+    except Exception as error:
+        errors.append(repr(error))
+
+threads = [threading.Thread(target=build, args=(client_class,))
+           for client_class in [GeckoTerminalSyncClient, GeckoTerminalAsyncClient] * 4]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+print(errors)
+"""
+
+
+def probe_import(statement: str) -> dict:
+    """Run ``statement`` in a fresh interpreter and report its import time and the heavy modules it executed."""
+    output = subprocess.run([sys.executable, "-c", PROBE.format(statement=statement, modules=HEAVY_MODULES)],
+                            capture_output=True, text=True, check=True, cwd=PACKAGE_ROOT).stdout
+    return json.loads(output)
+
+
+class TestLazyPackage:
+    """Test suite for the lazily loaded package namespace and its import time."""
+
+    @pytest.mark.parametrize("statement", ["import geckoterminal_py", "import geckoterminal_py.constants"])
+    def test_package_import_loads_no_heavy_dependency(self, statement):
+        assert probe_import(statement)["loaded"] == []
+
+    def test_client_import_defers_http_and_dataframes(self):
+        assert probe_import("from geckoterminal_py import GeckoTerminalSyncClient")["loaded"] == []
+
+    @pytest.mark.parametrize("statement", list(IMPORT_BUDGETS_MS))
+    def test_import_time_budget(self, statement):
+        best = min(probe_import(statement)["ms"] for _ in range(3))
+        assert best < IMPORT_BUDGETS_MS[statement], f"{statement} took {best:.1f} ms"
+
+    def test_concurrent_cold_construction(self):
+        """Clients built from several threads at once in a fresh interpreter all see a fully imported httpx."""
+        for _ in range(3):
+            output = subprocess.run([sys.executable, "-c", CONCURRENT_CONSTRUCTION], capture_output=True, text=True,
+                                    check=True, cwd=PACKAGE_ROOT).stdout
+            assert output.strip() == "[]"
+
+    def test_public_names_resolve(self):
+        assert sorted(geckoterminal_py.__all__) == sorted(geckoterminal_py._LAZY_ATTRIBUTES)
+        for name in geckoterminal_py.__all__:
+            assert getattr(geckoterminal_py, name).__name__ == name
+        assert set(geckoterminal_py.__all__) <= set(dir(geckoterminal_py))
+        with pytest.raises(AttributeError):
+            geckoterminal_py.NotAClient
@@ -0,0 +1,126 @@
+import asyncio
+from contextlib import contextmanager
+
+import httpx
+import pytest
+from httpx import Request, Response
+
+from geckoterminal_py import (ClientMetrics, GeckoTerminalAsyncClient, GeckoTerminalSyncClient, ResponseCache,
+                              RetryPolicy)
+from geckoterminal_py.metrics import LatencyHistogram, endpoint_template
+from tests.utils import get_response_from_file
+
+
+class FakeSpan:
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes)
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+
+class FakeTracer:
+    """Minimal stand-in for an OpenTelemetry tracer."""
+
+    def __init__(self):
+        self.spans = []
+
+    @contextmanager
+    def start_as_current_span(self, name, attributes=None):
+        span = FakeSpan(name, attributes or {})
+        self.spans.append(span)
+        yield span
+
+
+def throttled_once_handler():
+    responses = [httpx.Response(429, headers={"Retry-After": "0"})]
+
+    def handler(request: Request) -> Response:
+        if responses:
+            return responses.pop()
+        return httpx.Response(200, json=get_response_from_file("get_networks"))
+    return handler
+
+
+class TestEndpointTemplate:
+    """Test suite for mapping request paths to endpoint names."""
+
+    def test_paths_map_to_templates(self):
+        assert endpoint_template("networks/eth/pools") == "networks/{}/pools"
+        assert endpoint_template("networks/new_pools") == "networks/new_pools"
+        assert endpoint_template("networks/eth/pools/0xa/ohlcv/hour") == "networks/{}/pools/{}/ohlcv/{}"
+        assert endpoint_template("unknown/path/here") == "unknown/path/here"
+
+
+class TestLatencyHistogram:
+    def test_quantiles_use_bucket_bounds(self):
+        histogram = LatencyHistogram(buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.05, 0.5, 3.0):
+            histogram.observe(seconds)
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.quantile(0.5) == 0.1
+        assert histogram.quantile(1.0) == 3.0
+
+
+class TestClientMetrics:
+    """Test suite for the metrics and tracing hooks of the clients."""
+
+    def test_sync_client_records_requests_retries_and_phases(self):
+        metrics = ClientMetrics()
+        tracer = FakeTracer()
+        with GeckoTerminalSyncClient(transport=httpx.MockTransport(throttled_once_handler()), metrics=metrics,
+                                     tracer=tracer, retry_policy=RetryPolicy(backoff_base=0)) as client:
+            client.get_networks()
+        stats = metrics.snapshot()["networks"]
+        assert stats["calls"] == 1
+        assert stats["requests"] == 2
+        assert stats["retries"] == 1
+        assert stats["status_codes"] == {429: 1, 200: 1}
+        assert stats["response_bytes"] > 0
+        assert stats["network"]["count"] == stats["decode"]["count"] == stats["parse"]["count"] == 1
+        span = tracer.spans[0]
+        assert span.name == "GeckoTerminal GET networks"
+        assert span.attributes["http.response.status_code"] == 200
+        assert span.attributes["geckoterminal.retries"] == 1
+
+    def test_errors_and_cache_hits_are_counted(self):
+        metrics = ClientMetrics()
+
+        def handler(request: Request) -> Response:
+            if request.url.path.endswith("/dexes"):
+                return httpx.Response(404, json={"error": "not found"})
+            return httpx.Response(200, json=get_response_from_file("get_networks"))
+
+        with GeckoTerminalSyncClient(transport=httpx.MockTransport(handler), metrics=metrics,
+                                     cache=ResponseCache()) as client:
+            client.get_networks()
+            client.get_networks()
+            with pytest.raises(httpx.HTTPStatusError):
+                client.get_dexes_by_network("eth")
+        snapshot = metrics.snapshot()
+        assert snapshot["networks"]["calls"] == 2
+        assert snapshot["networks"]["requests"] == 1
+        assert snapshot["networks"]["cache_hits"] == 1
+        assert snapshot["networks/{}/dexes"]["errors"] == 1
+        assert snapshot["networks/{}/dexes"]["status_codes"] == {404: 1}
+
+    @pytest.mark.asyncio
+    async def test_async_client_counts_coalesced_calls(self):
+        metrics = ClientMetrics()
+
+        async def handler(request: Request) -> Response:
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=get_response_from_file("get_networks"))
+
+        client = GeckoTerminalAsyncClient(transport=httpx.MockTransport(handler), metrics=metrics)
+        await asyncio.gather(*(client.get_networks() for _ in range(3)))
+        await client.close()
+        stats = metrics.snapshot()["networks"]
+        assert stats["calls"] == 3
+        assert stats["requests"] == 1
+        assert stats["coalesced"] == 2
+        assert stats["decode"]["count"] == 3
+
+    def test_uninstrumented_client_has_no_instrumentation(self):
+        assert GeckoTerminalSyncClient().instrumentation is None
@@ -0,0 +1,49 @@
+import pytest
+
+from benchmarks.common import Measurement, compare, save
+from benchmarks.mock_server import MockGeckoTerminalServer, SyntheticApi, pool_addresses
+from geckoterminal_py import GeckoTerminalAsyncClient, GeckoTerminalSyncClient
+from geckoterminal_py.rate_limiter import RetryPolicy
+
+
+class TestMockServer:
+    """Test suite for the benchmark mock server and its synthetic responses."""
+
+    def test_clients_parse_http_responses(self):
+        api = SyntheticApi(page_size=7, ohlcv_rows=50)
+        with MockGeckoTerminalServer(api) as server, GeckoTerminalSyncClient() as client:
+            client.base_url = server.base_url
+            assert len(client.get_top_pools_by_network("eth")) == 7
+            assert len(client.get_multiple_pools_by_network("eth", pool_addresses(3))) == 3
+            assert len(client.get_simple_token_price("eth", pool_addresses(4))) == 4
+            ohlcv = client.get_ohlcv("eth", "0x1", "1h", before_timestamp=1_700_000_000)
+            assert len(ohlcv) == 50
+            assert ohlcv["timestamp"].iloc[-1] < 1_700_000_000
+            assert ohlcv["timestamp"].diff().iloc[1:].eq(3600).all()
+        assert api.requests == 4
+
+    @pytest.mark.asyncio
+    async def test_throttled_requests_are_retried(self):
+        api = SyntheticApi(page_size=5, throttle_rate=0.5, seed=1)
+        async with GeckoTerminalAsyncClient(transport=api.async_transport(),
+                                            retry_policy=RetryPolicy(max_retries=20, backoff_base=0)) as client:
+            for page in range(1, 6):
+                assert len(await client.get_top_pools_by_network("eth", page=page)) == 5
+        assert api.throttled > 0
+        assert api.requests == 5 + api.throttled
+
+    def test_pages_hold_distinct_pools(self):
+        with GeckoTerminalSyncClient(transport=SyntheticApi(page_size=10).transport()) as client:
+            first = client.get_top_pools_by_network("eth", page=1)
+            second = client.get_top_pools_by_network("eth", page=2)
+        assert not set(first["address"]) & set(second["address"])
+
+
+def test_compare_flags_slower_cases(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    save([Measurement("fast", [0.010, 0.012], 0.022), Measurement("steady", [0.010], 0.010)], str(baseline))
+    current = [Measurement("fast", [0.020], 0.020), Measurement("steady", [0.011], 0.011),
+               Measurement("new", [1.0], 1.0)]
+    regressions = compare(current, str(baseline), tolerance=0.25)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("fast:")
@@ -0,0 +1,81 @@
+import httpx
+import pytest
+
+from geckoterminal_py import GeckoTerminalSyncClient, OHLCVStore
+
+pytest.importorskip("pyarrow")
+
+HOUR = 3600
+START = 1_700_000_000 // 86400 * 86400
+
+
+class FakeOHLCVApi:
+    """Serve hourly candles before ``before_timestamp``, skipping hours listed in ``empty_hours``."""
+
+    def __init__(self, empty_hours=()):
+        self.empty_hours = set(empty_hours)
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        before_timestamp = int(request.url.params["before_timestamp"])
+        limit = int(request.url.params["limit"])
+        self.requests.append((before_timestamp, limit))
+        last = (before_timestamp - 1) // HOUR * HOUR
+        ohlcv_list = [[ts, 1.0, 2.0, 0.5, 1.5, 100.0] for ts in range(last, last - limit * HOUR, -HOUR)
+                      if ts not in self.empty_hours]
+        return httpx.Response(200, json={"data": {"attributes": {"ohlcv_list": ohlcv_list}}})
+
+
+@pytest.fixture
+def api():
+    return FakeOHLCVApi(empty_hours={START + 5 * HOUR})
+
+
+@pytest.fixture
+def client(api):
+    with GeckoTerminalSyncClient(transport=httpx.MockTransport(api)) as test_client:
+        yield test_client
+
+
+class TestOHLCVStore:
+    """Test suite for the day-partitioned OHLCVStore."""
+
+    def test_sync_stores_day_partitions(self, tmp_path, client):
+        store = OHLCVStore(tmp_path)
+        written = store.sync(client, "eth", "0xpool", "1h", START, START + 50 * HOUR)
+        assert written == 50
+        partitions = store.partitions("eth", "0xpool", "1h")
+        assert [path.name for path in partitions] == ["2023-11-14.arrow", "2023-11-15.arrow", "2023-11-16.arrow"]
+        candles = store.read("eth", "0xpool", "1h")
+        assert list(candles.columns) == ['timestamp', 'open', 'high', 'low', 'close', 'volume_usd', 'datetime']
+        assert candles["timestamp"].is_monotonic_increasing
+        assert store.last_timestamp("eth", "0xpool", "1h") == START + 50 * HOUR
+
+    def test_repeated_sync_only_fetches_new_ranges(self, tmp_path, api, client):
+        """Covered ranges, including hours without candles, are never requested again."""
+        store = OHLCVStore(tmp_path)
+        store.sync(client, "eth", "0xpool", "1h", START, START + 10 * HOUR)
+        api.requests.clear()
+        assert store.sync(client, "eth", "0xpool", "1h", START, START + 10 * HOUR) == 0
+        assert api.requests == []
+        store.sync(client, "eth", "0xpool", "1h", START, START + 20 * HOUR)
+        assert api.requests == [(START + 21 * HOUR, 10)]
+        assert store.covered_ranges("eth", "0xpool", "1h") == [(START, START + 20 * HOUR)]
+
+    def test_gaps_between_syncs_are_filled(self, tmp_path, api, client):
+        store = OHLCVStore(tmp_path)
+        store.sync(client, "eth", "0xpool", "1h", START, START + 10 * HOUR)
+        store.sync(client, "eth", "0xpool", "1h", START + 20 * HOUR, START + 30 * HOUR)
+        assert store.missing_ranges("eth", "0xpool", "1h", START, START + 30 * HOUR) == [
+            (START + 11 * HOUR, START + 19 * HOUR)]
+        api.requests.clear()
+        store.sync(client, "eth", "0xpool", "1h", START, START + 30 * HOUR)
+        assert api.requests == [(START + 20 * HOUR, 9)]
+        assert len(store.read("eth", "0xpool", "1h")) == 30
+
+    def test_read_window_is_trimmed(self, tmp_path, client):
+        store = OHLCVStore(tmp_path)
+        store.sync(client, "eth", "0xpool", "1h", START, START + 50 * HOUR)
+        candles = store.read("eth", "0xpool", "1h", start=START + 30 * HOUR, end=START + 40 * HOUR)
+        assert candles["timestamp"].tolist() == list(range(START + 30 * HOUR, START + 41 * HOUR, HOUR))
+        assert store.read("eth", "0xother", "1h").empty
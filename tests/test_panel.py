@@ -0,0 +1,34 @@
+import numpy as np
+
+from geckoterminal_py.panel import PANEL_FIELDS, build_ohlcv_panel
+
+
+def candles(timestamps, close=1.0):
+    return [[ts, close, close + 1, close - 1, close, 10.0] for ts in timestamps]
+
+
+class TestBuildOhlcvPanel:
+    """Test suite for aligning the OHLCV pages of many pools."""
+
+    def test_aligns_pools_on_one_grid(self):
+        pools = [("eth", "0xa"), ("eth", "0xb")]
+        pool_pages = [[candles([180, 120]), candles([60, 0])], [candles([120, 60], close=2.0)]]
+        panel = build_ohlcv_panel(pools, pool_pages, 60, 0, 180)
+        np.testing.assert_array_equal(panel.timestamps, [0, 60, 120, 180])
+        np.testing.assert_array_equal(panel.mask, [[True, False], [True, True], [True, True], [True, False]])
+        np.testing.assert_array_equal(panel["close"][:, 1], [0.0, 2.0, 2.0, 0.0])
+        assert set(panel.fields) == set(PANEL_FIELDS)
+        assert all(matrix.dtype == np.float64 for matrix in panel.fields.values())
+
+    def test_drops_candles_outside_the_window_or_off_the_grid(self):
+        panel = build_ohlcv_panel([("eth", "0xa")], [[candles([300, 130, 120, 60, -60])]], 60, 30, 200)
+        np.testing.assert_array_equal(panel.timestamps, [60, 120, 180])
+        np.testing.assert_array_equal(panel.mask[:, 0], [True, True, False])
+
+    def test_pool_without_candles(self):
+        panel = build_ohlcv_panel([("eth", "0xa"), ("eth", "0xb")], [[[]], [candles([0])]], 60, 0, 60)
+        assert not panel.mask[:, 0].any()
+        frame = panel.to_frame("open")
+        assert list(frame.columns) == ["eth_0xa", "eth_0xb"]
+        assert frame["eth_0xa"].isna().all()
+        assert frame["eth_0xb"].iloc[0] == 1.0
@@ -0,0 +1,61 @@
+import pandas as pd
+import pytest
+from glom import glom
+
+import geckoterminal_py.constants as CONSTANTS
+from geckoterminal_py.parsing import compile_spec, extract_columns, get_extractor
+from tests.utils import get_response_from_file
+
+TRADE_RESPONSE = {"data": [{
+    "id": f"eth_{block}_0xhash_{block}", "type": "trade",
+    "attributes": {
+        "block_number": block, "tx_hash": "0xhash", "tx_from_address": "0xfrom",
+        "from_token_amount": "1.5", "to_token_amount": "3000.1", "price_from_in_currency_token": "1.0",
+        "price_to_in_currency_token": "0.0005", "price_from_in_usd": "2000.1", "price_to_in_usd": "1.0",
+        "block_timestamp": "2024-01-01T00:00:00Z", "kind": "sell", "volume_in_usd": "3000.1",
+        "from_token_address": "0xweth", "to_token_address": "0xusdc",
+    },
+} for block in range(5)]}
+
+
+@pytest.mark.parametrize("file_name, spec", [
+    ("get_networks", CONSTANTS.NETWORK_SPEC),
+    ("get_dexes_by_network", CONSTANTS.DEXES_BY_NETWORK_SPEC),
+    ("get_top_pools_by_network", CONSTANTS.POOL_SPEC),
+    ("get_top_pools_by_network_dex", CONSTANTS.POOL_SPEC),
+    ("get_top_pools_by_network_token", CONSTANTS.POOL_SPEC),
+    ("get_new_pools_by_network", CONSTANTS.POOL_SPEC),
+    ("get_new_pools_all_networks", CONSTANTS.POOL_SPEC),
+])
+def test_extractor_matches_glom(file_name, spec):
+    """The compiled extractor builds exactly the frame the glom spec builds."""
+    response = get_response_from_file(file_name)
+    pd.testing.assert_frame_equal(pd.DataFrame(extract_columns(response, spec)), pd.DataFrame(glom(response, spec)))
+
+
+def test_trades_extractor_matches_glom():
+    pd.testing.assert_frame_equal(pd.DataFrame(extract_columns(TRADE_RESPONSE, CONSTANTS.TRADES_SPEC)),
+                                  pd.DataFrame(glom(TRADE_RESPONSE, CONSTANTS.TRADES_SPEC)))
+
+
+def test_missing_values_become_none():
+    """Missing attributes or relationships yield None instead of failing the whole page."""
+    columns = extract_columns({"data": [{"id": "eth_0x1", "type": "pool", "relationships": {"dex": {"data": None}}}]},
+                              CONSTANTS.POOL_SPEC)
+    assert columns["id"] == ["eth_0x1"]
+    assert columns["name"] == [None]
+    assert columns["dex_id"] == [None]
+
+
+def test_empty_page_keeps_columns():
+    columns = extract_columns({"data": []}, CONSTANTS.NETWORK_SPEC)
+    assert list(columns) == ['id', 'type', 'name', 'coingecko_asset_platform_id']
+
+
+def test_extractors_are_compiled_once():
+    assert get_extractor(CONSTANTS.POOL_SPEC) is get_extractor(CONSTANTS.POOL_SPEC)
+
+
+def test_unsupported_spec_is_rejected():
+    with pytest.raises(ValueError):
+        compile_spec(("data", [{"id": ("id", str)}]))
@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from geckoterminal_py import RateLimiter, RetryPolicy
+
+
+class TestRateLimiter:
+    """Test suite for the token bucket RateLimiter."""
+
+    def test_burst_within_capacity_does_not_wait(self):
+        """Requests up to the bucket capacity go through immediately."""
+        limiter = RateLimiter(rate=5, period=1.0)
+        for _ in range(5):
+            limiter.acquire()
+        assert limiter.total_wait_time == 0
+        assert limiter.stats()["acquired"] == 5
+
+    def test_exhausted_bucket_waits_for_refill(self):
+        """Once the bucket is empty callers wait for the sustained rate."""
+        limiter = RateLimiter(rate=20, period=1.0, capacity=1)
+        started = time.monotonic()
+        for _ in range(3):
+            limiter.acquire()
+        assert time.monotonic() - started >= 0.09
+        assert limiter.max_wait_time > 0
+        assert limiter.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_async_callers_share_bucket(self):
+        """Concurrent coroutines queue on the same bucket and report their depth while waiting."""
+        limiter = RateLimiter(rate=50, period=1.0, capacity=1)
+        tasks = [asyncio.ensure_future(limiter.acquire_async()) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 4
+        await asyncio.gather(*tasks)
+        assert limiter.queue_depth == 0
+        assert limiter.acquired == 5
+
+    def test_pause_holds_callers_back(self):
+        """A pause after a 429 delays the next acquisition even with tokens left."""
+        limiter = RateLimiter(rate=100, period=1.0)
+        limiter.pause(0.05)
+        started = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - started >= 0.04
+
+    def test_overlapping_pauses_wait_for_the_longest(self):
+        """Many requests throttled at once hold callers back for the longest pause, not for their sum."""
+        limiter = RateLimiter(rate=30, period=60.0)
+        for _ in range(10):
+            limiter.pause(0.1)
+        limiter.pause(0.05)
+        started = time.monotonic()
+        limiter.acquire()
+        limiter.acquire()
+        assert 0.08 <= time.monotonic() - started < 0.2
+
+
+class TestRetryPolicy:
+    """Test suite for the RetryPolicy backoff rules."""
+
+    def test_retry_after_takes_precedence(self):
+        """A numeric Retry-After header is used as the delay."""
+        policy = RetryPolicy()
+        response = httpx.Response(429, headers={"Retry-After": "7"})
+        assert policy.should_retry(response, 0)
+        assert policy.get_delay(response, 0) == 7
+
+    def test_exponential_backoff_is_capped(self):
+        """Without Retry-After the jittered delay never exceeds the cap."""
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=4.0)
+        response = httpx.Response(503)
+        assert all(0 <= policy.get_delay(response, attempt) <= 4.0 for attempt in range(10))
+
+    def test_client_errors_and_exhausted_attempts_are_not_retried(self):
+        """Only the configured statuses are retried, and only up to max_retries."""
+        policy = RetryPolicy(max_retries=2)
+        assert not policy.should_retry(httpx.Response(404), 0)
+        assert not policy.should_retry(httpx.Response(429), 2)
@@ -0,0 +1,86 @@
+import asyncio
+import time
+
+import httpx
+import pandas as pd
+import pytest
+
+from geckoterminal_py import GeckoTerminalAsyncClient, GeckoTerminalSyncClient
+from geckoterminal_py.replay import (RecordedExchange, RecordingTransport, ReplayArchive, ReplayTransport,
+                                     replay_requests)
+from tests.utils import get_response_from_file
+
+NETWORKS_PATH = "/api/v2/networks"
+
+
+def live_handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == NETWORKS_PATH:
+        return httpx.Response(200, json=get_response_from_file("get_networks"))
+    if request.url.path == "/api/v2/networks/eth/pools":
+        return httpx.Response(200, json=get_response_from_file("get_top_pools_by_network"))
+    return httpx.Response(404, json={"errors": [{"status": "404"}]})
+
+
+def exchange(offset: float, latency: float, page: int, status: int = 200) -> RecordedExchange:
+    return RecordedExchange("GET", NETWORKS_PATH, [("page", str(page))], status, {"content-type": "application/json"},
+                            latency, offset, b'{"data": [{"id": "eth", "type": "network", "attributes": {}}]}')
+
+
+class TestRecordReplay:
+    """Test suite for the record and replay transports."""
+
+    def test_recorded_archive_replays_offline(self, tmp_path):
+        recorder = RecordingTransport(httpx.MockTransport(live_handler))
+        with GeckoTerminalSyncClient(transport=recorder) as client:
+            networks = client.get_networks()
+            pools = client.get_top_pools_by_network("eth")
+        recorder.archive.save(tmp_path / "session.jsonl.gz")
+        archive = ReplayArchive.load(tmp_path / "session.jsonl.gz")
+        assert [(exchange.path, exchange.status) for exchange in archive.exchanges] == [
+            (NETWORKS_PATH, 200), ("/api/v2/networks/eth/pools", 200)]
+        assert (tmp_path / "session.jsonl.gz").stat().st_size < sum(len(e.body) for e in archive.exchanges) / 4
+
+        async def replay():
+            async with GeckoTerminalAsyncClient(transport=ReplayTransport(archive, speed=0)) as replay_client:
+                return await replay_client.get_networks(), await replay_client.get_top_pools_by_network("eth")
+
+        replayed_networks, replayed_pools = asyncio.run(replay())
+        pd.testing.assert_frame_equal(replayed_networks, networks)
+        pd.testing.assert_frame_equal(replayed_pools, pools)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_replay_at_scaled_speed(self):
+        archive = ReplayArchive([exchange(0.0, 0.4, page) for page in range(10)])
+        transport = ReplayTransport(archive, speed=4)
+        async with GeckoTerminalAsyncClient(transport=transport) as client:
+            started = time.perf_counter()
+            await asyncio.gather(*(client.get_networks(page=page) for page in range(10)))
+            elapsed = time.perf_counter() - started
+        assert 0.1 <= elapsed < 0.4
+        assert transport.requests == 10
+
+    def test_repeated_requests_cycle_through_recordings(self):
+        archive = ReplayArchive([exchange(0.0, 0.0, 1, status=429), exchange(1.0, 0.0, 1)])
+        transport = ReplayTransport(archive, speed=0)
+        with httpx.Client(transport=transport) as client:
+            statuses = [client.get(f"https://api.geckoterminal.com{NETWORKS_PATH}?page=1").status_code
+                        for _ in range(3)]
+        assert statuses == [429, 200, 429]
+
+    def test_missing_requests(self):
+        archive = ReplayArchive([exchange(0.0, 0.0, 1)])
+        with httpx.Client(transport=ReplayTransport(archive)) as client:
+            with pytest.raises(LookupError):
+                client.get(f"https://api.geckoterminal.com{NETWORKS_PATH}?page=2")
+        lenient = ReplayTransport(archive, strict=False)
+        with httpx.Client(transport=lenient) as client:
+            assert client.get(f"https://api.geckoterminal.com{NETWORKS_PATH}").status_code == 404
+        assert lenient.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_replay_requests_follows_the_recorded_schedule(self):
+        archive = ReplayArchive([exchange(0.1 * page, 0.0, page) for page in range(5)])
+        async with GeckoTerminalAsyncClient(transport=ReplayTransport(archive, speed=0)) as client:
+            started = time.perf_counter()
+            assert await replay_requests(client, archive, speed=2) == 5
+            assert time.perf_counter() - started >= 0.2
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from geckoterminal_py.resampling import OHLCVResampler, resample_ohlcv, timeframe_to_seconds
+
+
+def make_candles(timestamps):
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    index = np.arange(len(timestamps), dtype=np.float64)
+    return pd.DataFrame({"timestamp": timestamps, "open": 10 + index, "high": 20 + index, "low": 5 - index,
+                         "close": 11 + index, "volume_usd": np.ones(len(timestamps))})
+
+
+class TestTimeframeToSeconds:
+    """Test suite for parsing arbitrary timeframes."""
+
+    def test_non_standard_timeframes(self):
+        assert timeframe_to_seconds("2h") == 7200
+        assert timeframe_to_seconds("3d") == 3 * 86400
+        assert timeframe_to_seconds("1w") == 7 * 86400
+
+    def test_invalid_timeframe(self):
+        with pytest.raises(ValueError):
+            timeframe_to_seconds("0h")
+        with pytest.raises(ValueError):
+            timeframe_to_seconds("2y")
+
+
+class TestResampleOHLCV:
+    """Test suite for the vectorized OHLCV aggregation."""
+
+    def test_aggregates_buckets_and_skips_gaps(self):
+        # Two hourly candles in the first 2h bucket, none in the second, one in the third.
+        candles = make_candles([0, 3600, 4 * 3600])
+        resampled = resample_ohlcv(candles.iloc[::-1], "2h")
+        assert resampled["timestamp"].tolist() == [0, 4 * 3600]
+        first = resampled.iloc[0]
+        assert (first["open"], first["high"], first["low"], first["close"], first["volume_usd"]) == \
+            (10, 21, 4, 12, 2)
+        assert list(resampled.columns) == ["timestamp", "open", "high", "low", "close", "volume_usd", "datetime"]
+
+    def test_fill_gaps_carries_previous_close(self):
+        resampled = resample_ohlcv(make_candles([0, 3600, 4 * 3600]), "2h", fill_gaps=True)
+        assert resampled["timestamp"].tolist() == [0, 7200, 4 * 3600]
+        gap = resampled.iloc[1]
+        assert (gap["open"], gap["high"], gap["low"], gap["close"], gap["volume_usd"]) == (12, 12, 12, 12, 0)
+
+    def test_origin_shifts_bucket_boundaries(self):
+        resampled = resample_ohlcv(make_candles([0, 3600, 7200]), "2h", origin=3600)
+        assert resampled["timestamp"].tolist() == [-3600, 3600]
+
+
+class TestOHLCVResampler:
+    """Test suite for the incremental resampler."""
+
+    def test_incremental_updates_match_full_resample(self):
+        candles = make_candles(np.arange(0, 10 * 3600, 900))
+        resampler = OHLCVResampler("3h")
+        for start in range(0, len(candles), 7):
+            changed = resampler.update(candles.iloc[start:start + 7])
+        assert changed["timestamp"].iloc[-1] == 9 * 3600
+        pd.testing.assert_frame_equal(resampler.candles, resample_ohlcv(candles, "3h"))
+
+    def test_update_only_returns_touched_buckets(self):
+        resampler = OHLCVResampler("2h")
+        resampler.update(make_candles([0, 3600, 7200]))
+        changed = resampler.update(make_candles([7200 + 3600]))
+        assert changed["timestamp"].tolist() == [7200]
+        # Candles of an already completed bucket are ignored.
+        assert resampler.update(make_candles([3600])).empty
+        assert resampler.candles["timestamp"].tolist() == [0, 7200]
+
+    def test_fill_gaps_across_updates(self):
+        resampler = OHLCVResampler("1h", fill_gaps=True)
+        resampler.update(make_candles([0, 3600]))
+        changed = resampler.update(make_candles([4 * 3600]))
+        assert changed["timestamp"].tolist() == [3600, 7200, 3 * 3600, 4 * 3600]
+        assert changed["volume_usd"].tolist() == [1, 0, 0, 1]
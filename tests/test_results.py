@@ -0,0 +1,101 @@
+import os
+import subprocess
+import sys
+
+import httpx
+import numpy as np
+import pytest
+
+from geckoterminal_py import GeckoTerminalSyncClient
+from tests.utils import get_response_from_file
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TOKEN_ADDRESSES = ["0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2", "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48"]
+
+
+def fixture_handler(request: httpx.Request) -> httpx.Response:
+    path = request.url.path.removeprefix("/api/v2/")
+    if path.startswith("simple/"):
+        return httpx.Response(200, json=get_response_from_file("get_simple_token_price"))
+    if "/ohlcv/" in path:
+        return httpx.Response(200, json=get_response_from_file("get_ohlcv"))
+    return httpx.Response(200, json=get_response_from_file("get_top_pools_by_network"))
+
+
+@pytest.fixture
+def client():
+    with GeckoTerminalSyncClient(transport=httpx.MockTransport(fixture_handler), result_format="records") as test_client:
+        yield test_client
+
+
+class TestResultFormats:
+    """Test suite for the non-pandas result formats."""
+
+    def test_records(self, client):
+        prices = client.get_simple_token_price("eth", TOKEN_ADDRESSES)
+        assert [price.token_address for price in prices] == TOKEN_ADDRESSES
+        assert prices[0].price_usd == "2958.19885153499"
+        assert not hasattr(prices[0], "__dict__")
+
+    def test_numpy_pools_are_typed(self, client):
+        pools = client.get_top_pools_by_network("eth", result_format="numpy")
+        assert isinstance(pools, np.ndarray)
+        assert pools["reserve_in_usd"].dtype == np.float64
+        assert set(pools["network_id"]) == {"eth"}
+        assert not any("_" in token_id for token_id in pools["base_token_id"])
+
+    def test_numpy_ohlcv_matches_pandas(self, client):
+        candles = client.get_ohlcv("eth", "0xpool", "1h", result_format="numpy")
+        frame = client.get_ohlcv("eth", "0xpool", "1h", result_format="pandas")
+        assert list(candles.dtype.names) == list(frame.columns)
+        np.testing.assert_array_equal(candles["timestamp"], frame["timestamp"].to_numpy())
+        np.testing.assert_array_equal(candles["close"], frame["close"].to_numpy())
+
+    def test_arrow(self, client):
+        pa = pytest.importorskip("pyarrow")
+        pools = client.get_top_pools_by_network("eth", result_format="arrow")
+        assert isinstance(pools, pa.Table)
+        assert pools.schema.field("fdv_usd").type == pa.float64()
+
+    def test_unknown_format_is_rejected(self, client):
+        with pytest.raises(ValueError):
+            client.get_networks(result_format="polars")
+
+    def test_pandas_is_not_imported_until_needed(self):
+        """Importing the package and reading records never loads pandas."""
+        script = (
+            "import sys, httpx\n"
+            "from geckoterminal_py import GeckoTerminalSyncClient\n"
+            "body = {'data': {'attributes': {'token_prices': {'0x1': '1.5'}}}}\n"
+            "client = GeckoTerminalSyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(200, json=body)),\n"
+            "                                 result_format='records')\n"
+            "assert client.get_simple_token_price('eth', ['0x1'])[0].price_usd == '1.5'\n"
+            "print('pandas' not in sys.modules)\n"
+        )
+        output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                                cwd=REPO_ROOT)
+        assert output.stdout.strip() == "True"
+
+    def test_first_pandas_use_from_thread_pools(self):
+        """pandas first touched by many worker threads at once in a fresh interpreter loads once for all."""
+        script = (
+            "import httpx\n"
+            "from geckoterminal_py import GeckoTerminalSyncClient\n"
+            "def handler(request):\n"
+            "    if request.url.path.startswith('/api/v2/simple/'):\n"
+            "        addresses = request.url.path.rsplit('/', 1)[-1].split(',')\n"
+            "        prices = {address: '1.5' for address in addresses}\n"
+            "        return httpx.Response(200, json={'data': {'attributes': {'token_prices': prices}}})\n"
+            "    return httpx.Response(200, json={'data': [{'id': 'eth', 'type': 'network',\n"
+            "                                               'attributes': {'name': 'Ethereum'}}]})\n"
+            "client = GeckoTerminalSyncClient(transport=httpx.MockTransport(handler))\n"
+            "batch = client.batch([('get_networks', ())] * 16, max_workers=16)\n"
+            "batch.raise_first()\n"
+            "addresses = [f'0x{index:040x}' for index in range(200)]\n"
+            "prices = client.get_simple_token_price_bulk('eth', addresses, max_workers=8)\n"
+            "print(len(batch.results), len(prices))\n"
+        )
+        for _ in range(3):
+            output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                                    cwd=REPO_ROOT)
+            assert output.stdout.split() == ["16", "200"]
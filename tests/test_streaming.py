@@ -0,0 +1,25 @@
+from geckoterminal_py.streaming import AdaptiveInterval, SeenIds
+
+
+class TestSeenIds:
+    """Test suite for the bounded SeenIds set."""
+
+    def test_oldest_ids_are_forgotten(self):
+        seen_ids = SeenIds(max_size=3)
+        seen_ids.add_many(["a", "b", "c", "d"])
+        assert "a" not in seen_ids
+        assert all(trade_id in seen_ids for trade_id in ["b", "c", "d"])
+        assert len(seen_ids) == 3
+
+
+class TestAdaptiveInterval:
+    """Test suite for the AdaptiveInterval poll scheduler."""
+
+    def test_interval_follows_activity_within_bounds(self):
+        interval = AdaptiveInterval(10, min_interval=4, max_interval=20)
+        assert interval.update(new_items=0, page_size=100) == 15
+        assert interval.update(new_items=0, page_size=100) == 20
+        assert interval.update(new_items=50, page_size=100) == 20
+        assert interval.update(new_items=100, page_size=100) == 10
+        assert interval.update(new_items=100, page_size=100) == 5
+        assert interval.update(new_items=100, page_size=100) == 4
@@ -0,0 +1,98 @@
+import asyncio
+
+import httpx
+import pandas as pd
+import pytest
+
+from geckoterminal_py import GeckoTerminalAsyncClient, TokenPoolIndex
+
+WETH = "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2"
+USDC = "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48"
+
+
+def pool_record(network_id: str, address: str, base: str, quote: str, reserve: str, dex_id: str = "uniswap_v3"):
+    return {"id": f"{network_id}_{address}", "type": "pool",
+            "attributes": {"address": address, "reserve_in_usd": reserve},
+            "relationships": {"dex": {"data": {"id": dex_id, "type": "dex"}},
+                              "base_token": {"data": {"id": f"{network_id}_{base}", "type": "token"}},
+                              "quote_token": {"data": {"id": f"{network_id}_{quote}", "type": "token"}}}}
+
+
+class FakePoolsApi:
+    """Serve top pools by network and by token from in-memory records and record every request path."""
+
+    def __init__(self):
+        self.records = {"eth": [pool_record("eth", "0xpool1", WETH, USDC, "5000000"),
+                                pool_record("eth", "0xpool2", "0xpepe", WETH, "250000", "sushiswap"),
+                                pool_record("eth", "0xpool3", WETH, USDC, "90000000")]}
+        self.requests = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/api/v2/")
+        self.requests.append(path)
+        parts = path.split("/")
+        records = self.records.get(parts[1], [])
+        if len(parts) == 5:
+            token_id = f"{parts[1]}_{parts[3]}"
+            records = [record for record in records
+                       if token_id in (record["relationships"]["base_token"]["data"]["id"],
+                                       record["relationships"]["quote_token"]["data"]["id"])]
+        return httpx.Response(200, json={"data": records})
+
+
+@pytest.fixture
+def api():
+    return FakePoolsApi()
+
+
+@pytest.fixture
+def index(api):
+    client = GeckoTerminalAsyncClient(transport=httpx.MockTransport(api))
+    yield TokenPoolIndex(client, ttl=60)
+    asyncio.run(client.close())
+
+
+class TestTokenPoolIndex:
+    """Test suite for the token to pools index."""
+
+    @pytest.mark.asyncio
+    async def test_pools_are_indexed_under_both_tokens(self, index):
+        index.track_network("eth")
+        assert await index.refresh_once() == 1
+        assert [pool.pool_address for pool in index.pools("eth", WETH)] == ["0xpool3", "0xpool1", "0xpool2"]
+        assert index.best_pool("eth", USDC.upper()).pool_address == "0xpool3"
+        pepe_pool = index.best_pool("eth", "0xpepe")
+        assert (pepe_pool.side, pepe_pool.paired_token, pepe_pool.dex_id) == ("base", WETH, "sushiswap")
+        assert index.pools("eth", WETH, limit=1)[0].reserve_in_usd == 90_000_000
+        assert ("eth", USDC) in index and ("bsc", USDC) not in index
+
+    @pytest.mark.asyncio
+    async def test_resolve_fetches_each_token_once(self, api, index):
+        assert [pool.pool_address for pool in await index.resolve("eth", USDC)] == ["0xpool3", "0xpool1"]
+        await index.resolve("eth", USDC)
+        await index.resolve("eth", WETH)
+        assert api.requests == [f"networks/eth/tokens/{USDC}/pools"]
+        assert await index.refresh_once() == 0
+
+    @pytest.mark.asyncio
+    async def test_expired_sources_are_refreshed_and_stale_pools_dropped(self, api, index):
+        index.track_network("eth")
+        await index.refresh_once()
+        api.records["eth"] = api.records["eth"][:1]
+        index.ttl = 0
+        index.max_age = 0.05
+        await asyncio.sleep(0.1)
+        assert await index.refresh_once() == 1
+        assert [pool.pool_address for pool in index.pools("eth", WETH)] == ["0xpool1"]
+        assert index.pools("eth", "0xpepe") == []
+        assert len(index) == 2
+
+    def test_unsplit_token_ids_are_indexed_by_address(self):
+        index = TokenPoolIndex()
+        frame = pd.DataFrame({"network_id": ["polygon_pos"], "address": ["0xaaa"], "dex_id": ["quickswap"],
+                              "reserve_in_usd": [1000.0], "base_token_id": ["polygon_pos_0xbbb"],
+                              "quote_token_id": ["polygon_pos_0xccc"]})
+        assert index.add_pools(frame) == 1
+        pool = index.best_pool("polygon_pos", "0xbbb")
+        assert (pool.pool_address, pool.paired_token) == ("0xaaa", "0xccc")
+        assert index.pools("polygon_pos", "0xccc")[0].side == "quote"
@@ -0,0 +1,98 @@
+import asyncio
+
+import httpx
+import pytest
+
+from geckoterminal_py import GeckoTerminalAsyncClient, PoolWatcher
+
+
+def pool_record(network_id: str, address: str, price: str) -> dict:
+    return {"id": f"{network_id}_{address}", "type": "pool",
+            "attributes": {"address": address, "name": "WETH / USDC", "base_token_price_usd": price},
+            "relationships": {"dex": {"data": {"id": "uniswap_v3", "type": "dex"}}}}
+
+
+class FakeMultiPoolsApi:
+    """Serve the multiple pools endpoint from in-memory prices and record every request."""
+
+    def __init__(self):
+        self.prices = {}
+        self.requests = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        _, network_id, _, _, addresses = request.url.path.removeprefix("/api/v2/").split("/")
+        addresses = addresses.split(",")
+        self.requests.append((network_id, addresses))
+        data = [pool_record(network_id, address, self.prices.get(address, "1.0")) for address in addresses]
+        return httpx.Response(200, json={"data": data})
+
+
+@pytest.fixture
+def api():
+    return FakeMultiPoolsApi()
+
+
+@pytest.fixture
+def watcher(api):
+    client = GeckoTerminalAsyncClient(transport=httpx.MockTransport(api))
+    yield PoolWatcher(client, requests_per_minute=60_000, min_refresh_interval=0)
+    asyncio.run(client.close())
+
+
+class TestPoolWatcher:
+    """Test suite for the batched PoolWatcher."""
+
+    @pytest.mark.asyncio
+    async def test_pools_are_batched_per_network(self, api, watcher):
+        """A first pass over 70 eth pools and 5 bsc pools takes four batched requests."""
+        watcher.min_refresh_interval = 60
+        for i in range(70):
+            watcher.watch("eth", f"0x{i:040x}")
+        for i in range(5):
+            watcher.watch("bsc", f"0x{i:040x}")
+        changed = [await watcher.refresh_once() for _ in range(5)]
+        assert sorted(len(addresses) for _, addresses in api.requests) == [5, 10, 30, 30]
+        assert sum(len(rows) for rows in changed[:4]) == 75
+        assert changed[4] is None
+        assert all(len(addresses) <= 30 for _, addresses in api.requests)
+
+    @pytest.mark.asyncio
+    async def test_only_changed_rows_are_delivered(self, api, watcher):
+        """Unchanged pools are not emitted again, changed ones go to the callback and the queue."""
+        delivered = []
+        watcher.callback = delivered.append
+        watcher.queue = asyncio.Queue()
+        addresses = [f"0x{i:040x}" for i in range(3)]
+        for address in addresses:
+            watcher.watch("eth", address)
+        await watcher.refresh_once()
+        api.prices[addresses[1]] = "2.0"
+        changed = await watcher.refresh_once()
+        assert list(changed["address"]) == [addresses[1]]
+        assert list(changed["network_id"]) == ["eth"]
+        assert [len(rows) for rows in delivered] == [3, 1]
+        assert watcher.queue.qsize() == 2
+
+    @pytest.mark.asyncio
+    async def test_high_priority_pools_are_refreshed_first(self, api, watcher):
+        """Once everything has been seen, the most overdue weighted pools win the next batch."""
+        watcher.batch_size = 2
+        for i in range(4):
+            watcher.watch("eth", f"0x{i:040x}", priority=10.0 if i == 3 else 1.0)
+        await watcher.refresh_once()
+        await watcher.refresh_once()
+        api.requests.clear()
+        await watcher.refresh_once()
+        assert f"0x{3:040x}" in api.requests[0][1]
+
+    @pytest.mark.asyncio
+    async def test_run_until_stopped(self, api, watcher):
+        """The run loop keeps refreshing until stop is called."""
+        watcher.watch("eth", f"0x{0:040x}")
+        watcher.callback = lambda rows: watcher.stop()
+        await asyncio.wait_for(watcher.run(), timeout=1)
+        assert watcher.requests == 1
+
+    def test_batch_size_is_capped_by_endpoint_limit(self):
+        with pytest.raises(ValueError):
+            PoolWatcher(GeckoTerminalAsyncClient(), batch_size=31)